@@ -3,7 +3,7 @@ import platform
 import sys
 import ctypes
 from PySide6.QtWidgets import QApplication, QWidget, QMainWindow, QPushButton, QVBoxLayout
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QColor, QPalette
 from pathlib import Path
 
@@ -19,7 +19,8 @@ from  app.core.window_manager.popup_manager import PopupManager
 from  app.core.subapp_manager.subapp_manager import SubAppManager
 from  app.core.lab_and_session_manager.lab_manager import LabManager
 from  app.core.lab_and_session_manager.session_manager import SessionManager
-from  app.core.lab_and_session_manager.registor_external_app import cleanup
+from  core.lab_and_session_manager.registor_external_app import cleanup
+from  core.lab_and_session_manager.worker_pool import get_worker_pool
 
 class App(QMainWindow):
     def __init__(self, profile_path: Path):
@@ -37,11 +38,17 @@ class App(QMainWindow):
         self.popup_manager = PopupManager(self)
 
         self.lab_manager = LabManager(self.profile_path)
+        self.lab_manager.restore_workspace()
         # self.session_manager = SessionManager()
 
 
         self.showMaximized()
 
+    def start_background_services(self):
+        """Deferred startup work, run once the window has been painted."""
+        # Settings / Marketplace pages are built on first navigation only
+        QTimer.singleShot(0, get_worker_pool().start)
+
 # if __name__ == "__main__":
 #     app = QApplication(sys.argv)
 #     win = App()
@@ -72,4 +79,5 @@ if __name__ == "__main__":
     # 4️⃣ Start app
     window = App(profile_path)
     window.show()
+    QTimer.singleShot(0, window.start_background_services)
     app.exec()      
\ No newline at end of file
@@ -0,0 +1,357 @@
+# core/bus_instrumentation.py
+from __future__ import annotations
+import atexit
+import json
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, SignalInstance
+
+try:
+    from shiboken6 import isValid
+except ImportError:
+    def isValid(obj) -> bool:
+        return True
+
+
+ENV_VAR = "TOOLKIT_BUS_STATS"      # "1" -> summary on exit, or a path -> JSON dump on exit
+SLOW_HANDLER_MS = 16.0             # one frame at 60 Hz
+
+# Upper bounds (ms) of the wall time histogram buckets, last bucket is open-ended
+BUCKETS_MS = (1, 5, 16, 50, 100, 500)
+BUCKET_LABELS = tuple(f"<{b}ms" for b in BUCKETS_MS) + (f">={BUCKETS_MS[-1]}ms",)
+
+
+class _Timing:
+    """Call count, total / max wall time and a bucketed histogram."""
+
+    __slots__ = ("calls", "total_ms", "max_ms", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * len(BUCKET_LABELS)
+
+    def add(self, ms: float):
+        self.calls += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms < bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "histogram": dict(zip(BUCKET_LABELS, self.histogram)),
+        }
+
+
+class BusStats:
+    """
+    Collected numbers for every instrumented signal:
+    emit count and total emit time (all direct handlers included),
+    plus a _Timing per connected handler.
+    """
+
+    def __init__(self, slow_handler_ms: float = SLOW_HANDLER_MS):
+        self.slow_handler_ms = slow_handler_ms
+        self._lock = threading.Lock()
+        self._emits: Dict[str, _Timing] = {}
+        self._handlers: Dict[str, Dict[str, _Timing]] = {}
+
+    def record_emit(self, signal: str, ms: float):
+        with self._lock:
+            self._emits.setdefault(signal, _Timing()).add(ms)
+
+    def record_handler(self, signal: str, handler: str, ms: float):
+        with self._lock:
+            self._handlers.setdefault(signal, {}).setdefault(handler, _Timing()).add(ms)
+        if ms >= self.slow_handler_ms:
+            print(f"[BusStats] Slow handler {handler} on {signal}: {ms:.1f} ms")
+
+    def reset(self):
+        with self._lock:
+            self._emits.clear()
+            self._handlers.clear()
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            signals = {}
+            for name in sorted(set(self._emits) | set(self._handlers)):
+                emits = self._emits.get(name, _Timing())
+                signals[name] = {
+                    "emits": emits.to_dict(),
+                    "handlers": {
+                        handler: timing.to_dict()
+                        for handler, timing in sorted(
+                            self._handlers.get(name, {}).items(),
+                            key=lambda item: item[1].total_ms,
+                            reverse=True,
+                        )
+                    },
+                }
+        return {
+            "slow_handler_ms": self.slow_handler_ms,
+            "buckets": list(BUCKET_LABELS),
+            "signals": signals,
+        }
+
+    def export_json(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+    def summary(self, top: int = 10) -> str:
+        """Slowest handlers by total time, one per line."""
+        rows = []
+        for signal, info in self.to_dict()["signals"].items():
+            for handler, timing in info["handlers"].items():
+                rows.append((timing["total_ms"], signal, handler, timing))
+        rows.sort(key=lambda row: row[0], reverse=True)
+
+        lines = [f"[BusStats] {len(rows)} handlers on {len(self._emits)} signals"]
+        for total_ms, signal, handler, timing in rows[:top]:
+            lines.append(
+                f"[BusStats]   {signal} -> {handler}: {timing['calls']} calls, "
+                f"{total_ms:.1f} ms total, {timing['max_ms']:.1f} ms max"
+            )
+        return "\n".join(lines)
+
+
+# -------------------------
+# Signal / bus wrappers
+# -------------------------
+def _handler_name(slot) -> str:
+    receiver = getattr(slot, "__self__", None)
+    func = getattr(slot, "__func__", slot)
+    if receiver is not None:
+        return f"{type(receiver).__name__}.{getattr(func, '__name__', repr(func))}"
+
+    name = getattr(func, "__qualname__", None) or repr(func)
+    code = getattr(func, "__code__", None)
+    if code is not None and "<lambda>" in name:
+        # Lambdas are only told apart by where they were written
+        return f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+    return name
+
+
+class _TimedSlot(QObject):
+    """
+    Timing wrapper for a QObject receiver's slot. It lives in the receiver's
+    thread, so Qt still queues cross-thread emits, and is the receiver's
+    child, so it (and its connection) goes away when the receiver is deleted.
+    """
+
+    def __init__(self, timed, receiver: QObject):
+        super().__init__()
+        self._timed = timed
+        self.moveToThread(receiver.thread())
+        self.setParent(receiver)
+
+    def call(self, *args):
+        return self._timed(*args)
+
+
+class InstrumentedSignal:
+    """
+    Stands in for a bus SignalInstance: same connect / disconnect / emit,
+    but every Python handler is wrapped to time its call.
+
+    Slots of QObjects are called through a _TimedSlot, keeping the
+    receiver's thread affinity and auto-disconnect. Other bound methods are
+    held weakly and disconnected once their object is collected.
+    """
+
+    def __init__(self, signal: SignalInstance, name: str, stats: BusStats):
+        self._signal = signal
+        self._name = name
+        self._stats = stats
+        self._wrappers = {}        # _slot_key(slot) -> timing wrapper (_TimedSlot or function)
+
+    def connect(self, slot, *args, **kwargs):
+        receiver = getattr(slot, "__self__", None)
+        if (isinstance(slot, SignalInstance) or not callable(slot)
+                or (receiver is not None and not hasattr(slot, "__func__"))):
+            # Signal-to-signal forwarding (incl. another signal's emit) or a
+            # builtin method: nothing of ours runs, keep it native
+            return self._signal.connect(slot, *args, **kwargs)
+
+        key = _slot_key(slot)
+        timed = self._wrap(slot, key)
+        if isinstance(receiver, QObject):
+            helper = _TimedSlot(timed, receiver)
+            helper.destroyed.connect(lambda *_: self._forget(key, helper))
+            self._wrappers[key] = helper
+            return self._signal.connect(helper.call, *args, **kwargs)
+
+        self._wrappers[key] = timed
+        return self._signal.connect(timed, *args, **kwargs)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            wrappers = list(self._wrappers.values())
+            self._wrappers.clear()
+            result = self._signal.disconnect()
+            for wrapper in wrappers:
+                _discard(wrapper)
+            return result
+
+        wrapper = self._wrappers.pop(_slot_key(slot), None)
+        if wrapper is None:
+            return self._signal.disconnect(slot)
+        result = self._signal.disconnect(_callable(wrapper))
+        _discard(wrapper)
+        return result
+
+    def emit(self, *args):
+        t0 = time.perf_counter()
+        try:
+            return self._signal.emit(*args)
+        finally:
+            self._stats.record_emit(self._name, (time.perf_counter() - t0) * 1000)
+
+    def __getattr__(self, item):
+        return getattr(self._signal, item)
+
+    def _forget(self, key, wrapper):
+        if self._wrappers.get(key) is wrapper:
+            del self._wrappers[key]
+
+    def _drop(self, key):
+        """A weakly held receiver was collected: remove its wrapper and connection."""
+        wrapper = self._wrappers.pop(key, None)
+        if wrapper is None:
+            return
+        try:
+            self._signal.disconnect(wrapper)
+        except (RuntimeError, TypeError):
+            pass
+
+    def _wrap(self, slot, key):
+        name = _handler_name(slot)
+        signal_name = self._name
+        stats = self._stats
+
+        if getattr(slot, "__self__", None) is not None:
+            method = weakref.WeakMethod(slot, lambda _ref: self._drop(key))
+
+            def resolve():
+                bound = method()
+                if bound is None:
+                    return None
+                if isinstance(bound.__self__, QObject) and not isValid(bound.__self__):
+                    return None
+                return bound
+        else:
+            def resolve():
+                return slot
+
+        def timed(*args):
+            target = resolve()
+            if target is None:
+                return
+            t0 = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                stats.record_handler(signal_name, name, (time.perf_counter() - t0) * 1000)
+
+        timed.__name__ = name
+        return timed
+
+
+def _slot_key(slot):
+    """Bound methods by (receiver id, function), so the key doesn't keep the receiver alive."""
+    receiver = getattr(slot, "__self__", None)
+    func = getattr(slot, "__func__", None)
+    if receiver is not None and func is not None:
+        return (id(receiver), func)
+    return slot
+
+
+def _callable(wrapper):
+    return wrapper.call if isinstance(wrapper, _TimedSlot) else wrapper
+
+
+def _discard(wrapper):
+    if isinstance(wrapper, _TimedSlot) and isValid(wrapper):
+        wrapper.setParent(None)
+        wrapper.deleteLater()
+
+
+class InstrumentedBus:
+    """Proxy for an event bus object: signals come back as InstrumentedSignal."""
+
+    def __init__(self, bus: QObject, name: str, stats: BusStats):
+        self._bus = bus
+        self._name = name
+        self._stats = stats
+        self._signals: Dict[str, InstrumentedSignal] = {}
+
+    def __getattr__(self, item):
+        attr = getattr(self._bus, item)
+        if not isinstance(attr, SignalInstance):
+            return attr
+        wrapped = self._signals.get(item)
+        if wrapped is None:
+            wrapped = InstrumentedSignal(attr, f"{self._name}.{item}", self._stats)
+            self._signals[item] = wrapped
+        return wrapped
+
+    def unwrap(self) -> QObject:
+        return self._bus
+
+
+# -------------------------
+# Process-wide stats
+# -------------------------
+_stats: Optional[BusStats] = None
+
+def get_bus_stats() -> Optional[BusStats]:
+    """The running BusStats, or None when the buses are not instrumented."""
+    return _stats
+
+
+def instrument_buses(namespace: dict, setting: str) -> BusStats:
+    """
+    Replace every event bus instance in `namespace` (the globals of
+    core.signal_manager) with an InstrumentedBus.
+
+    `setting` is the TOOLKIT_BUS_STATS value: "1" prints a summary on exit,
+    anything else is taken as the path the JSON report is written to.
+    """
+    global _stats
+    if _stats is None:
+        _stats = BusStats()
+        atexit.register(_report_at_exit, setting)
+
+    for name, value in list(namespace.items()):
+        if isinstance(value, QObject) and not name.startswith("_"):
+            namespace[name] = InstrumentedBus(value, name, _stats)
+
+    print(f"[BusStats] Instrumenting event buses (slow handler >= {_stats.slow_handler_ms:.0f} ms)")
+    return _stats
+
+
+def _report_at_exit(setting: str):
+    if _stats is None:
+        return
+    print(_stats.summary())
+    if setting.strip().lower() not in ("", "1", "true", "yes", "on"):
+        try:
+            path = _stats.export_json(setting)
+            print(f"[BusStats] Report written to {path}")
+        except OSError as e:
+            print(f"[BusStats] Could not write report: {e}")
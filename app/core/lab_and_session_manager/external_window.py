@@ -3,15 +3,79 @@ import subprocess
 from pathlib import Path
 import random
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QDialog, QPlainTextEdit
 from PySide6.QtCore import QTimer, Qt
 
 from core.signal_manager import Lab_eb, Session_eb
 from core.lab_and_session_manager.registor_external_app import register
+from core.lab_and_session_manager.worker_pool import get_worker_pool
+from core.lab_and_session_manager.session_log import SessionLog, session_log_dir
+
+
+class SessionLogDialog(QDialog):
+    """Read-only view of a session's stdout / stderr ring buffer."""
+
+    REFRESH_MS = 500
+
+    def __init__(self, log: SessionLog, parent=None):
+        super().__init__(parent)
+        self.log = log
+        self._shown_lines = None
+
+        self.setWindowTitle(f"{log.app_name} - Logs")
+        self.resize(720, 420)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        self.view = QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(SessionLog.MAX_LINES)
+        self.view.setStyleSheet("""
+            QPlainTextEdit {
+                font-family: Consolas, monospace;
+                font-size: 12px;
+            }
+        """)
+        layout.addWidget(self.view)
+
+        if log.log_file is not None:
+            path_label = QLabel(f"Full log: {log.log_file}")
+            path_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            path_label.setStyleSheet("QLabel { color: #777; font-size: 11px; }")
+            layout.addWidget(path_label)
+
+        # Refresh only while the dialog is visible
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.REFRESH_MS)
+        self.timer.timeout.connect(self._refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def _refresh(self):
+        lines = self.log.lines()
+        if lines == self._shown_lines:
+            return
+        self._shown_lines = lines
+
+        bar = self.view.verticalScrollBar()
+        at_bottom = bar.value() == bar.maximum()
+        self.view.setPlainText("\n".join(lines))
+        if at_bottom:
+            bar.setValue(bar.maximum())
 
 
 class ExternalProcessWidget(QWidget):
 
+    LOG_TO_FILE = True      # also spill session output to <profile>/data/logs
+
     def __init__(self, app_path: Path, app_name: str, lab_id: str, session_id: str, parent=None):
         super().__init__(parent)
 
@@ -21,16 +85,19 @@ class ExternalProcessWidget(QWidget):
         self.app_name = app_name
         self._closing = False
 
-        register(self)
+        # Start the external Python script in a pre-warmed worker interpreter
+        self.proc = get_worker_pool().launch(self.app_path, cwd=self.app_path.parent)
 
-        # Start the external Python script
-        self.proc = subprocess.Popen(
-            [sys.executable, str(self.app_path)],
-            cwd=str(self.app_path.parent),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            stdin=subprocess.DEVNULL
+        # Drain stdout / stderr so the child never blocks on a full pipe
+        self.log = SessionLog(
+            self.session_id, self.app_name,
+            session_log_dir() if self.LOG_TO_FILE else None
         )
+        self.log.attach(self.proc)
+        self.log_dialog = None
+
+        # Supervisor closes the lab as soon as the process exits
+        register(self)
 
         self.setWindowTitle(f"{self.app_name} (External App)")
         self.setMinimumSize(400, 140)
@@ -110,12 +177,32 @@ class ExternalProcessWidget(QWidget):
             }
         """)
 
+        # Show Logs Button
+        btn_logs = QPushButton("Show Logs")
+        btn_logs.setFixedHeight(30)
+        btn_logs.setFixedWidth(300)
+        btn_logs.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                color: #555;
+                font-size: 13px;
+                border: 1px solid #ccc;
+                border-radius: 8px;
+                padding: 4px 14px;
+            }
+            QPushButton:hover {
+                background-color: #f0f0f0;
+            }
+        """)
+
         btn_show.clicked.connect(self._bring_to_front)
         btn_close.clicked.connect(self._terminate_process)
+        btn_logs.clicked.connect(self._show_logs)
 
         real_layout.addWidget(title)
         real_layout.addWidget(btn_show, alignment=Qt.AlignCenter)
         real_layout.addWidget(btn_close, alignment=Qt.AlignCenter)
+        real_layout.addWidget(btn_logs, alignment=Qt.AlignCenter)
 
         self.real_ui.hide()        # <== Hide real UI
         layout.addWidget(self.real_ui)  # Add AFTER loading label
@@ -127,12 +214,6 @@ class ExternalProcessWidget(QWidget):
         # ------------------------------------------------------
         QTimer.singleShot(random.randint(2000, 4000), self._show_real_ui)
 
-
-        # Monitor process
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._check_process)
-        self.timer.start(1000)
-
         Session_eb.session_closed.connect(self._session_closed)
         Session_eb.all_sessions_closed.connect(self.force_close)
 
@@ -184,11 +265,12 @@ class ExternalProcessWidget(QWidget):
             print("Bring-to-front failed:", e)
 
 
-    def _check_process(self):
-        if self.proc.poll() is not None:
-            self.timer.stop()
-            Lab_eb.close_lab.emit(self.lab_id)
-            self.force_close()
+    def _show_logs(self):
+        if self.log_dialog is None:
+            self.log_dialog = SessionLogDialog(self.log, self)
+        self.log_dialog.show()
+        self.log_dialog.raise_()
+        self.log_dialog.activateWindow()
 
     def _terminate_process(self):
         if self.proc and self.proc.poll() is None:
@@ -212,8 +294,6 @@ class ExternalProcessWidget(QWidget):
 
         try: self._terminate_process()
         except: pass
-        try: self.timer.stop()
-        except: pass
 
         event.accept()
 
@@ -1,6 +1,7 @@
 # core/lab_controller.py
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QApplication
 
 if __name__ == "__main__":
     from pathlib import Path
@@ -16,14 +17,29 @@ if __name__ == "__main__":
 from core.lab_and_session_manager.lab_id import generate_lab_id
 from core.subapp_manager.get_app import GetAppInfo
 from core.signal_manager import Lab_eb, LeftPanel_eb, Session_eb, Pill_eb
+from core.userdata_manager.workspace_store import WorkspaceStore, workspace_file
+from core.userdata_manager.transcript_store import delete_transcript, prune_transcripts
 
 class LabManager:
+    SAVE_DEBOUNCE_MS = 500      # a burst of lab changes is written once
+
     def __init__(self, profile_path):
         self.profile_path = profile_path
         self.labs: Dict[str, Dict] = {}
         self.active_lab: str | None = None
         self.quicklab_counter = 0
 
+        # Workspace snapshot: the open labs survive a restart
+        path = workspace_file(profile_path)
+        self.workspace = WorkspaceStore(path) if path else None
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.save_workspace)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.save_workspace)
+
         LeftPanel_eb.new_lab.connect(self.new_lab)
         LeftPanel_eb.incognito_lab.connect(self.incognito_lab)
         LeftPanel_eb.close_all_labs.connect(self.close_all_labs)
@@ -34,6 +50,8 @@ class LabManager:
         Lab_eb.active_lab.connect(self.set_active)
         # Lab_eb.active_lab.connect(lambda x : print("Closing lab:", x))
         Lab_eb.rename_lab.connect(self.lab_rename_request)
+        Lab_eb.open_labs.connect(self.open_labs)
+        Lab_eb.close_labs.connect(self.close_labs)
 
   
 
@@ -49,6 +67,7 @@ class LabManager:
             }
         Pill_eb.new_pill.emit({"id": lab_id, "title": name, "icon": app_icon})
         Session_eb.add_session.emit({"id": lab_id, "title": name, "app_id": app_id, "content": "quicklab"})
+        self._schedule_save()
 
         return lab_id
 
@@ -60,7 +79,7 @@ class LabManager:
         else: 
             app_info = GetAppInfo(app_id, self.profile_path).get_app_info()
             self.labs[lab_id] = {
-                "app_id": app_info.get("id"),
+                "app_id": app_id,       # registry key, not info.json's "id" (case differs)
                 "name": app_info.get("name"),
                 "main": app_info.get("main"),
                 "info": app_info.get("info"),
@@ -69,6 +88,7 @@ class LabManager:
 
             Pill_eb.add_pill.emit({"id": lab_id, "title": app_info.get("name"), "icon": app_info.get("icon")})
             Session_eb.add_session.emit({"id": lab_id, "title": app_info.get("name"), "content": app_info.get("main"), "app_id": app_id})
+            self._schedule_save()
 
     
 
@@ -80,28 +100,36 @@ class LabManager:
         self.labs[lab_id] = {
             "title": title, 
             "content": content, 
-            "code_used": False
+            "code_used": False,
+            "incognito": True,
             }
         Pill_eb.incognito_pill.emit({"id": lab_id, "title": title})
-        Session_eb.add_session.emit({"id": lab_id, "title": title, "type": content, "content": content})
+        Session_eb.add_session.emit({
+            "id": lab_id, "title": title, "type": content, "content": content,
+            "app_id": "quicklab" if content in ("quicklab", "") else None,
+            "incognito": True,
+        })
 
     def close_lab(self, lab_id: str):
         if lab_id in self.labs:
             self.labs.pop(lab_id)
             Pill_eb.remove_pill.emit(lab_id)
             Session_eb.close_session.emit(lab_id)
+            delete_transcript(lab_id)
 
             if self.active_lab == lab_id:
                 if self.labs:
                     self.set_active(next(iter(self.labs)))
                 else:
                     self.active_lab = None
+            self._schedule_save()
 
     def set_active(self, lab_id: str):
         if lab_id in self.labs:
             self.active_lab = lab_id
             Pill_eb.active_pill.emit(lab_id)
             Session_eb.active_session.emit(lab_id)
+            self._schedule_save()
 
     def update_lab_content(self, lab_id: str, content: str):
         if lab_id in self.labs:
@@ -121,9 +149,166 @@ class LabManager:
 
         Pill_eb.rename_pill.emit({"id": lab_id, "new_title": lab_data["title"]})
         Session_eb.rename_session.emit({"id": lab_id, "new_title": lab_data["title"]})
+        self._schedule_save()
+
+    # -------------------------
+    # Batch operations
+    # -------------------------
+    def _describe_lab(self, spec):
+        """
+        Lab record, pill info and session info for one entry of open_labs.
+        `spec` is an app id, or a dict with "app_id" and optionally "title"
+        and "id" (a restored lab keeps its id, so its transcript follows it).
+        """
+        if isinstance(spec, str):
+            spec = {"app_id": spec}
+        app_id = spec.get("app_id") or "quicklab"
+        lab_id = spec.get("id") or generate_lab_id()
+
+        if app_id == "quicklab":
+            title = spec.get("title") or "Untitled Lab"
+            icon = "Z:\\Project\\Toolkit\\app\\assets\\leftpanel_icons\\newlab.svg"
+            lab = {"title": title, "app_id": app_id, "icon": icon}
+            content = "quicklab"
+        else:
+            app_info = GetAppInfo(app_id, self.profile_path).get_app_info()
+            if not app_info:
+                raise LookupError(f"app '{app_id}' is not installed")
+            title = spec.get("title") or app_info.get("name")
+            icon = app_info.get("icon")
+            lab = {
+                "title": title,
+                "app_id": app_id,
+                "name": app_info.get("name"),
+                "main": app_info.get("main"),
+                "info": app_info.get("info"),
+                "icon": icon,
+            }
+            content = app_info.get("main")
+
+        pill = {"id": lab_id, "title": title, "icon": icon}
+        session = {"id": lab_id, "title": title, "app_id": app_id, "content": content}
+        if spec.get("lazy"):
+            # Registered only; SessionManager builds it on first activation
+            session["lazy"] = True
+        return lab_id, lab, pill, session
+
+    def open_labs(self, specs: list, active: str | None = None) -> list:
+        """
+        Open many labs with one add_pills and one add_sessions emit, so the
+        pill bar and the session stack each update in a single pass.
+        `active` selects the lab to show (default: the last one opened).
+        Entries with "lazy": True get a pill now and a session on first use.
+        """
+        lab_ids, pills, sessions = [], [], []
+        for spec in specs:
+            try:
+                lab_id, lab, pill, session = self._describe_lab(spec)
+            except Exception as e:
+                print(f"[LabManager] Skipping lab {spec!r}: {e}")
+                continue
+            self.labs[lab_id] = lab
+            lab_ids.append(lab_id)
+            pills.append(pill)
+            sessions.append(session)
+
+        if not lab_ids:
+            return []
+
+        Pill_eb.add_pills.emit(pills)
+        Session_eb.add_sessions.emit(sessions)
+        self.set_active(active if active in self.labs else lab_ids[-1])
+        return lab_ids
+
+    def close_labs(self, lab_ids: list):
+        """Close a set of labs with one remove_pills and one close_sessions emit."""
+        closing = [lab_id for lab_id in dict.fromkeys(lab_ids) if lab_id in self.labs]
+        if not closing:
+            return
+
+        for lab_id in closing:
+            self.labs.pop(lab_id)
+        Pill_eb.remove_pills.emit(closing)
+        Session_eb.close_sessions.emit(closing)
+        for lab_id in closing:
+            delete_transcript(lab_id)
+
+        if self.active_lab in closing:
+            if self.labs:
+                self.set_active(next(iter(self.labs)))
+            else:
+                self.active_lab = None
+        self._schedule_save()
 
     def close_all_labs(self):
+        closing = list(self.labs)
         self.labs.clear()
         self.active_lab = None
         Pill_eb.remove_all_pills.emit()
-        Session_eb.close_all_sessions.emit()
\ No newline at end of file
+        Session_eb.close_all_sessions.emit()
+        for lab_id in closing:
+            delete_transcript(lab_id)
+        self._schedule_save()
+
+    # -------------------------
+    # Workspace snapshot
+    # -------------------------
+    def _schedule_save(self):
+        if self.workspace is not None:
+            self._save_timer.start()
+
+    def workspace_state(self) -> list:
+        """Open labs in tab order, as saved to workspace.json (incognito labs are not)."""
+        labs = []
+        for lab_id, lab in self.labs.items():
+            if lab.get("incognito"):
+                continue
+            entry = {"id": lab_id, "title": lab.get("title"), "app_id": lab.get("app_id")}
+            if lab.get("app_id") == "quicklab":
+                # Transcript lives in data/activity/transcripts, keyed by lab id
+                entry["transcript"] = f"{lab_id}.jsonl"
+            labs.append(entry)
+        return labs
+
+    def save_workspace(self):
+        self._save_timer.stop()
+        if self.workspace is None:
+            return
+        labs = self.workspace_state()
+        active = self.active_lab if any(lab["id"] == self.active_lab for lab in labs) else None
+        self.workspace.write(labs, active)
+
+    def restore_workspace(self) -> list:
+        """
+        Reopen the labs of the last run with their ids, titles and order.
+        Only the active lab is built now; the others are rebuilt the first
+        time they are activated.
+        """
+        if self.workspace is None:
+            return []
+        data = self.workspace.read()
+        if not data:
+            return []
+
+        saved = [lab for lab in data["labs"] if isinstance(lab, dict) and lab.get("id")]
+        # Transcripts of labs that are no longer in the workspace are dead weight
+        removed = prune_transcripts(lab["id"] for lab in saved)
+        if removed:
+            print(f"[LabManager] Deleted {removed} transcripts of closed labs")
+        if not saved:
+            return []
+        active = data.get("active")
+        if active not in {lab["id"] for lab in saved}:
+            active = saved[-1]["id"]
+
+        specs = [
+            # Registry keys are lowercase; older snapshots kept info.json's casing
+            {"id": lab["id"], "title": lab.get("title"), "app_id": (lab.get("app_id") or "quicklab").lower(),
+             "lazy": lab["id"] != active}
+            for lab in saved
+        ]
+        lab_ids = self.open_labs(specs, active=active)
+        print(f"[LabManager] Restored {len(lab_ids)} labs from workspace")
+        if len(lab_ids) < len(specs):
+            print(f"[LabManager] Could not restore {len(specs) - len(lab_ids)} labs (see above)")
+        return lab_ids
\ No newline at end of file
@@ -0,0 +1,136 @@
+# core/lab_and_session_manager/process_supervisor.py
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from core.signal_manager import Lab_eb
+
+try:
+    import psutil
+except ImportError:
+    # Stats are optional, supervision works without psutil
+    psutil = None
+
+
+class ProcessSupervisor(QObject):
+    """
+    Owns every external subapp process started by an ExternalProcessWidget.
+
+    Each child gets a waiter thread blocked in `proc.wait()`, so there is no
+    polling: the thread wakes up only when the child exits and hands the exit
+    over to the UI thread through a queued signal. The owning lab is closed
+    right away instead of on the next timer tick.
+    """
+
+    process_exited = Signal(int, object)    # pid, return code (Windows codes overflow a C int)
+
+    def __init__(self):
+        super().__init__()
+        self._children: Dict[int, object] = {}      # pid -> ExternalProcessWidget
+        self._ps: Dict[int, object] = {}            # pid -> psutil.Process (keeps cpu_percent baseline)
+
+        # Emitted from waiter threads, delivered queued on the UI thread
+        self.process_exited.connect(self._on_process_exited)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def watch(self, widget):
+        """Start supervising `widget.proc`."""
+        proc = widget.proc
+        self._children[proc.pid] = widget
+
+        waiter = threading.Thread(
+            target=self._wait_for_exit,
+            args=(proc,),
+            name=f"supervisor-{proc.pid}",
+            daemon=True,
+        )
+        waiter.start()
+
+    def children(self) -> List[object]:
+        return list(self._children.values())
+
+    def stats(self, pid: int) -> Optional[dict]:
+        """
+        CPU / memory usage of one child, or None if it is not supervised,
+        already gone, or psutil is not installed.
+        cpu_percent is measured since the previous call for that pid.
+        """
+        widget = self._children.get(pid)
+        if widget is None or psutil is None:
+            return None
+
+        try:
+            ps = self._ps.get(pid)
+            if ps is None:
+                ps = psutil.Process(pid)
+                ps.cpu_percent(None)        # first call only sets the baseline
+                self._ps[pid] = ps
+
+            with ps.oneshot():
+                return {
+                    "pid": pid,
+                    "app_name": widget.app_name,
+                    "lab_id": widget.lab_id,
+                    "session_id": widget.session_id,
+                    "cpu_percent": ps.cpu_percent(None),
+                    "rss": ps.memory_info().rss,
+                    "uptime": time.time() - ps.create_time(),
+                }
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._ps.pop(pid, None)
+            return None
+
+    def all_stats(self) -> List[dict]:
+        result = []
+        for pid in list(self._children):
+            info = self.stats(pid)
+            if info is not None:
+                result.append(info)
+        return result
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _wait_for_exit(self, proc):
+        try:
+            code = proc.wait()
+        except Exception as e:
+            print(f"[ProcessSupervisor] Wait on pid {proc.pid} failed: {e}")
+            code = -1
+        self.process_exited.emit(proc.pid, code)
+
+    @Slot(int, object)
+    def _on_process_exited(self, pid: int, code: int):
+        widget = self._children.pop(pid, None)
+        self._ps.pop(pid, None)
+        if widget is None:
+            return
+
+        print(f"[ProcessSupervisor] {widget.app_name} (pid {pid}) exited with code {code}")
+
+        try:
+            # A widget that is already closing asked for the exit itself
+            if not widget._closing:
+                Lab_eb.close_lab.emit(widget.lab_id)
+            widget.force_close()
+        except RuntimeError:
+            # Underlying C++ widget already deleted
+            pass
+
+
+# -------------------------
+# Process-wide supervisor
+# -------------------------
+_supervisor: Optional[ProcessSupervisor] = None
+
+def get_process_supervisor() -> ProcessSupervisor:
+    """Created on first use, which must happen on the UI thread."""
+    global _supervisor
+    if _supervisor is None:
+        _supervisor = ProcessSupervisor()
+    return _supervisor
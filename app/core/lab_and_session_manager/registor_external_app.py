@@ -1,10 +1,41 @@
 # core/external_registry.py
 
+from core.lab_and_session_manager.worker_pool import get_worker_pool
+from core.lab_and_session_manager.process_supervisor import get_process_supervisor
+
 external_widgets = []
+_exit_hook_connected = False
 
 def register(widget):
-    """Register external app widgets globally."""
+    """Register external app widgets globally and supervise their process."""
+    global _exit_hook_connected
+    supervisor = get_process_supervisor()
+    if not _exit_hook_connected:
+        supervisor.process_exited.connect(_forget_pid)
+        _exit_hook_connected = True
+
     external_widgets.append(widget)
+    widget.destroyed.connect(lambda *_: _on_destroyed(widget))
+    supervisor.watch(widget)
+
+def unregister(widget):
+    """Drop a widget whose window was destroyed or whose process exited."""
+    try:
+        external_widgets.remove(widget)
+    except ValueError:
+        pass
+
+def _on_destroyed(widget):
+    # cleanup() can no longer reach it, so don't leave its process behind
+    try:
+        widget._terminate_process()
+    except Exception:
+        pass
+    unregister(widget)
+
+def _forget_pid(pid: int, code: int):
+    for w in [w for w in external_widgets if w.proc.pid == pid]:
+        unregister(w)
 
 def cleanup():
     """Called when the main app exits to kill all external apps."""
@@ -13,3 +44,6 @@ def cleanup():
             w.force_close()
         except:
             pass
+
+    # Idle warm workers are not attached to any widget
+    get_worker_pool().shutdown()
@@ -0,0 +1,164 @@
+# core/lab_and_session_manager/session_log.py
+
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtWidgets import QApplication
+
+
+class SessionLog:
+    """
+    Bounded log of one external session's stdout / stderr.
+
+    A reader thread per stream drains the child's pipes as soon as data
+    arrives, so a chatty subapp can never fill the OS pipe buffer and block.
+    The last MAX_LINES lines stay in memory for the session panel; when a
+    log directory is given every line is also written to a rotating file,
+    and the directory is trimmed to the newest DIR_MAX_FILES log files
+    (DIR_MAX_BYTES in total) whenever a session opens one.
+    """
+
+    MAX_LINES = 2000
+    FILE_MAX_BYTES = 1024 * 1024
+    FILE_BACKUPS = 3
+    DIR_MAX_FILES = 50
+    DIR_MAX_BYTES = 50 * 1024 * 1024
+
+    def __init__(self, session_id: str, app_name: str, log_dir: Optional[Path] = None):
+        self.session_id = session_id
+        self.app_name = app_name
+
+        self._lines = deque(maxlen=self.MAX_LINES)
+        self._lock = threading.Lock()
+        self._readers: List[threading.Thread] = []
+        self._open_streams = 0
+
+        self.log_file: Optional[Path] = None
+        self._file_handler: Optional[RotatingFileHandler] = None
+        if log_dir is not None:
+            self._open_file(Path(log_dir))
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def attach(self, proc):
+        """Start draining `proc.stdout` and `proc.stderr` (whichever are pipes)."""
+        for stream, tag in ((proc.stdout, "out"), (proc.stderr, "err")):
+            if stream is None:
+                continue
+            with self._lock:
+                self._open_streams += 1
+            reader = threading.Thread(
+                target=self._drain,
+                args=(stream, tag),
+                name=f"log-{tag}-{proc.pid}",
+                daemon=True,
+            )
+            reader.start()
+            self._readers.append(reader)
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            return list(self._lines)
+
+    def text(self) -> str:
+        return "\n".join(self.lines())
+
+    def close(self):
+        handler, self._file_handler = self._file_handler, None
+        if handler is not None:
+            handler.close()
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _drain(self, stream, tag: str):
+        try:
+            for raw in iter(stream.readline, b""):
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                self._append(f"[{tag}] {line}")
+        except (OSError, ValueError):
+            # Pipe closed underneath us (process killed / app quitting)
+            pass
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+            with self._lock:
+                self._open_streams -= 1
+                finished = self._open_streams == 0
+            if finished:
+                # Both pipes hit EOF, the child is gone: release the log file
+                self.close()
+
+    def _append(self, line: str):
+        with self._lock:
+            self._lines.append(line)
+        handler = self._file_handler
+        if handler is not None:
+            # Owned handler, no named logger: nothing outlives the session
+            handler.handle(logging.makeLogRecord({"msg": line, "levelno": logging.INFO}))
+
+    def _open_file(self, log_dir: Path):
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_dir(log_dir)
+            self.log_file = log_dir / f"{_safe_name(self.app_name)}_{self.session_id}.log"
+
+            handler = RotatingFileHandler(
+                self.log_file,
+                maxBytes=self.FILE_MAX_BYTES,
+                backupCount=self.FILE_BACKUPS,
+                encoding="utf-8",
+                delay=True,
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._file_handler = handler
+        except OSError as e:
+            print(f"[SessionLog] Log file disabled for {self.app_name}: {e}")
+            self.log_file = None
+            self._file_handler = None
+
+    def _prune_dir(self, log_dir: Path):
+        """Delete the oldest session logs (and their backups) past the directory caps."""
+        files = []
+        for path in log_dir.glob("*.log*"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        files.sort(reverse=True)
+
+        # Newest first; once a cap is hit everything older goes. One slot is
+        # left for the file this session is about to open.
+        kept_files = kept_bytes = 0
+        full = False
+        for _, size, path in files:
+            full = full or kept_files + 1 >= self.DIR_MAX_FILES or kept_bytes + size > self.DIR_MAX_BYTES
+            if not full:
+                kept_files += 1
+                kept_bytes += size
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # Still open by a running session (Windows) or already gone
+                pass
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name) or "app"
+
+
+def session_log_dir() -> Optional[Path]:
+    """<profile>/data/logs for the running app, or None if no profile is set."""
+    profile_path = getattr(QApplication.instance(), "profile_path", None)
+    if not profile_path:
+        return None
+    return Path(profile_path) / "data" / "logs"
@@ -2,11 +2,12 @@
 
 from PySide6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
 from PySide6.QtGui import QFont, QPixmap, QIcon
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
-from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton, QSizePolicy
+from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton, QSizePolicy, QStackedLayout
 from pathlib import Path
 import sys
+import time
 
 if __name__ == "__main__":
     ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -19,26 +20,43 @@ from core.lab_and_session_manager.session_id import generate_session_id
 from quick_lab.quick_lab import QuickLab  
 from core.subapp_manager.load_app_for_session import load_app_widget 
 from core.lab_and_session_manager.external_window import ExternalProcessWidget
+from core.userdata_manager.transcript_store import open_transcript_store
 
 class QuickLabSessionWidget(QWidget):
-    def __init__(self, session_id, title):
+    def __init__(self, session_id, title, lab_id=None, incognito=False):
         super().__init__()
         self.session_id = session_id
         self.title = title
+        self.lab_id = lab_id
 
         layout = QVBoxLayout(self)
 
         # 1. Create QuickLab instance
         self.quicklab = QuickLab()
-        self.quicklab.lab_id = session_id
+        self.quicklab.lab_id = lab_id or session_id     # backend requests are cancelled per lab
         self.quicklab.setWindowTitle(title)
 
         # 3. Add QuickLab UI inside this widget
         layout.addWidget(self.quicklab)
 
+        # 4. Reopen the lab's persisted transcript (last screenful only);
+        #    incognito labs are never written to disk
+        if not incognito:
+            self.quicklab.attach_store(open_transcript_store(lab_id))
+
 
 # Main LabWindow using session_id
 class SessionManager(LabWindow):
+    # Session lifecycle
+    ACTIVE = "active"           # the visible session
+    BACKGROUND = "background"   # built but hidden
+    SUSPENDED = "suspended"     # widget destroyed, only a snapshot is kept
+
+    IDLE_SUSPEND_SECS = 10 * 60     # background sessions idle this long get suspended
+    MAX_LIVE_SESSIONS = 8           # budget of built sessions (active + background)
+    RECLAIM_INTERVAL_MS = 30 * 1000
+    SUSPEND_EMBEDDED = False        # opt-in: embedded subapps restart fresh (unsaved state lost) when resumed
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -56,13 +74,24 @@ class SessionManager(LabWindow):
         self.updateGeometry() 
 
         # ... rest of the code ...
-        if self.session_layout is None or not isinstance(self.session_layout, QVBoxLayout):
+        if self.session_layout is None or not isinstance(self.session_layout, QStackedLayout):
             print("CRITICAL DEBUG: self.session_layout is missing or invalid!")
         else:
             print("DEBUG: self.session_layout is valid.")    
         self.sessions = {}
         self.lab_to_session = {}
 
+        # Lifecycle bookkeeping (session_id -> ...)
+        self.session_info = {}      # info dict the session was created from
+        self.session_state = {}
+        self.last_active = {}
+        self.suspended = {}         # snapshot of suspended sessions
+        self.current_session = None
+
+        self.reclaim_timer = QTimer(self)
+        self.reclaim_timer.timeout.connect(self.reclaim_sessions)
+        self.reclaim_timer.start(self.RECLAIM_INTERVAL_MS)
+
         # Signals
         Session_eb.add_session.connect(self.create_session)
         # Session_eb.add_session.connect(lambda x : print("Adding session:", x))
@@ -71,6 +100,8 @@ class SessionManager(LabWindow):
         Session_eb.active_session.connect(self.active_session)
         Session_eb.rename_session.connect(self.rename_session)
         Session_eb.close_all_sessions.connect(self.close_all_sessions)
+        Session_eb.add_sessions.connect(self.create_sessions)
+        Session_eb.close_sessions.connect(self.close_sessions)
 
     # --------------------------------------------------------
     def get_or_create_session_id(self, lab_id: str) -> str:
@@ -87,8 +118,6 @@ class SessionManager(LabWindow):
     def create_session(self, info: dict):
         lab_id = info.get("id")
         app_id = info.get("app_id")
-        title = info.get("title", f"Lab {lab_id}")
-        content = info.get("content")
 
         # NEW: Get same session_id every time
         session_id = self.get_or_create_session_id(lab_id)
@@ -99,70 +128,218 @@ class SessionManager(LabWindow):
             self.switch_session(session_id)
             return
 
-        # Otherwise create a new session widget
-        if app_id == "quicklab":
-            widget = QuickLabSessionWidget(session_id, title)
+        if session_id in self.suspended:
+            self.resume_session(session_id)
+            return
 
-        else:
-            # Attempt EMBED FIRST
-            try:
-                app_path = Path(content)
-                app_widget = load_app_widget(app_path)
-
-                # embed mode
-                widget = QWidget()
-                layout = QVBoxLayout(widget)
-                layout.addWidget(app_widget)
-                print(f"[OK] Loaded {app_id} INSIDE session window")
-
-                self.sessions[session_id] = widget
-                self.session_layout.addWidget(widget)
-                return
+        self.session_info[session_id] = dict(info)
+        self.last_active[session_id] = time.monotonic()
 
-            except Exception as e:
-                print(f"[FAIL] Cannot embed {app_id}: {e}")
-                print("[INFO] Launching external process window")
-
-                # Create external process window
-                external_window = ExternalProcessWidget(
-                    app_path=Path(content),
-                    app_name = title,
-                    lab_id=lab_id,
-                    session_id=session_id
-                )
-                # Add panel into lab window (this is just info panel, not the real app)
-                self.sessions[session_id] = external_window
-                self.session_layout.addWidget(external_window)
-
-                print("[OK] External app launched, info shown inside session")
-                return
-
-    
+        if info.get("lazy") and session_id != self.current_session:
+            # Restored lab: nothing is built until the lab is first activated
+            self.session_info[session_id].pop("lazy", None)
+            self.suspended[session_id] = {"info": self.session_info[session_id]}
+            self.session_state[session_id] = self.SUSPENDED
+            return
 
-        widget.session_id = session_id
+        self.session_state[session_id] = self.BACKGROUND
+        widget = self._build_session_widget(session_id, info)
         self.sessions[session_id] = widget
+        self.session_layout.addWidget(widget)
 
-        widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # The lab may have been activated before its session existed
+        if session_id == self.current_session:
+            self.session_state[session_id] = self.ACTIVE
+            self.session_layout.setCurrentWidget(widget)
 
-        self.session_layout.addWidget(widget)
+    def _build_session_widget(self, session_id: str, info: dict):
+        lab_id = info.get("id")
+        app_id = info.get("app_id")
+        title = info.get("title", f"Lab {lab_id}")
+        content = info.get("content")
+
+        if app_id == "quicklab":
+            widget = QuickLabSessionWidget(session_id, title, lab_id, incognito=info.get("incognito", False))
+            widget.session_id = session_id
+            widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            return widget
+
+        # Attempt EMBED FIRST
+        try:
+            app_path = Path(content)
+            app_widget = load_app_widget(app_path)
+
+            # embed mode
+            widget = QWidget()
+            layout = QVBoxLayout(widget)
+            layout.addWidget(app_widget)
+            widget.embedded = True
+            print(f"[OK] Loaded {app_id} INSIDE session window")
+            return widget
+
+        except Exception as e:
+            print(f"[FAIL] Cannot embed {app_id}: {e}")
+            print("[INFO] Launching external process window")
+
+            # Create external process window
+            external_window = ExternalProcessWidget(
+                app_path=Path(content),
+                app_name = title,
+                lab_id=lab_id,
+                session_id=session_id
+            )
+            # Add panel into lab window (this is just info panel, not the real app)
+            print("[OK] External app launched, info shown inside session")
+            return external_window
 
 
     # --------------------------------------------------------
     def active_session(self, lab_id: str):
         session_id = self.get_or_create_session_id(lab_id)
         # print("Switching to session:", session_id)
-        for sid, widget in self.sessions.items(): 
-            widget.setVisible(sid == session_id)
+        if session_id in self.suspended:
+            self.resume_session(session_id)
+
+        now = time.monotonic()
+        previous = self.current_session
+        if previous and previous != session_id and previous in self.session_state:
+            self.session_state[previous] = self.BACKGROUND
+            self.last_active[previous] = now
+
+        self.current_session = session_id
+        if session_id in self.session_state:
+            self.session_state[session_id] = self.ACTIVE
+            self.last_active[session_id] = now
+
+        widget = self.sessions.get(session_id)
+        if widget is not None and self.session_layout.currentWidget() is not widget:
+            self.session_layout.setCurrentWidget(widget)
+
+    def switch_session(self, session_id: str):
+        for lab_id, sid in self.lab_to_session.items():
+            if sid == session_id:
+                self.active_session(lab_id)
+                return
+
+    # --------------------------------------------------------
+    # Suspend / resume
+    # --------------------------------------------------------
+    def can_suspend(self, session_id: str) -> bool:
+        widget = self.sessions.get(session_id)
+        if widget is None or session_id == self.current_session:
+            return False
+        if isinstance(widget, ExternalProcessWidget):
+            # The real app lives in its own process, the panel costs nothing
+            return False
+        if getattr(widget, "embedded", False):
+            return self.SUSPEND_EMBEDDED
+        if isinstance(widget, QuickLabSessionWidget) and widget.quicklab.has_active_requests():
+            # Let the response finish streaming first
+            return False
+        return True
+
+    def suspend_session(self, session_id: str) -> bool:
+        """Snapshot a background session and destroy its widget."""
+        if not self.can_suspend(session_id):
+            return False
+
+        widget = self.sessions.pop(session_id)
+        snapshot = {"info": dict(self.session_info.get(session_id, {}))}
+        if isinstance(widget, QuickLabSessionWidget):
+            snapshot["title"] = widget.title
+            snapshot["is_named"] = widget.quicklab.is_named
+            if widget.quicklab.store is None:
+                # Persisted labs reload from their transcript store instead
+                snapshot["transcript"] = widget.quicklab.chat.get_transcript()
+
+        self.suspended[session_id] = snapshot
+        self.session_state[session_id] = self.SUSPENDED
+
+        widget.setParent(None)
+        widget.deleteLater()
+        print(f"[SessionManager] Suspended session {session_id}")
+        return True
+
+    def resume_session(self, session_id: str):
+        """Rebuild a suspended session from its snapshot."""
+        snapshot = self.suspended.pop(session_id, None)
+        if snapshot is None:
+            return
+
+        info = snapshot["info"]
+        widget = self._build_session_widget(session_id, info)
+        if isinstance(widget, QuickLabSessionWidget):
+            widget.title = snapshot.get("title", widget.title)
+            widget.quicklab.is_named = snapshot.get("is_named", False)
+            widget.quicklab.chat.load_transcript(snapshot.get("transcript", []))
+
+        self.sessions[session_id] = widget
+        self.session_layout.addWidget(widget)
+        self.session_state[session_id] = self.BACKGROUND
+        self.last_active[session_id] = time.monotonic()
+        print(f"[SessionManager] Resumed session {session_id}")
+
+    def reclaim_sessions(self):
+        """Suspend idle background sessions, then enforce the live-session budget."""
+        now = time.monotonic()
+        background = sorted(
+            (sid for sid, state in self.session_state.items() if state == self.BACKGROUND),
+            key=lambda sid: self.last_active.get(sid, 0.0)
+        )
+
+        for sid in background:
+            if now - self.last_active.get(sid, now) >= self.IDLE_SUSPEND_SECS:
+                self.suspend_session(sid)
+
+        # Oldest background sessions go first
+        for sid in background:
+            if len(self.sessions) <= self.MAX_LIVE_SESSIONS:
+                break
+            if self.session_state.get(sid) == self.BACKGROUND:
+                self.suspend_session(sid)
+
+    def _forget_session(self, session_id: str):
+        self.session_info.pop(session_id, None)
+        self.session_state.pop(session_id, None)
+        self.last_active.pop(session_id, None)
+        self.suspended.pop(session_id, None)
+        if self.current_session == session_id:
+            self.current_session = None
 
     # --------------------------------------------------------
     def close_session(self, lab_id: str):
         session_id = self.get_or_create_session_id(lab_id)
         widget = self.sessions.pop(session_id, None)
+        was_suspended = session_id in self.suspended
+        self._forget_session(session_id)
         if widget:
             widget.setParent(None)
             widget.deleteLater()
+        if widget or was_suspended:
             Session_eb.session_closed.emit(session_id)
 
+    # --------------------------------------------------------
+    # Batch: build / tear down many sessions in one layout pass
+    # --------------------------------------------------------
+    def create_sessions(self, infos: list):
+        self.session_container.setUpdatesEnabled(False)
+        try:
+            for info in infos:
+                session_id = self.get_or_create_session_id(info.get("id"))
+                if session_id in self.sessions or session_id in self.suspended:
+                    continue
+                self.create_session(info)
+        finally:
+            self.session_container.setUpdatesEnabled(True)
+
+    def close_sessions(self, lab_ids: list):
+        self.session_container.setUpdatesEnabled(False)
+        try:
+            for lab_id in lab_ids:
+                self.close_session(lab_id)
+        finally:
+            self.session_container.setUpdatesEnabled(True)
+
     # --------------------------------------------------------
     def close_all_sessions(self):
         for widget in self.sessions.values():
@@ -170,6 +347,11 @@ class SessionManager(LabWindow):
             widget.deleteLater()
         self.sessions.clear()
         self.lab_to_session.clear()
+        self.session_info.clear()
+        self.session_state.clear()
+        self.last_active.clear()
+        self.suspended.clear()
+        self.current_session = None
         Session_eb.all_sessions_closed.emit()
 
     # --------------------------------------------------------
@@ -181,6 +363,11 @@ class SessionManager(LabWindow):
         if not session_id:
             return
 
+        if session_id in self.session_info:
+            self.session_info[session_id]["title"] = new_title
+        if session_id in self.suspended:
+            self.suspended[session_id]["title"] = new_title
+
         widget = self.sessions.get(session_id)
         if widget:
             widget.title = new_title
@@ -188,4 +375,3 @@ class SessionManager(LabWindow):
     def _close_external_if_matches(self, session_id, widget):
         if widget and getattr(widget, "session_id", None) == session_id:
             widget._terminate_process()
-
@@ -0,0 +1,71 @@
+# core/lab_and_session_manager/worker_bootstrap.py
+#
+# Entry point of a pooled worker interpreter (see worker_pool.py).
+# Imports the heavy GUI modules up front, then blocks on stdin until the
+# pool hands it a subapp to run. Runs exactly one subapp, then exits.
+
+import json
+import os
+import runpy
+import sys
+from pathlib import Path
+
+
+def preload(modules):
+    for name in modules:
+        try:
+            __import__(name)
+        except Exception:
+            # A missing toolkit only means that import is paid later (or never)
+            pass
+
+
+def silence_stdio():
+    """
+    Point fd 1 / 2 at devnull while the worker sits idle. Nobody drains the
+    pipes until a session attaches, so import noise must not land there.
+    Returns the saved descriptors for restore_stdio().
+    """
+    saved = (os.dup(1), os.dup(2))
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+    return saved
+
+
+def restore_stdio(saved):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for fd, original in zip((1, 2), saved):
+        os.dup2(original, fd)
+        os.close(original)
+
+
+def main() -> int:
+    saved = silence_stdio()
+    preload(sys.argv[1:])
+
+    line = sys.stdin.readline()
+    restore_stdio(saved)
+    if not line.strip():
+        # Pool shut down before this worker was used
+        return 0
+
+    job = json.loads(line)
+    app_path = Path(job["path"])
+
+    # Make the process look like `python <main.py>` started from the app folder
+    os.chdir(job.get("cwd") or str(app_path.parent))
+    sys.argv = [str(app_path)] + list(job.get("args", []))
+    sys.path[0] = str(app_path.parent)
+
+    sys.stdin.close()
+    sys.stdin = open(os.devnull, "r")
+
+    runpy.run_path(str(app_path), run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+# core/lab_and_session_manager/worker_pool.py
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+BOOTSTRAP = Path(__file__).resolve().parent / "worker_bootstrap.py"
+SIZE_ENV_VAR = "TOOLKIT_WORKER_POOL_SIZE"     # idle workers kept warm, "0" turns the pool off
+
+
+class WorkerPool:
+    """
+    Keeps `size` Python interpreters pre-spawned with tkinter / PySide6 / PIL
+    already imported, so an external subapp session starts without paying
+    for interpreter startup and toolkit imports.
+
+    Workers are single-use: a subapp owns process-wide state (QApplication,
+    Tk root, module globals) that cannot be torn down safely, so each worker
+    runs one session and exits. The pool is refilled right after every
+    dispatch, which keeps the next launch warm.
+    """
+
+    DEFAULT_SIZE = 2
+    DEFAULT_PRELOAD = ("tkinter", "PySide6.QtWidgets", "PIL.Image")
+    LAUNCH_ATTEMPTS = 3     # idle worker, then cold spawns, before giving up
+
+    def __init__(self, size: int = DEFAULT_SIZE, preload=DEFAULT_PRELOAD):
+        self.size = max(0, int(size))
+        self.preload = tuple(preload)
+        self._idle: List[subprocess.Popen] = []
+        self._started = False
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def start(self):
+        """Spawn idle workers up to the pool size."""
+        self._started = True
+        self._refill()
+
+    def resize(self, size: int):
+        self.size = max(0, int(size))
+        while len(self._idle) > self.size:
+            self._retire(self._idle.pop())
+        if self._started:
+            self._refill()
+
+    def launch(self, app_path: Path, cwd: Optional[Path] = None, args=()) -> subprocess.Popen:
+        """
+        Run `app_path` in a warm worker (or a fresh one if none is ready).
+        Returns the worker's Popen; it behaves like `python app_path`.
+        """
+        app_path = Path(app_path)
+        job = {
+            "path": str(app_path),
+            "cwd": str(cwd or app_path.parent),
+            "args": list(args),
+        }
+        payload = (json.dumps(job) + "\n").encode("utf-8")
+
+        error = None
+        for attempt in range(self.LAUNCH_ATTEMPTS):
+            worker = (self._take_idle() if attempt == 0 else None) or self._spawn()
+            try:
+                worker.stdin.write(payload)
+                worker.stdin.flush()
+                worker.stdin.close()
+            except OSError as e:
+                print(f"[WorkerPool] Worker {worker.pid} unusable ({e}), starting a cold one")
+                self._retire(worker)
+                error = e
+                continue
+
+            if self._started:
+                self._refill()
+            return worker
+
+        raise OSError(f"Could not start a worker for {app_path.name}: {error}")
+
+    def shutdown(self):
+        """Stop all idle workers (running sessions are left to their owners)."""
+        self._started = False
+        while self._idle:
+            self._retire(self._idle.pop())
+
+    def idle_count(self) -> int:
+        self._idle = [w for w in self._idle if w.poll() is None]
+        return len(self._idle)
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, str(BOOTSTRAP), *self.preload],
+            cwd=str(BOOTSTRAP.parent),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def _take_idle(self) -> Optional[subprocess.Popen]:
+        while self._idle:
+            worker = self._idle.pop(0)
+            if worker.poll() is None:
+                return worker
+            print(f"[WorkerPool] Idle worker {worker.pid} died (code {worker.returncode}), discarding")
+        return None
+
+    def _refill(self):
+        self.idle_count()
+        while len(self._idle) < self.size:
+            try:
+                self._idle.append(self._spawn())
+            except OSError as e:
+                print(f"[WorkerPool] Failed to spawn worker: {e}")
+                break
+
+    def _retire(self, worker: subprocess.Popen):
+        try:
+            if worker.stdin and not worker.stdin.closed:
+                worker.stdin.close()   # EOF -> bootstrap exits cleanly
+            worker.wait(timeout=1)
+        except Exception:
+            try:
+                worker.kill()
+            except Exception:
+                pass
+
+
+# -------------------------
+# Process-wide pool
+# -------------------------
+_pool: Optional[WorkerPool] = None
+
+def configured_pool_size() -> int:
+    """Pool size from TOOLKIT_WORKER_POOL_SIZE, or WorkerPool.DEFAULT_SIZE."""
+    value = os.environ.get(SIZE_ENV_VAR, "").strip()
+    if not value:
+        return WorkerPool.DEFAULT_SIZE
+    try:
+        return max(0, int(value))
+    except ValueError:
+        print(f"[WorkerPool] Ignoring {SIZE_ENV_VAR}={value!r}, using {WorkerPool.DEFAULT_SIZE}")
+        return WorkerPool.DEFAULT_SIZE
+
+def get_worker_pool() -> WorkerPool:
+    global _pool
+    if _pool is None:
+        _pool = WorkerPool(configured_pool_size())
+    return _pool
@@ -1,3 +1,5 @@
+import os
+
 from PySide6.QtCore import QObject, Signal
 
 class HeaderEventBus(QObject):
@@ -43,6 +45,10 @@ class LabEventBus(QObject):
     incognito_lab = Signal(dict)  
     # selected_lab = Signal()
 
+    # ---Batch Signals---
+    open_labs = Signal(list)            # [app_id | {"app_id", "title", "id"}], one pass
+    close_labs = Signal(list)           # [lab_id]
+
 class LabPillEventBus(QObject):
 
     new_pill = Signal(object)
@@ -54,6 +60,9 @@ class LabPillEventBus(QObject):
     reorder_pills = Signal(int, int)
     incognito_pill = Signal(object)
 
+    add_pills = Signal(list)            # [pill info], added with a single relayout
+    remove_pills = Signal(list)         # [lab_id]
+
 
 
 class LabSessionEventBus(QObject):
@@ -64,6 +73,9 @@ class LabSessionEventBus(QObject):
     rename_session = Signal(dict)
     close_all_sessions = Signal() 
 
+    add_sessions = Signal(list)         # [session info], built with updates disabled
+    close_sessions = Signal(list)       # [lab_id]
+
     session_closed = Signal(str)   
     all_sessions_closed = Signal()
     
@@ -76,6 +88,10 @@ class MarketplaceEventBus(QObject):
 
     nav_selection_page = Signal(str)  # page name
 
+class SubAppEventBus(QObject):
+
+    registry_changed = Signal()  # subapps.json content changed (rescan / add / remove)
+
 
 Header_eb = HeaderEventBus()
 LeftPanel_eb = LeftPanelEventBus()
@@ -85,3 +101,11 @@ Save_eb = SaveFileEventBus()
 marketplace_eb = MarketplaceEventBus()
 Session_eb = LabSessionEventBus()
 Pill_eb = LabPillEventBus()
+SubApp_eb = SubAppEventBus()
+
+
+# Opt-in: wrap the buses to time every handler (see core/bus_instrumentation.py).
+# Must happen here, before any module binds the bus names on import.
+if os.environ.get("TOOLKIT_BUS_STATS"):
+    from core.bus_instrumentation import instrument_buses
+    instrument_buses(globals(), os.environ["TOOLKIT_BUS_STATS"])
@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+from core.subapp_manager.subapp_registry import get_subapp_registry
+
 class GetAppInfo:
     def __init__(self, app_id, profile_path: Path):
         self.app_id = app_id
@@ -14,14 +15,9 @@ class GetAppInfo:
         if profile_path is None:
             raise ValueError("profile_path cannot be None")
 
-        apps_file = (
-            profile_path / "data" / "json_data" / "subapps.json"
-        )
-
-        if not apps_file.exists():
-            raise FileNotFoundError(f"{apps_file} not found")
-
-        with open(apps_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Served from the shared in-memory registry, no per-call parse
+        registry = get_subapp_registry(profile_path)
+        if not registry.available():
+            raise FileNotFoundError(f"{registry.apps_file} not found")
 
-        return data.get(app_id)
+        return registry.get_app(app_id)
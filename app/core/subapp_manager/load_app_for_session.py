@@ -8,17 +8,16 @@ from pathlib import Path
 from typing import Optional
 
 
-# ---------- Utility: dynamic loader for Qt widgets ----------
-def load_app_widget(path: Path):
-    """
-    Try to import a Python file and return an instance of a Qt widget/class.
-    Looks for names: AppMain, MainWidget, MainWindow, Window.
-    Raises ValueError if not found or not a QWidget/QMainWindow subclass.
-    """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"{path} does not exist")
+# ---------- Module cache ----------
+# resolved path -> (mtime_ns, executed module)
+# A second session of the same app reuses the module and only builds a new widget.
+_module_cache = {}
+
+# Candidate attribute names (common conventions)
+CANDIDATES = ["AppMain", "MainWidget", "MainWindow", "Window"]
 
+
+def _exec_module(path: Path):
     # Create unique module name based on absolute path (to avoid collisions)
     mod_name = f"dynamic_app_{abs(hash(str(path)))}"
 
@@ -33,11 +32,52 @@ def load_app_widget(path: Path):
         # Importing ran code and failed (or main guarded code used __name__ check)
         # Re-raise so caller knows embedding failed.
         raise ImportError(f"Import failed for {path!s}: {e}") from e
+    return module
+
+
+def _get_module(path: Path):
+    """Return the executed module for `path`, re-executing only if the file changed."""
+    path = path.resolve()
+    mtime_ns = path.stat().st_mtime_ns
+
+    cached = _module_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    module = _exec_module(path)
+    _module_cache[path] = (mtime_ns, module)
+    return module
+
+
+def reload_app_module(path: Path):
+    """
+    Developer hook: drop the cached module for `path` and execute it again.
+    Widgets opened afterwards use the fresh code; already open ones keep theirs.
+    """
+    path = Path(path).resolve()
+    _module_cache.pop(path, None)
+    return _get_module(path)
+
+
+def clear_module_cache():
+    _module_cache.clear()
+
+
+# ---------- Utility: dynamic loader for Qt widgets ----------
+def load_app_widget(path: Path):
+    """
+    Try to import a Python file and return an instance of a Qt widget/class.
+    Looks for names: AppMain, MainWidget, MainWindow, Window.
+    Raises ValueError if not found or not a QWidget/QMainWindow subclass.
+    The module is executed once per file version (see _module_cache).
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"{path} does not exist")
 
-    # Candidate attribute names (common conventions)
-    candidates = ["AppMain", "MainWidget", "MainWindow", "Window"]
+    module = _get_module(path)
 
-    for name in candidates:
+    for name in CANDIDATES:
         cls_or_obj = getattr(module, name, None)
         if cls_or_obj is None:
             continue
@@ -47,8 +87,10 @@ def load_app_widget(path: Path):
             if isinstance(cls_or_obj, type):
                 instance = cls_or_obj()
             else:
-                # could be a pre-created widget instance
+                # could be a pre-created widget instance; it can only be
+                # handed out once, so don't keep the module for next time
                 instance = cls_or_obj
+                _module_cache.pop(path.resolve(), None)
         except Exception as e:
             raise RuntimeError(f"Failed to instantiate {name}: {e}") from e
 
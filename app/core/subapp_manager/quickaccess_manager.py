@@ -4,6 +4,14 @@ from pathlib import Path
 from typing import Dict, Optional
 import tempfile
 import shutil
+import sys
+
+if __name__ == "__main__":
+    ROOT_DIR = Path(__file__).resolve().parents[2]
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+
+from core.subapp_manager.subapp_registry import get_subapp_registry
 
 
 class QuickAccessManager:
@@ -31,6 +39,7 @@ class QuickAccessManager:
         self.profile_path = profile_path.resolve()
         self.quick_file = self.profile_path / "data" / "json_data" / self.FILENAME
         self.subapp_file = self.profile_path / "data" / "json_data" / "subapps.json"
+        self.registry = get_subapp_registry(self.profile_path)
         print(self.quick_file, self.subapp_file)
 
         self._data: Dict[str, Dict[str, int | bool]] = {}
@@ -42,12 +51,12 @@ class QuickAccessManager:
     # ---------------------------------------------------
     def load_or_rebuild(self):
         """Load quickaccess.json or rebuild from subapps.json."""
-        if not self.subapp_file.exists():
+        if not self.registry.available():
             print("[QuickAccess] ERROR: subapps.json not found")
             self._data = {}
             return
 
-        subapps = json.loads(self.subapp_file.read_text(encoding="utf-8"))
+        subapps = self.registry.get_apps()
 
         if not self.quick_file.exists():
             print("[QuickAccess] quickaccess.json not found → creating with defaults...")
@@ -5,23 +5,60 @@ import shutil
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Any
 import tempfile
+import sys
 
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal, Slot
 
-class SubAppManager:
+if __name__ == "__main__":
+    ROOT_DIR = Path(__file__).resolve().parents[2]
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+
+from core.subapp_manager.subapp_registry import get_subapp_registry
+from core.signal_manager import SubApp_eb
+
+
+class SubAppScanThread(QThread):
+    """Runs the incremental folder scan off the UI thread."""
+    scan_finished = Signal(object, object)   # found apps, new manifest
+
+    def __init__(self, manager: "SubAppManager", manifest: dict):
+        super().__init__(manager)
+        self.manager = manager
+        self.manifest = manifest
+
+    def run(self):
+        found, manifest = self.manager._scan(self.manifest, self.isInterruptionRequested)
+        if self.isInterruptionRequested():
+            # Partial result: keep the registry and manifest as they were
+            return
+        self.scan_finished.emit(found, manifest)
+
+
+class SubAppManager(QObject):
     """
     Manage profile-based subapp registry stored at <profile>/apps.json
     Scans both main_subapp and load_subapp folders in project root/Subapp
     Only requires main.py + info.json (id & name). Icon optional.
+
+    A scan manifest (<profile>/.../subapps_manifest.json) remembers a stat
+    fingerprint per subapp folder, so only folders that changed since the
+    last scan have their info.json read again.
     """
 
     APPS_FILENAME = "subapps.json"
+    MANIFEST_FILENAME = "subapps_manifest.json"
     SUBAPP_FOLDERS = ["main_subapp", "load_subapp"]
     INFO_FOLDERNAME = "appinfoft"
     INFO_FILENAME = "info.json"
+    STOP_SCAN_TIMEOUT_MS = 2000     # longest shutdown waits on an interrupted rescan
 
-    def __init__(self, profile_path: Path):
+    def __init__(self, profile_path: Path, background_scan: bool = True):
+        super().__init__()
         self.profile_path = profile_path.resolve()
         self.apps_file = self.profile_path / "data" /"json_data" /self.APPS_FILENAME
+        self.manifest_file = self.profile_path / "data" / "json_data" / self.MANIFEST_FILENAME
+        self.registry = get_subapp_registry(self.profile_path)
 
         # Determine root folder from manager location
         self.project_root = Path(__file__).resolve().parents[3]  # App/core/subapp_manager -> Root Dir
@@ -30,9 +67,20 @@ class SubAppManager:
         print(f"[SubAppProfileManager] Subapps root: {self.subapps_root}")
 
         self._data: Dict[str, Dict[str, str]] = {}
+        self._manifest: Dict[str, dict] = self._load_manifest()
+        self._scan_thread: Optional[SubAppScanThread] = None
+
+        # A scan still running at shutdown must finish before Qt tears down
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_background_rescan)
 
         # Load existing apps.json or rebuild from scan
-        self.load_or_rebuild()
+        rebuilt = self.load_or_rebuild()
+
+        # Pick up added/removed subapps without blocking startup
+        if background_scan and not rebuilt:
+            self.start_background_rescan()
 
     # -------------------------
     # Public methods
@@ -46,28 +94,29 @@ class SubAppManager:
     # -------------------------
     # Load / Save
     # -------------------------
-    def load_or_rebuild(self):
+    def load_or_rebuild(self) -> bool:
+        """Returns True when the registry had to be rebuilt from a full scan."""
         if not self.apps_file.exists():
             print("[SubAppProfileManager] apps.json not found, scanning subapps...")
             self._data = {}
             self.rebuild_from_scan()
-            return
+            return True
 
         try:
-            data = json.loads(self.apps_file.read_text(encoding="utf-8"))
-            if not isinstance(data, dict):
-                raise ValueError("apps.json root must be dict")
-            self._data = data
+            # Parsed once here; QuickAccessManager, GetAppInfo and the icon panel read the cached copy
+            self._data = self.registry.reload()
         except Exception as e:
             print(f"[SubAppProfileManager] Failed to load apps.json ({e}), rebuilding...")
             self._data = {}
             self.rebuild_from_scan()
-            return
+            return True
 
-        removed = self._validate_and_clean()
+        removed, updated = self._validate_and_clean()
         if removed:
             print(f"[SubAppProfileManager] Removed invalid apps from apps.json: {removed}")
+        if removed or updated:
             self._atomic_save()
+        return False
 
     def _atomic_save(self):
         tmp_fd, tmp_path = tempfile.mkstemp(prefix="apps_", suffix=".json", dir=str(self.profile_path))
@@ -83,35 +132,92 @@ class SubAppManager:
                     Path(tmp_path).unlink()
                 except Exception:
                     pass
+        self.registry.set_apps(self._data)
+
+    # -------------------------
+    # Scan manifest
+    # -------------------------
+    def _load_manifest(self) -> Dict[str, dict]:
+        try:
+            manifest = json.loads(self.manifest_file.read_text(encoding="utf-8"))
+            if isinstance(manifest, dict):
+                return manifest
+        except Exception:
+            pass
+        return {}
+
+    def _save_manifest(self):
+        tmp_fd, tmp_path = tempfile.mkstemp(prefix="manifest_", suffix=".json", dir=str(self.profile_path))
+        try:
+            with open(tmp_fd, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, indent=2, ensure_ascii=False)
+            shutil.move(tmp_path, str(self.manifest_file))
+        except Exception as e:
+            print(f"[SubAppProfileManager] Failed to save scan manifest: {e}")
+        finally:
+            if Path(tmp_path).exists():
+                try:
+                    Path(tmp_path).unlink()
+                except Exception:
+                    pass
+
+    def _fingerprint(self, folder: Path) -> list:
+        """
+        Cheap stat-only fingerprint of a subapp folder: folder, main.py,
+        appinfoft/ (icon added/removed) and info.json (content edited).
+        """
+        parts = []
+        for p in (folder,
+                  folder / "main.py",
+                  folder / self.INFO_FOLDERNAME,
+                  folder / self.INFO_FOLDERNAME / self.INFO_FILENAME):
+            try:
+                st = p.stat()
+                parts.append([st.st_mtime_ns, st.st_size])
+            except OSError:
+                parts.append(None)
+        return parts
 
     # -------------------------
     # Validation / Scan
     # -------------------------
-    def _validate_and_clean(self) -> list:
+    def _validate_and_clean(self) -> Tuple[list, list]:
+        """Returns (removed app ids, app ids whose entry was refreshed)."""
         removed = []
+        updated = []
+        manifest_changed = False
         for app_id, meta in list(self._data.items()):
             main_path = Path(meta.get("main", ""))
-            info_path = Path(meta.get("info", ""))
-            icon_path = Path(meta.get("icon", "")) if meta.get("icon") else None
+            folder = main_path.parent
+
+            # Unchanged since the last scan -> trust the manifest, skip reading info.json
+            record = self._manifest.get(str(folder))
+            fingerprint = self._fingerprint(folder)
+            if record and record.get("app_id") == app_id and record.get("fingerprint") == fingerprint:
+                continue
 
-            if not main_path.exists() or not info_path.exists():
+            if not main_path.exists():
                 print(f"[SubAppProfileManager] Removing {app_id}: main.py or info.json missing")
                 removed.append(app_id)
                 self._data.pop(app_id, None)
                 continue
 
-            try:
-                info_obj = json.loads(info_path.read_text(encoding="utf-8"))
-                if not {"id", "name"}.issubset(info_obj.keys()):
-                    print(f"[SubAppProfileManager] Removing {app_id}: info.json missing required keys")
-                    removed.append(app_id)
-                    self._data.pop(app_id, None)
-            except Exception:
-                print(f"[SubAppProfileManager] Removing {app_id}: info.json corrupt")
+            # Folder changed (or was never fingerprinted) -> re-read it like a scan would
+            scanned_id, entry = self._scan_folder(folder)
+            self._manifest[str(folder)] = {"fingerprint": fingerprint, "app_id": scanned_id, "entry": entry}
+            manifest_changed = True
+
+            if scanned_id != app_id:
+                print(f"[SubAppProfileManager] Removing {app_id}: info.json missing, corrupt or id changed")
                 removed.append(app_id)
                 self._data.pop(app_id, None)
+            elif entry != meta:
+                self._data[app_id] = entry
+                updated.append(app_id)
 
-        return removed
+        if manifest_changed:
+            self._save_manifest()
+        return removed, updated
 
     def rebuild_from_scan(self) -> Dict[str, Dict[str, str]]:
         """
@@ -119,7 +225,24 @@ class SubAppManager:
         Only folders with main.py + info.json (with id & name) are added.
         Icon optional.
         """
+        found, self._manifest = self._scan(dict(self._manifest))
+
+        self._data = found
+        self._atomic_save()
+        self._save_manifest()
+        print(f"[SubAppProfileManager] Rebuilt apps.json with {len(found)} apps")
+        return found
+
+    def _scan(self, manifest: Dict[str, dict], should_stop=lambda: False) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+        """
+        Walk both subapp folders and return (found apps, new manifest).
+        Folders whose fingerprint matches the manifest reuse the recorded
+        result instead of touching appinfoft/ and info.json.
+        Safe to run off the UI thread: only reads the filesystem. Stops
+        early (with a partial result) once `should_stop()` returns True.
+        """
         found = {}
+        new_manifest = {}
 
         for subfolder_name in self.SUBAPP_FOLDERS:
             folder_root = self.subapps_root / subfolder_name
@@ -128,48 +251,62 @@ class SubAppManager:
                 continue
 
             for folder in sorted(folder_root.iterdir()):
+                if should_stop():
+                    return found, new_manifest
                 if not folder.is_dir():
                     continue
 
-                print(f"[SubAppProfileManager] Scanning subapp: {folder.name}")
-                main_file = folder / "main.py"
-                info_folder = folder / self.INFO_FOLDERNAME
-                info_file = info_folder / self.INFO_FILENAME
-                icon_file = None
-
-                # optional icon: pick first file that is not info.json
-                if info_folder.exists():
-                    for f in info_folder.iterdir():
-                        if f.is_file() and f.name != self.INFO_FILENAME:
-                            icon_file = f
-                            break
-
-                if not main_file.exists() or not info_file.exists():
-                    print(f"  Skipping {folder.name}: main.py or info.json missing")
+                key = str(folder)
+                fingerprint = self._fingerprint(folder)
+                record = manifest.get(key)
+                if record and record.get("fingerprint") == fingerprint:
+                    if record.get("app_id"):
+                        found[record["app_id"]] = record["entry"]
+                    new_manifest[key] = record
                     continue
 
-                name, info_obj = self._read_info_json(info_file)
-                if not info_obj:
-                    print(f"  Skipping {folder.name}: info.json missing id/name")
-                    continue
+                print(f"[SubAppProfileManager] Scanning subapp: {folder.name}")
+                app_id, entry = self._scan_folder(folder)
+                if app_id:
+                    found[app_id] = entry
+                new_manifest[key] = {"fingerprint": fingerprint, "app_id": app_id, "entry": entry}
 
-                app_id = info_obj["id"].lower()
-                entry = {
-                    "main": str(main_file.resolve()),
-                    "info": str(info_file.resolve()),
-                    "id": info_obj["id"],
-                    "name": info_obj["name"]
-                }
-                if icon_file:
-                    entry["icon"] = str(icon_file.resolve())
+        return found, new_manifest
 
-                found[app_id] = entry
-                print(f"  Added {app_id}: main.py + info.json{', icon found' if icon_file else ''}")
+    def _scan_folder(self, folder: Path) -> Tuple[Optional[str], Optional[dict]]:
+        main_file = folder / "main.py"
+        info_folder = folder / self.INFO_FOLDERNAME
+        info_file = info_folder / self.INFO_FILENAME
+        icon_file = None
 
-        self._data = found
-        self._atomic_save()
-        print(f"[SubAppProfileManager] Rebuilt apps.json with {len(found)} apps")
-        return found
+        # optional icon: pick first file that is not info.json
+        if info_folder.exists():
+            for f in info_folder.iterdir():
+                if f.is_file() and f.name != self.INFO_FILENAME:
+                    icon_file = f
+                    break
+
+        if not main_file.exists() or not info_file.exists():
+            print(f"  Skipping {folder.name}: main.py or info.json missing")
+            return None, None
+
+        name, info_obj = self._read_info_json(info_file)
+        if not info_obj:
+            print(f"  Skipping {folder.name}: info.json missing id/name")
+            return None, None
+
+        app_id = info_obj["id"].lower()
+        entry = {
+            "main": str(main_file.resolve()),
+            "info": str(info_file.resolve()),
+            "id": info_obj["id"],
+            "name": info_obj["name"]
+        }
+        if icon_file:
+            entry["icon"] = str(icon_file.resolve())
+
+        print(f"  Added {app_id}: main.py + info.json{', icon found' if icon_file else ''}")
+        return app_id, entry
 
     def _read_info_json(self, info_file: Path) -> Tuple[Optional[str], Optional[Any]]:
         try:
@@ -180,6 +317,54 @@ class SubAppManager:
         except Exception:
             return None, None
 
+    # -------------------------
+    # Background rescan
+    # -------------------------
+    def start_background_rescan(self):
+        """Rescan subapp folders on a worker thread; emits SubApp_eb.registry_changed if anything changed."""
+        if self._scan_thread is not None:
+            if self._scan_thread.isRunning():
+                return
+            self._scan_thread.deleteLater()
+        self._scan_thread = SubAppScanThread(self, dict(self._manifest))
+        self._scan_thread.scan_finished.connect(self._on_scan_finished)
+        self._scan_thread.start()
+
+    def stop_background_rescan(self):
+        """
+        Interrupt a running rescan and wait for it to stop, at most
+        STOP_SCAN_TIMEOUT_MS (connected to aboutToQuit).
+        """
+        thread = self._scan_thread
+        if thread is not None and thread.isRunning():
+            thread.requestInterruption()
+            if not thread.wait(self.STOP_SCAN_TIMEOUT_MS):
+                print("[SubAppProfileManager] Rescan still running at shutdown, not waiting for it")
+
+    @Slot(object, object)
+    def _on_scan_finished(self, found: dict, manifest: dict):
+        # Keep apps registered through add_app() from outside the scanned roots
+        for app_id, meta in self._data.items():
+            if app_id not in found and not self._is_under_subapps_root(meta.get("main", "")):
+                found[app_id] = meta
+
+        if manifest != self._manifest:
+            self._manifest = manifest
+            self._save_manifest()
+
+        if found != self._data:
+            print(f"[SubAppProfileManager] Rescan found changes ({len(self._data)} -> {len(found)} apps)")
+            self._data = found
+            self._atomic_save()
+            SubApp_eb.registry_changed.emit()
+
+    def _is_under_subapps_root(self, path: str) -> bool:
+        try:
+            Path(path).resolve().relative_to(self.subapps_root)
+            return True
+        except (ValueError, OSError):
+            return False
+
     # -------------------------
     # Add / Remove API
     # -------------------------
@@ -218,6 +403,7 @@ class SubAppManager:
 
         self._data[app_id] = entry
         self._atomic_save()
+        SubApp_eb.registry_changed.emit()
         return True, f"App '{app_id}' added"
 
     def remove_app(self, app_id: str) -> Tuple[bool, str]:
@@ -226,6 +412,7 @@ class SubAppManager:
             return False, "App not found in profile"
         self._data.pop(app_id, None)
         self._atomic_save()
+        SubApp_eb.registry_changed.emit()
         return True, f"Removed '{app_id}'"
 
 
@@ -234,6 +421,6 @@ class SubAppManager:
 # -------------------------
 if __name__ == "__main__":
     test_profile = Path("Z:/Project/Toolkit/data/Profile-2")
-    manager = SubAppManager(test_profile)
+    manager = SubAppManager(test_profile, background_scan=False)
     apps = manager.get_apps()
     print("Registered apps:", apps)
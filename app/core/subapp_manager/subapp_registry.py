@@ -0,0 +1,161 @@
+# app/core/subapp_manager/subapp_registry.py
+from __future__ import annotations
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class SubAppRegistry:
+    """
+    Process-wide, in-memory view of <profile>/data/json_data/subapps.json.
+
+    The file is parsed once and every lookup is served from memory.
+    The cached copy is dropped when the file's mtime/size changes on disk
+    (checked at most every STAT_INTERVAL seconds) or when the owner
+    (SubAppManager) hands over freshly saved data via set_apps().
+    """
+
+    APPS_FILENAME = "subapps.json"
+    STAT_INTERVAL = 2.0
+
+    def __init__(self, profile_path: Path):
+        self.profile_path = Path(profile_path).resolve()
+        self.apps_file = self.profile_path / "data" / "json_data" / self.APPS_FILENAME
+
+        self._lock = threading.RLock()
+        self._data: Optional[Dict[str, dict]] = None
+        self._icons: Optional[List[dict]] = None
+        self._stamp = None          # (mtime_ns, size) of the file we parsed
+        self._last_stat = 0.0
+
+    # -------------------------
+    # Public methods
+    # -------------------------
+    def available(self) -> bool:
+        self._refresh()
+        return self._data is not None
+
+    def get_apps(self) -> Dict[str, dict]:
+        self._refresh()
+        return dict(self._data or {})
+
+    def get_app(self, app_id: str) -> Optional[dict]:
+        self._refresh()
+        if not self._data:
+            return None
+        app = self._data.get(app_id)
+        return dict(app) if app is not None else None
+
+    def get_icon_entries(self) -> List[dict]:
+        """Apps that have an id, name and an icon file that exists (resolved once per load)."""
+        self._refresh()
+        with self._lock:
+            if self._icons is None:
+                self._icons = self._build_icon_entries(self._data or {})
+            return list(self._icons)
+
+    def reload(self) -> Dict[str, dict]:
+        """
+        Force a parse of subapps.json and return its content.
+        Raises FileNotFoundError / ValueError so the owner can decide to rebuild.
+        """
+        with self._lock:
+            self._load()
+            return dict(self._data)
+
+    def set_apps(self, data: Dict[str, dict]):
+        """Adopt data that was just written to subapps.json (avoids re-parsing our own save)."""
+        with self._lock:
+            self._data = dict(data)
+            self._icons = None
+            self._stamp = self._file_stamp()
+            self._last_stat = time.monotonic()
+
+    def invalidate(self):
+        with self._lock:
+            self._data = None
+            self._icons = None
+            self._stamp = None
+            self._last_stat = 0.0
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _file_stamp(self):
+        try:
+            st = self.apps_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._stamp is not None and now - self._last_stat < self.STAT_INTERVAL:
+                return
+            self._last_stat = now
+
+            stamp = self._file_stamp()
+            if stamp is None:
+                self._data, self._icons, self._stamp = None, None, None
+                return
+            if stamp == self._stamp:
+                return
+
+            try:
+                self._load()
+            except Exception as e:
+                print(f"[SubAppRegistry] Failed to load {self.apps_file.name}: {e}")
+                self._data, self._icons = None, None
+                self._stamp = stamp      # don't retry a broken file until it changes
+
+    def _load(self):
+        stamp = self._file_stamp()
+        if stamp is None:
+            raise FileNotFoundError(f"{self.apps_file} not found")
+
+        data = json.loads(self.apps_file.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.APPS_FILENAME} root must be dict")
+
+        self._data = data
+        self._icons = None
+        self._stamp = stamp
+        self._last_stat = time.monotonic()
+
+    def _build_icon_entries(self, data: Dict[str, dict]) -> List[dict]:
+        icon_list = []
+        for item in data.values():
+            if not isinstance(item, dict):
+                continue
+            if not all(k in item for k in ("id", "name", "icon")):
+                continue
+            icon_path = Path(item["icon"].replace("\\", "/")).resolve()
+            if icon_path.exists():
+                icon_list.append({
+                    "id": item["id"],
+                    "name": item["name"],
+                    "icon": icon_path
+                })
+            else:
+                print(f"[SubAppRegistry] Icon file not found for {item['name']}: {icon_path}")
+        return icon_list
+
+
+# -------------------------
+# Process-wide access
+# -------------------------
+_registries: Dict[Path, SubAppRegistry] = {}
+_registries_lock = threading.Lock()
+
+def get_subapp_registry(profile_path: Path) -> SubAppRegistry:
+    """Return the shared registry for a profile, creating it on first use."""
+    key = Path(profile_path).resolve()
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = SubAppRegistry(key)
+            _registries[key] = registry
+        return registry
@@ -0,0 +1,232 @@
+# core/userdata_manager/transcript_store.py
+from __future__ import annotations
+import json
+import struct
+import time
+import weakref
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtWidgets import QApplication
+
+
+class TranscriptStore:
+    """
+    Append-only transcript of one QuickLab lab.
+
+    <lab_id>.jsonl  one message per line: {"role", "text", "ts"}
+    <lab_id>.idx    byte offset of every line in the .jsonl, packed uint64
+
+    Sending a message appends one line and one offset, never rewriting
+    earlier history. The index lets a reopened lab read only the messages
+    it shows (the last screenful, then older pages on demand).
+    """
+
+    OFFSET = struct.Struct("<Q")
+
+    def __init__(self, directory: Path, lab_id: str):
+        self.directory = Path(directory)
+        self.lab_id = lab_id
+        self.log_file = self.directory / f"{lab_id}.jsonl"
+        self.index_file = self.directory / f"{lab_id}.idx"
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._offsets = self._load_index()
+        self.deleted = False
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def count(self) -> int:
+        return len(self._offsets)
+
+    def append(self, role: str, text: str) -> int:
+        """Persist a message, return its index in the transcript (-1 once deleted)."""
+        if self.deleted:
+            return -1
+        line = json.dumps({"role": role, "text": text, "ts": time.time()}, ensure_ascii=False)
+        data = (line + "\n").encode("utf-8")
+
+        # Log first, then index: a crash in between is repaired on next open
+        with open(self.log_file, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        with open(self.index_file, "ab") as f:
+            f.write(self.OFFSET.pack(offset))
+
+        self._offsets.append(offset)
+        return len(self._offsets) - 1
+
+    def read(self, start: int, end: int) -> List[dict]:
+        """Messages [start, end) in chronological order."""
+        start = max(0, start)
+        end = min(end, len(self._offsets))
+        if start >= end:
+            return []
+
+        begin = self._offsets[start]
+        stop = self._offsets[end] if end < len(self._offsets) else None
+
+        with open(self.log_file, "rb") as f:
+            f.seek(begin)
+            chunk = f.read() if stop is None else f.read(stop - begin)
+
+        messages = []
+        for raw in chunk.splitlines():
+            try:
+                message = json.loads(raw.decode("utf-8"))
+            except ValueError:
+                continue
+            messages.append({"role": message.get("role"), "text": message.get("text", "")})
+        return messages
+
+    def tail(self, n: int) -> List[dict]:
+        return self.read(self.count() - n, self.count())
+
+    def delete(self):
+        """Remove the transcript from disk. Later appends are dropped, so a
+        response finishing after its lab closed can't recreate the files."""
+        self.deleted = True
+        self._offsets = []
+        _remove_files(self.log_file, self.index_file)
+
+    # -------------------------
+    # Index maintenance
+    # -------------------------
+    def _load_index(self) -> List[int]:
+        offsets = []
+        if self.index_file.exists():
+            data = self.index_file.read_bytes()
+            usable = len(data) - len(data) % self.OFFSET.size
+            offsets = [o for (o,) in self.OFFSET.iter_unpack(data[:usable])]
+
+        log_size = self.log_file.stat().st_size if self.log_file.exists() else 0
+        if offsets and offsets[-1] >= log_size:
+            # Index points past the log: don't trust it
+            print(f"[TranscriptStore] Rebuilding index for {self.lab_id}")
+            offsets = []
+
+        repaired = self._index_tail(offsets, log_size)
+        if repaired is not None:
+            offsets = repaired
+            with open(self.index_file, "wb") as f:
+                f.write(b"".join(self.OFFSET.pack(o) for o in offsets))
+        return offsets
+
+    def _index_tail(self, offsets: List[int], log_size: int) -> Optional[List[int]]:
+        """
+        Index complete lines written after the last indexed one and drop a
+        torn last line. Returns the new offsets, or None if nothing changed.
+        """
+        start = offsets[-1] if offsets else 0
+        if start >= log_size:
+            return None
+
+        with open(self.log_file, "rb") as f:
+            f.seek(start)
+            rest = f.read()
+
+        new_offsets = list(offsets)
+        changed = False
+        pos = start
+        for i, line in enumerate(rest.splitlines(keepends=True)):
+            if not line.endswith(b"\n"):
+                if i == 0 and offsets:
+                    # The torn line is the last indexed one: unindex it too
+                    new_offsets.pop()
+                with open(self.log_file, "r+b") as f:
+                    f.truncate(pos)
+                changed = True
+                break
+            if not (i == 0 and offsets):
+                new_offsets.append(pos)
+                changed = True
+            pos += len(line)
+
+        return new_offsets if changed else None
+
+
+def transcript_dir() -> Optional[Path]:
+    """<profile>/data/activity/transcripts for the running app, or None if no profile is set."""
+    profile_path = getattr(QApplication.instance(), "profile_path", None)
+    if not profile_path:
+        return None
+    return Path(profile_path) / "data" / "activity" / "transcripts"
+
+
+def _remove_files(*paths: Path):
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"[TranscriptStore] Could not delete {path}: {e}")
+
+
+# Stores currently open, so delete_transcript can stop their writes
+_open_stores: "weakref.WeakValueDictionary[str, TranscriptStore]" = weakref.WeakValueDictionary()
+
+def open_transcript_store(lab_id: str) -> Optional[TranscriptStore]:
+    directory = transcript_dir()
+    if directory is None or not lab_id:
+        return None
+    try:
+        store = TranscriptStore(directory, lab_id)
+    except OSError as e:
+        print(f"[TranscriptStore] Transcript disabled for {lab_id}: {e}")
+        return None
+    _open_stores[lab_id] = store
+    return store
+
+
+def delete_transcript(lab_id: str):
+    """Delete a closed lab's transcript, whether or not its store is open."""
+    store = _open_stores.pop(lab_id, None)
+    if store is not None:
+        store.delete()
+        return
+    directory = transcript_dir()
+    if directory is None or not lab_id:
+        return
+    _remove_files(directory / f"{lab_id}.jsonl", directory / f"{lab_id}.idx")
+
+
+def prune_transcripts(keep_ids) -> int:
+    """Delete transcripts of labs not in keep_ids (closed before transcripts were cleaned up)."""
+    directory = transcript_dir()
+    if directory is None or not directory.is_dir():
+        return 0
+    keep_ids = set(keep_ids)
+    removed = 0
+    for log_file in directory.glob("*.jsonl"):
+        lab_id = log_file.stem
+        if lab_id not in keep_ids and lab_id not in _open_stores:
+            _remove_files(log_file, directory / f"{lab_id}.idx")
+            removed += 1
+    return removed
+
+
+# -------------------------
+# TEST EXAMPLE
+# -------------------------
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TranscriptStore(Path(tmp), "lab")
+        store.append("sent", "hello")
+        store.append("received", "hi there")
+
+        # Crash mid-write: the last indexed line loses its newline and tail
+        data = store.log_file.read_bytes()
+        store.log_file.write_bytes(data[:-5])
+
+        reopened = TranscriptStore(Path(tmp), "lab")
+        assert reopened.count() == 1, reopened._offsets
+        assert reopened.read(0, 1) == [{"role": "sent", "text": "hello"}]
+        assert reopened.index_file.stat().st_size == TranscriptStore.OFFSET.size
+
+        # The next message gets a fresh offset, not the torn line's again
+        assert reopened.append("sent", "again") == 1
+        again = TranscriptStore(Path(tmp), "lab")
+        assert [m["text"] for m in again.read(0, again.count())] == ["hello", "again"]
+        print("Torn last line repaired:", again.read(0, again.count()))
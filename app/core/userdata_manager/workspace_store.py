@@ -0,0 +1,68 @@
+# core/userdata_manager/workspace_store.py
+from __future__ import annotations
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+class WorkspaceStore:
+    """
+    The open lab set of a profile, kept in <profile>/data/activity/workspace.json:
+
+        {
+          "version": 1,
+          "active": "<lab_id>",
+          "labs": [{"id", "title", "app_id", "transcript"?}, ...]    # tab order
+        }
+
+    Writes go to a temp file in the same folder and replace the old
+    snapshot in one rename, so a crash mid-write never leaves a torn file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def read(self) -> Optional[dict]:
+        """The saved workspace, or None if there is none (or it is unreadable)."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"[WorkspaceStore] Ignoring unreadable workspace {self.path}: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return None
+        if not isinstance(data.get("labs"), list):
+            return None
+        return data
+
+    def write(self, labs: list, active: Optional[str]) -> bool:
+        data = {"version": self.VERSION, "active": active, "labs": labs}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".workspace-", suffix=".tmp", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            return True
+        except OSError as e:
+            print(f"[WorkspaceStore] Could not save workspace: {e}")
+            return False
+
+
+def workspace_file(profile_path) -> Optional[Path]:
+    if not profile_path:
+        return None
+    return Path(profile_path) / "data" / "activity" / "workspace.json"
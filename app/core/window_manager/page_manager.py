@@ -1,25 +1,31 @@
 from PySide6.QtWidgets import QStackedWidget
 
 from gui.main_window.main_page import MainWindowPage
-from gui.app_setting.settings_page import SettingsPage
-from gui.market_place.marketplace_page import MarketPlacePage
 from core.signal_manager import Header_eb
 
 
+def _settings_page():
+    from gui.app_setting.settings_page import SettingsPage
+    return SettingsPage()
+
+def _marketplace_page():
+    from gui.market_place.marketplace_page import MarketPlacePage
+    return MarketPlacePage()
+
+
 class PageManager(QStackedWidget):
     def __init__(self):
         super().__init__()
         self.pages = {}
+        self.page_factories = {}
 
-        # Create all pages here
+        # Main page is visible at launch, build it right away
         self.main_page = MainWindowPage()
-        self.settings_page = SettingsPage()
-        self.marketplace_page = MarketPlacePage()  # Placeholder for MarketplacePage
-
-        # Add to the manager
         self.add_page("main", self.main_page)
-        self.add_page("settings", self.settings_page)
-        self.add_page("marketplace", self.marketplace_page)  # Placeholder 
+
+        # Rarely opened pages are built the first time they are shown
+        self.register_page("settings", _settings_page)
+        self.register_page("marketplace", _marketplace_page)
 
         # Connect Open signals
         Header_eb.open_settings_page.connect(lambda: self.show_page("settings"))
@@ -27,16 +33,38 @@ class PageManager(QStackedWidget):
 
         # Connect Back signal
         Header_eb.back_to_main_page.connect(lambda: self.show_page("main"))
-    
+
+    @property
+    def settings_page(self):
+        return self.get_page("settings")
+
+    @property
+    def marketplace_page(self):
+        return self.get_page("marketplace")
 
     def add_page(self, name: str, widget):
         self.pages[name] = widget
         self.addWidget(widget)
 
-    def show_page(self, name: str):
+    def register_page(self, name: str, factory):
+        """Register a page factory for lazy instantiation."""
+        self.page_factories[name] = factory
+
+    def get_page(self, name: str):
+        """Return the page widget, building it on first access."""
         if name in self.pages:
-            self.setCurrentWidget(self.pages[name])
-        else:
-            print(f"Page '{name}' not found")
+            return self.pages[name]
+
+        factory = self.page_factories.pop(name, None)
+        if factory is None:
+            return None
 
+        self.add_page(name, factory())
+        return self.pages[name]
 
+    def show_page(self, name: str):
+        page = self.get_page(name)
+        if page is not None:
+            self.setCurrentWidget(page)
+        else:
+            print(f"Page '{name}' not found")
@@ -0,0 +1,283 @@
+# app/gui/icon_cache.py
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QGuiApplication, QIcon, QImage, QImageReader, QPixmap
+
+
+def _stamp(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def as_size(size) -> QSize:
+    return size if isinstance(size, QSize) else QSize(int(size), int(size))
+
+
+def load_image(path: str, size: QSize, dpr: float = 1.0) -> QImage:
+    """
+    Decode `path` straight to `size` device-independent pixels at `dpr`
+    (aspect ratio kept). SVGs are rasterized at the target size instead of
+    their default size and then scaled.
+
+    Only uses QImage, so it is safe to call from a worker thread.
+    Returns a null QImage if the file can't be read.
+    """
+    target = QSize(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    native = reader.size()
+    if native.isValid() and not native.isEmpty():
+        reader.setScaledSize(native.scaled(target, Qt.KeepAspectRatio))
+
+    image = reader.read()
+    if image.isNull():
+        return image
+    if image.width() > target.width() or image.height() > target.height():
+        # Format without scaled-read support
+        image = image.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class IconCache:
+    """
+    Process-wide cache of rasterized icons.
+
+    Entries are keyed by (path, size, device pixel ratio, mtime), so an
+    icon is decoded once per size it is shown at and picked up again
+    if the file changes on disk. At most MAX_ENTRIES pixmaps are kept,
+    least recently used first out.
+
+    With a disk directory, rasterized SVGs are also written there as PNG
+    so the next run skips the SVG parser entirely. Writing a raster drops
+    the ones of older versions of the same file, and the directory is
+    trimmed to DISK_MAX_FILES (newest kept) once per run, which also
+    clears out icons of uninstalled apps.
+    """
+
+    MAX_ENTRIES = 512
+    DISK_FORMATS = (".svg", ".svgz")    # only these are worth a raster copy
+    DISK_MAX_FILES = 2000
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, disk_dir: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._disk_trimmed = False
+
+        self._lock = threading.Lock()
+        self._pixmaps: "OrderedDict[Tuple, QPixmap]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def pixmap(self, path, size, dpr: Optional[float] = None) -> QPixmap:
+        """Cached pixmap of `path` at `size` (int or QSize). Null pixmap if unreadable."""
+        path = str(path) if path else ""
+        size = as_size(size)
+        dpr = dpr or device_pixel_ratio()
+
+        key = self.key(path, size, dpr)
+        if key is None:
+            return QPixmap()
+
+        with self._lock:
+            pixmap = self._pixmaps.get(key)
+            if pixmap is not None:
+                self._pixmaps.move_to_end(key)
+                self.hits += 1
+                return pixmap
+            self.misses += 1
+
+        image = self.decode(key)
+        if image.isNull():
+            return QPixmap()
+        return self.insert(key, QPixmap.fromImage(image))
+
+    def icon(self, path, sizes: Iterable = (), dpr: Optional[float] = None) -> QIcon:
+        """
+        QIcon made of cached pixmaps, one per size in `sizes`
+        (e.g. a button's normal and hover icon sizes).
+        """
+        icon = QIcon()
+        for size in sizes:
+            pixmap = self.pixmap(path, size, dpr)
+            if not pixmap.isNull():
+                icon.addPixmap(pixmap)
+        return icon
+
+    def decode(self, key: Tuple) -> QImage:
+        """
+        Image for a cache key, from the disk cache or the source file.
+        Thread-safe (QImage only): loader threads call it, then hand the
+        result to insert() on the UI thread as a QPixmap.
+        """
+        image = self._load_from_disk(key)
+        if image is None:
+            path, width, height, dpr, _ = key
+            image = load_image(path, QSize(width, height), dpr)
+            if not image.isNull():
+                self._save_to_disk(key, image)
+        return image
+
+    def key(self, path: str, size: QSize, dpr: float) -> Optional[Tuple]:
+        """Cache key for a request, None if the file does not exist."""
+        mtime = _stamp(path) if path else None
+        if mtime is None:
+            return None
+        return (path, size.width(), size.height(), round(dpr, 2), mtime)
+
+    def insert(self, key: Tuple, pixmap: QPixmap) -> QPixmap:
+        """Add a pixmap decoded elsewhere (e.g. by a loader thread)."""
+        with self._lock:
+            self._pixmaps[key] = pixmap
+            self._pixmaps.move_to_end(key)
+            while len(self._pixmaps) > self.max_entries:
+                self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def cached(self, key: Tuple) -> Optional[QPixmap]:
+        with self._lock:
+            pixmap = self._pixmaps.get(key)
+            if pixmap is not None:
+                self._pixmaps.move_to_end(key)
+                self.hits += 1
+            return pixmap
+
+    def clear(self):
+        with self._lock:
+            self._pixmaps.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._pixmaps), "hits": self.hits, "misses": self.misses}
+
+    # -------------------------
+    # On-disk raster cache
+    # -------------------------
+    @staticmethod
+    def _disk_prefix(path: str) -> str:
+        return hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+
+    def _disk_file(self, key: Tuple, disk_dir: Optional[Path]) -> Optional[Path]:
+        """<path hash>-<mtime>-<w>x<h>@<dpr>.png, so one file's rasters can be found by prefix."""
+        if disk_dir is None or not key[0].lower().endswith(self.DISK_FORMATS):
+            return None
+        path, width, height, dpr, mtime = key
+        return disk_dir / f"{self._disk_prefix(path)}-{mtime}-{width}x{height}@{dpr}.png"
+
+    def _load_from_disk(self, key: Tuple) -> Optional[QImage]:
+        disk_file = self._disk_file(key, self.disk_dir)
+        if disk_file is None or not disk_file.exists():
+            return None
+        image = QImage(str(disk_file))
+        if image.isNull():
+            return None
+        image.setDevicePixelRatio(key[3])
+        return image
+
+    def _save_to_disk(self, key: Tuple, image: QImage):
+        # Loader threads call this concurrently: read disk_dir once, and write
+        # through a temp file of our own so two saves of one key can't mix
+        disk_dir = self.disk_dir
+        disk_file = self._disk_file(key, disk_dir)
+        if disk_file is None or disk_file.exists():
+            return
+        tmp = None
+        try:
+            disk_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=disk_dir)
+            os.close(fd)
+            if not image.save(tmp, "PNG"):
+                os.remove(tmp)
+                return
+            os.replace(tmp, disk_file)
+        except OSError as e:
+            with self._lock:
+                if self.disk_dir is not None:
+                    print(f"[IconCache] Disk cache disabled: {e}")
+                    self.disk_dir = None
+            if tmp is not None and os.path.exists(tmp):
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            return
+
+        self._drop_stale_rasters(key, disk_dir)
+        with self._lock:
+            trim, self._disk_trimmed = not self._disk_trimmed, True
+        if trim:
+            self._trim_disk(disk_dir)
+
+    def _drop_stale_rasters(self, key: Tuple, disk_dir: Path):
+        """Remove rasters of earlier versions (other mtimes) of the same source file."""
+        path, mtime = key[0], key[4]
+        prefix = self._disk_prefix(path)
+        for old in disk_dir.glob(f"{prefix}-*.png"):
+            if not old.name.startswith(f"{prefix}-{mtime}-"):
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
+    def _trim_disk(self, disk_dir: Path):
+        """Keep the DISK_MAX_FILES most recently written rasters."""
+        files = []
+        try:
+            with os.scandir(disk_dir) as entries:
+                for entry in entries:
+                    try:
+                        files.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+        files.sort(reverse=True)
+        for _, stale in files[self.DISK_MAX_FILES:]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+def device_pixel_ratio() -> float:
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+# -------------------------
+# Process-wide cache
+# -------------------------
+DISK_CACHE = True       # keep rasterized SVGs in <profile>/data/cache/icons
+
+_cache: Optional[IconCache] = None
+
+def get_icon_cache() -> IconCache:
+    global _cache
+    if _cache is None:
+        disk_dir = None
+        profile_path = getattr(QGuiApplication.instance(), "profile_path", None)
+        if DISK_CACHE and profile_path:
+            disk_dir = Path(profile_path) / "data" / "cache" / "icons"
+        _cache = IconCache(disk_dir=disk_dir)
+    return _cache
+
+
+def cached_pixmap(path, size, dpr: Optional[float] = None) -> QPixmap:
+    return get_icon_cache().pixmap(path, size, dpr)
+
+
+def cached_icon(path, *sizes) -> QIcon:
+    return get_icon_cache().icon(path, sizes)
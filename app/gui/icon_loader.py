@@ -0,0 +1,102 @@
+# app/gui/icon_loader.py
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from PySide6.QtCore import QObject, QSize, Signal, Slot
+from PySide6.QtGui import QIcon, QPixmap
+
+from gui.icon_cache import IconCache, get_icon_cache, as_size, device_pixel_ratio
+
+
+class IconLoader(QObject):
+    """
+    Loads icons for the shared IconCache on background threads.
+
+    The stat, disk-cache read and decode all happen in a worker and only
+    produce QImages; the UI thread just turns them into pixmaps, stores
+    them in the cache and emits `icon_ready(path, icon)`. Widgets show a
+    placeholder until then, so building them never waits on the disk.
+    """
+
+    MAX_WORKERS = 2
+
+    icon_ready = Signal(str, QIcon)             # path, icon holding every requested size
+    _decoded = Signal(str, object)              # emitted from workers: path, [(key, QImage | None)]
+
+    def __init__(self, cache: Optional[IconCache] = None, max_workers: int = MAX_WORKERS):
+        super().__init__()
+        self.cache = cache or get_icon_cache()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="icons")
+        self._pending: Dict[str, Tuple[QSize, ...]] = {}
+
+        self._decoded.connect(self._on_decoded)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def request(self, path, sizes: Iterable):
+        """Load `path` at every size in `sizes`; icon_ready follows (once per path)."""
+        path = str(path) if path else ""
+        sizes = tuple(as_size(size) for size in sizes)
+        if not path or not sizes or path in self._pending:
+            return
+
+        self._pending[path] = sizes
+        self._pool.submit(self._load, path, sizes, device_pixel_ratio())
+
+    def submit(self, fn, *args):
+        """Run other blocking startup work (e.g. listing the apps) on the loader's threads."""
+        return self._pool.submit(fn, *args)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _load(self, path: str, sizes: Tuple[QSize, ...], dpr: float):
+        results = []
+        try:
+            for size in sizes:
+                key = self.cache.key(path, size, dpr)
+                if key is None:
+                    continue
+                if self.cache.cached(key) is not None:
+                    results.append((key, None))
+                else:
+                    results.append((key, self.cache.decode(key)))
+        except Exception as e:
+            print(f"[IconLoader] Failed to load {path}: {e}")
+        self._decoded.emit(path, results)
+
+    @Slot(str, object)
+    def _on_decoded(self, path: str, results):
+        self._pending.pop(path, None)
+
+        icon = QIcon()
+        for key, image in results:
+            if image is None:
+                pixmap = self.cache.cached(key)
+            elif image.isNull():
+                pixmap = None
+            else:
+                pixmap = self.cache.insert(key, QPixmap.fromImage(image))
+            if pixmap is not None:
+                icon.addPixmap(pixmap)
+
+        if not icon.isNull():
+            self.icon_ready.emit(path, icon)
+
+
+# -------------------------
+# Process-wide loader
+# -------------------------
+_loader: Optional[IconLoader] = None
+
+def get_icon_loader() -> IconLoader:
+    """Created on first use, which must happen on the UI thread."""
+    global _loader
+    if _loader is None:
+        _loader = IconLoader()
+    return _loader
@@ -38,6 +38,8 @@ class LabHostBar(QWidget):
         # Pill_eb.incognito_pill.connect(lambda x: print("hi",x))
         # Pill_eb.rename_pill.connect(self.on_rename_lab)
         Pill_eb.active_pill.connect(self.set_active_lab)
+        Pill_eb.add_pills.connect(self.on_add_labs)
+        Pill_eb.remove_pills.connect(self.on_close_labs)
 
     def on_new_lab(self, info: dict):
         lab_id = info["id"] 
@@ -100,9 +102,39 @@ class LabHostBar(QWidget):
             pill.deleteLater()
 
     def on_close_all_labs(self):
-        for lab_id, pill in list(self.pills.items()):
-            self.layout.removeWidget(pill)   
-            pill.deleteLater()               
-            del self.pills[lab_id]           
+        self.container.setUpdatesEnabled(False)
+        try:
+            for lab_id, pill in list(self.pills.items()):
+                self.layout.removeWidget(pill)   
+                pill.deleteLater()               
+                del self.pills[lab_id]
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    # ---Batch: one relayout / repaint for the whole set---
+    def on_add_labs(self, infos: list):
+        """Add many pills at once. Selection is left to the following active_pill."""
+        self.container.setUpdatesEnabled(False)
+        try:
+            for info in infos:
+                lab_id = info["id"]
+                if info.get("incognito"):
+                    pill = IncogLabPill(icon_path=info.get("icon"), text=info.get("title", "Incognito Lab"), lab_id=lab_id)
+                else:
+                    pill = LabPill(icon_path=info.get("icon"), text=info.get("title"), lab_id=lab_id)
+                self._add_pill_to_hostbar(lab_id, pill)
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    def on_close_labs(self, lab_ids: list):
+        self.container.setUpdatesEnabled(False)
+        try:
+            for lab_id in lab_ids:
+                pill = self.pills.pop(lab_id, None)
+                if pill:
+                    self.layout.removeWidget(pill)
+                    pill.deleteLater()
+        finally:
+            self.container.setUpdatesEnabled(True)           
 
             
\ No newline at end of file
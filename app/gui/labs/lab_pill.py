@@ -6,6 +6,7 @@ import sys
 
 try:
     from core.signal_manager import Lab_eb, Pill_eb
+    from gui.icon_cache import cached_pixmap
 except ImportError:
     # Placeholder for running standalone
     class MockLab_eb:
@@ -18,6 +19,9 @@ except ImportError:
     Lab_eb = MockLab_eb()
     Pill_eb = MockPill_eb()
 
+    def cached_pixmap(path, size):
+        return QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
 # ----------------------------------------
 # 1) PillContentWidget: icon + name + cross button
 # ----------------------------------------
@@ -42,9 +46,10 @@ class PillContentWidget(QWidget):
 
         # Icon
         self.icon_label = QLabel()
-        pix = QPixmap(self.icon_path) if self.icon_path else None
+        # Shared cache: a pill for an app already on screen reuses its raster
+        pix = cached_pixmap(self.icon_path, 18) if self.icon_path else None
         if pix and not pix.isNull():
-            self.icon_label.setPixmap(pix.scaled(18, 18, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self.icon_label.setPixmap(pix)
         else:
             # Placeholder/Fallback for missing icon
             placeholder = QPixmap(18, 18)
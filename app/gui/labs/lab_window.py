@@ -44,10 +44,10 @@ class LabWindow(QFrame):
         self.content_area_layout.addWidget(self.lab_bar, 0, Qt.AlignTop)
 
         # Session container (empty) — logic file will add/remove widgets here
+        # Stacked: only the current session is shown, switching just raises it
         self.session_container = QFrame()
-        self.session_layout = QVBoxLayout(self.session_container)
+        self.session_layout = QStackedLayout(self.session_container)
         self.session_layout.setContentsMargins(0, 0, 0, 0)
-        self.session_layout.setSpacing(0)
         self.content_area_layout.addWidget(self.session_container, 1)
 
         self.main_layout.addWidget(self.content_area, 1)
@@ -1,10 +1,11 @@
 from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton
-from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSize
 import sys
 import os
 from pathlib import Path
 
+from gui.icon_cache import cached_icon
+
 # Function to get full asset path
 # def icon_path(asset_name):
 #     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -35,12 +36,12 @@ class IconButton(QPushButton):
         super().__init__(parent)
 
         # self.icon_name = name
-        self.default_icon = QIcon(str(default_icon_path))
-        self.hover_icon = QIcon(str(hover_icon_path))
+        icon_dim = min(size.width(), size.height()) - 24  
+        self.default_icon = cached_icon(default_icon_path, icon_dim)
+        self.hover_icon = cached_icon(hover_icon_path, icon_dim)
         
         # Button size and icon size
         self.setFixedSize(size)
-        icon_dim = min(size.width(), size.height()) - 24  
         self.setIconSize(QSize(icon_dim, icon_dim))
         self.setFlat(True)
         self.setIcon(self.default_icon)
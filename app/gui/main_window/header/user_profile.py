@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor
 from PySide6.QtCore import Qt, QSize, QRect
-from PySide6.QtGui import QIcon
+from gui.icon_cache import cached_icon
 from pathlib import Path
 
 
@@ -85,12 +85,12 @@ class ProfileIcon(QPushButton):
         user_profile_icon = Path(__file__).resolve().parents[3] / "assets" / "header_icons" / "user_profile_icon.svg"
         user_profile_icon_hover = Path(__file__).resolve().parents[3] / "assets" / "header_icons" / "user_profile_icon_hover.svg"
 
-        self.default_icon = QIcon(str(user_profile_icon))
-        self.hover_icon = QIcon(str(user_profile_icon_hover))
+        icon_dim = min(size.width(), size.height()) - 24  
+        self.default_icon = cached_icon(user_profile_icon, icon_dim)
+        self.hover_icon = cached_icon(user_profile_icon_hover, icon_dim)
         
         # Button size and icon size
         self.setFixedSize(size)
-        icon_dim = min(size.width(), size.height()) - 24  
         self.setIconSize(QSize(icon_dim, icon_dim))
         self.setFlat(True)
         self.setIcon(self.default_icon)
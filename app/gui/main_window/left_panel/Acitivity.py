@@ -4,12 +4,13 @@ from PySide6.QtGui import QFont, QColor, QPalette
 from PySide6.QtCore import Qt
 
 from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton
-from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSize
 import sys
 import os
 from pathlib import Path
 
+from gui.icon_cache import cached_icon
+
 def icon_path(asset_name):
     base_dir = Path(__file__).resolve().parent.parent.parent.parent / "assets" / "leftpanel_icons"
     full_path = base_dir / asset_name
@@ -25,8 +26,9 @@ class IconAndTitle(QPushButton):
         default_icon_path = icon_path("activity_icon.svg")
         hover_icon_path = icon_path("activity_icon.svg")
 
-        self.default_icon = QIcon(str(default_icon_path))
-        self.hover_icon = QIcon(str(hover_icon_path))
+        icon_dim = height - 12
+        self.default_icon = cached_icon(default_icon_path, icon_dim)
+        self.hover_icon = cached_icon(hover_icon_path, icon_dim)
         
         # 1. Set the text (the app name)
         self.setText(name)
@@ -37,7 +39,6 @@ class IconAndTitle(QPushButton):
         self.setMinimumWidth(150) 
         
         # Icon size: Standard size for a 48px height button (e.g., 32x32)
-        icon_dim = height - 12
         self.setIconSize(QSize(icon_dim, icon_dim))
         
         # Set object name for specific QSS targeting
@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QStyle
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QIcon
+
+from gui.icon_cache import cached_icon
 import sys
 from pathlib import Path
 
@@ -19,8 +21,9 @@ class IconTextButton(QPushButton):
     def __init__(self, name, default_icon_path, hover_icon_path, height=32, parent=None):
         super().__init__(parent)
 
-        self.default_icon = QIcon(str(default_icon_path))
-        self.hover_icon = QIcon(str(hover_icon_path))
+        icon_dim = height - 12
+        self.default_icon = cached_icon(default_icon_path, icon_dim)
+        self.hover_icon = cached_icon(hover_icon_path, icon_dim)
         
         # 1. Set the text (the app name)
         self.setText(name)
@@ -31,7 +34,6 @@ class IconTextButton(QPushButton):
         self.setMinimumWidth(150) 
         
         # Icon size: Standard size for a 48px height button (e.g., 32x32)
-        icon_dim = height - 12
         self.setIconSize(QSize(icon_dim, icon_dim))
         
         # Set object name for specific QSS targeting
@@ -1,72 +1,71 @@
 # app/gui/widget/icon_panel.py
 from __future__ import annotations
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QApplication
-from PySide6.QtGui import QIcon
-from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PySide6.QtCore import QSize, Qt, Signal
 from pathlib import Path
-import json
 import sys
 
 # Make sure your signal manager is imported correctly
-from core.signal_manager import Lab_eb
-
-
-def load_icons():
-    """Load apps.json directly from the global profile path stored in QApplication."""
-    app = QApplication.instance()
-    profile_path = getattr(app, "profile_path", None)
+from core.signal_manager import Lab_eb, SubApp_eb
+from core.subapp_manager.subapp_registry import get_subapp_registry
+from gui.icon_loader import get_icon_loader
+
+
+def load_icons(profile_path=None):
+    """
+    Icon entries for a profile (default: the running app's), served from the
+    shared subapp registry. Touches the disk: IconPanel calls it off the UI thread.
+    """
+    if profile_path is None:
+        profile_path = getattr(QApplication.instance(), "profile_path", None)
     if not profile_path or not Path(profile_path).exists():
         print("[IconPanel] Profile path invalid:", profile_path)
         return []
 
-    apps_file = Path(profile_path) / "data" / "json_data" / "subapps.json"
-    if not apps_file.exists():
-        print("[IconPanel] apps.json not found at:", apps_file)
+    registry = get_subapp_registry(profile_path)
+    if not registry.available():
+        print("[IconPanel] apps.json not found at:", registry.apps_file)
         return []
 
-    try:
-        data = json.loads(apps_file.read_text(encoding="utf-8"))
-    except Exception as e:
-        print("[IconPanel] Failed to load apps.json:", e)
-        return []
+    return registry.get_icon_entries()
 
-    # apps.json can be a dict of apps
-    if isinstance(data, dict):
-        entries = list(data.values())
-    elif isinstance(data, list):
-        entries = data
-    else:
-        print("[IconPanel] apps.json has unexpected format")
-        return []
 
-    icon_list = []
-    for item in entries:
-        # Only keep entries that have id, name, and icon
-        if all(k in item for k in ("id", "name", "icon")):
-            icon_path = Path(item["icon"].replace("\\", "/")).resolve()
-            if icon_path.exists():
-                icon_list.append({
-                    "id": item["id"],
-                    "name": item["name"],
-                    "icon": icon_path
-                })
-            else:
-                print(f"[IconPanel] Icon file not found for {item['name']}: {icon_path}")
-    return icon_list
+_placeholder = None
+
+def placeholder_icon() -> QIcon:
+    """Soft circle shown until the real icon is loaded (built once)."""
+    global _placeholder
+    if _placeholder is None:
+        pixmap = QPixmap(36, 36)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 110))
+        painter.drawEllipse(pixmap.rect().adjusted(2, 2, -2, -2))
+        painter.end()
+        _placeholder = QIcon(pixmap)
+    return _placeholder
 
 
 class IconButton(QPushButton):
-    """Button for a single app icon."""
+    """Button for a single app icon (placeholder until IconPanel swaps the real one in)."""
+
+    DEFAULT_ICON_SIZE = 24
+    HOVER_ICON_SIZE = 36
+
     def __init__(self, icon_path, icon_name, icon_id, parent=None):
         super().__init__(parent)
         self.icon_id = icon_id
+        self.icon_path = str(icon_path)
 
-        self.default_icon_size = 24
-        self.hover_icon_size = 36
+        self.default_icon_size = self.DEFAULT_ICON_SIZE
+        self.hover_icon_size = self.HOVER_ICON_SIZE
 
         self.setFixedSize(48, 48)
         self.setIconSize(QSize(self.default_icon_size, self.default_icon_size))
-        self.setIcon(QIcon(str(icon_path)))
+        self.setIcon(placeholder_icon())
         self.setToolTip(icon_name)
         self.setFlat(True)
 
@@ -95,24 +94,77 @@ class IconButton(QPushButton):
 
 
 class IconPanel(QWidget):
-    """Vertical panel that displays all app icons."""
+    """
+    Vertical panel that displays all app icons.
+
+    Opens empty and fills itself in the background: the app list (registry
+    read + icon exists() checks) is built on a loader thread, buttons are
+    added with a placeholder, and each real icon replaces its placeholder
+    as soon as the loader has decoded it.
+    """
+
+    icons_listed = Signal(list)     # emitted from the loader thread
+
     def __init__(self):
         super().__init__()
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
-        ICON_DATA = load_icons()
-        if not ICON_DATA:
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setSpacing(0)
+
+        self.buttons = {}           # icon path -> [IconButton]
+        self.loader = get_icon_loader()
+        self.loader.icon_ready.connect(self._on_icon_ready)
+        self.icons_listed.connect(self._add_buttons)
+
+        # Rebuild whenever subapps are rescanned, added or removed
+        SubApp_eb.registry_changed.connect(self.reload)
+        self.reload()
+
+    def reload(self):
+        """List the apps again from the shared registry (on the loader thread)."""
+        profile_path = getattr(QApplication.instance(), "profile_path", None)
+        self.loader.submit(self._list_icons, profile_path)
+
+    def _list_icons(self, profile_path):
+        entries = load_icons(profile_path)
+        try:
+            self.icons_listed.emit(entries)
+        except RuntimeError:
+            # Panel deleted before the list was ready
+            pass
+
+    def _clear_buttons(self):
+        for buttons in self.buttons.values():
+            for btn in buttons:
+                self.layout.removeWidget(btn)
+                btn.deleteLater()
+        self.buttons = {}
+
+    def _add_buttons(self, entries: list):
+        self._clear_buttons()
+        if not entries:
             print("[IconPanel] No icons loaded")
-
-        for item in ICON_DATA:
-            btn = IconButton(
-                icon_path=item["icon"],
-                icon_name=item["name"],
-                icon_id=item["id"]
-            )
-            layout.addWidget(btn)
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            for item in entries:
+                btn = IconButton(
+                    icon_path=item["icon"],
+                    icon_name=item["name"],
+                    icon_id=item["id"]
+                )
+                self.layout.addWidget(btn)
+                self.buttons.setdefault(btn.icon_path, []).append(btn)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        for path in self.buttons:
+            self.loader.request(path, (IconButton.DEFAULT_ICON_SIZE, IconButton.HOVER_ICON_SIZE))
+
+    def _on_icon_ready(self, path: str, icon: QIcon):
+        for btn in self.buttons.get(path, ()):
+            btn.setIcon(icon)
 
 
 if __name__ == "__main__":
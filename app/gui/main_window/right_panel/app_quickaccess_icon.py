@@ -1,8 +1,9 @@
 from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QPushButton
-from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSize
 from pathlib import Path
 
+from gui.icon_cache import cached_icon
+
 
 def icon_path(asset_name):
     base_dir = Path(__file__).resolve().parent.parent.parent.parent / "assets" / "rightpanel_icons"
@@ -19,11 +20,11 @@ class IconButton(QPushButton):
     def __init__(self, name, default_icon_path, hover_icon_path, size=QSize(48, 48), parent=None):
         super().__init__(parent)
 
-        self.default_icon = QIcon(str(default_icon_path))
-        self.hover_icon = QIcon(str(hover_icon_path))
+        icon_dim = min(size.width(), size.height()) - 24  
+        self.default_icon = cached_icon(default_icon_path, icon_dim)
+        self.hover_icon = cached_icon(hover_icon_path, icon_dim)
         
         self.setFixedSize(size)
-        icon_dim = min(size.width(), size.height()) - 24  
         self.setIconSize(QSize(icon_dim, icon_dim))
         self.setFlat(True)
         self.setIcon(self.default_icon)
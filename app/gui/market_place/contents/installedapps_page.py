@@ -2,12 +2,14 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QPushButton, QVBoxLayout, QLabel, QFrame,
     QScrollArea, QSizePolicy
 )
-from PySide6.QtGui import QIcon, QFont
+from PySide6.QtGui import QFont
 from PySide6.QtCore import QSize, Qt
 from pathlib import Path
 import sys
 import os
 
+from gui.icon_cache import cached_pixmap
+
 # --- ICON PATH WITH WHITE SVG FALLBACK ---
 def icon_path(asset_name):
     base_dir = Path(__file__).resolve().parent.parent.parent / "assets" / "marketplace_icons"
@@ -65,8 +67,7 @@ class AppTile(QFrame):
 
         # --- 1. Icon (Will be white if real icon fails) ---
         icon_label = QLabel()
-        icon = QIcon(icon_path_str)
-        icon_label.setPixmap(icon.pixmap(QSize(48, 48)))
+        icon_label.setPixmap(cached_pixmap(icon_path_str, 48))
         icon_label.setFixedSize(48, 48)
         main_layout.addWidget(icon_label)
         
@@ -2,13 +2,13 @@
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QVBoxLayout, QLabel, QFrame
 )
-from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSize, Qt, Signal, QPropertyAnimation, QObject
 from pathlib import Path
 import sys
 import os
 
 from core.signal_manager import marketplace_eb
+from gui.icon_cache import cached_icon
 
 # --- ICON PATHS ---
 def icon_path(asset_name):
@@ -35,12 +35,12 @@ class IconButton(QPushButton):
     def __init__(self, name, default_icon_path, hover_icon_path, size=QSize(48, 48), parent=None):
         super().__init__(parent)
         self.button_name = name
-        self.default_icon = QIcon(str(default_icon_path))
-        self.hover_icon = QIcon(str(hover_icon_path))
+        icon_dim = min(size.width(), size.height()) - 24  
+        self.default_icon = cached_icon(default_icon_path, icon_dim)
+        self.hover_icon = cached_icon(hover_icon_path, icon_dim)
         self._is_selected = False 
         
         self.setFixedSize(size)
-        icon_dim = min(size.width(), size.height()) - 24  
         self.setIconSize(QSize(icon_dim, icon_dim))
         self.setFlat(True)
         self.setIcon(self.default_icon)
@@ -0,0 +1,54 @@
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional
+
+
+class ChatBackend(ABC):
+    """
+    Interface for QuickLab response providers.
+
+    stream() is called off the UI thread and yields the response as text
+    tokens (any size) as soon as they are available. It should return
+    promptly once `should_stop()` becomes True.
+    """
+
+    name = "backend"
+
+    @abstractmethod
+    def stream(self, prompt: str, history: List[dict], should_stop=lambda: False) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class EchoBackend(ChatBackend):
+    """
+    Offline backend: streams back the prompt, or canned `responses` in turn
+    (fixtures), one word at a time with `token_delay` seconds between words.
+
+    For tests and demos only; QuickLab has no backend unless one is set.
+    """
+
+    name = "echo"
+
+    def __init__(self, responses: Optional[List[str]] = None, token_delay: float = 0.03):
+        self.responses = list(responses or [])
+        self.token_delay = token_delay
+        self._turn = 0
+        self._turn_lock = threading.Lock()   # stream() runs on executor threads
+
+    def stream(self, prompt: str, history: List[dict], should_stop=lambda: False) -> Iterator[str]:
+        if self.responses:
+            with self._turn_lock:
+                reply = self.responses[self._turn % len(self.responses)]
+                self._turn += 1
+        else:
+            reply = f"Echo: {prompt}"
+
+        # Words with their trailing whitespace, so joining tokens gives `reply` back
+        for token in re.findall(r"\S+\s*|\s+", reply):
+            if should_stop():
+                return
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            yield token
@@ -0,0 +1,119 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+try:
+    from core.signal_manager import Lab_eb, Session_eb
+except ImportError:
+    # Running QuickLab standalone: no lab lifecycle to follow
+    Lab_eb = Session_eb = None
+
+
+class RequestExecutor(QObject):
+    """
+    Shared executor for QuickLab backend requests across all labs.
+
+    At most MAX_CONCURRENT responses stream at once; further requests wait
+    in a FIFO queue whose positions are published through `queue_changed`
+    so each lab can show where its request stands. Backend calls run on
+    pool threads, so the UI thread (and tab switching) never waits on them.
+    Closing a lab cancels its queued and running requests.
+    """
+
+    MAX_CONCURRENT = 2
+
+    queue_changed = Signal()
+    _slot_freed = Signal(object)    # emitted from pool threads, handled on the UI thread
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT):
+        super().__init__()
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="quicklab")
+        self._pending = deque()
+        self._running = set()
+
+        self._slot_freed.connect(self._on_slot_freed)
+
+        if Lab_eb is not None:
+            Lab_eb.close_lab.connect(self.cancel_lab)
+            Lab_eb.close_labs.connect(self.cancel_labs)
+            Session_eb.all_sessions_closed.connect(self.cancel_all)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def submit(self, stream):
+        """Queue a ResponseStream; it starts as soon as a slot is free."""
+        self._pending.append(stream)
+        self._pump()
+        self.queue_changed.emit()
+
+    def position(self, stream) -> int:
+        """Requests ahead of `stream` in the queue, -1 if it is not queued."""
+        try:
+            return self._pending.index(stream)
+        except ValueError:
+            return -1
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def running_count(self) -> int:
+        return len(self._running)
+
+    @Slot(str)
+    def cancel_lab(self, lab_id: str):
+        self._cancel(lambda s: getattr(s, "lab_id", None) == lab_id)
+
+    @Slot(list)
+    def cancel_labs(self, lab_ids: list):
+        closing = set(lab_ids)
+        self._cancel(lambda s: getattr(s, "lab_id", None) in closing)
+
+    @Slot()
+    def cancel_all(self):
+        self._cancel(lambda s: True)
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _cancel(self, match):
+        dropped = [s for s in self._pending if match(s)]
+        for stream in dropped:
+            self._pending.remove(stream)
+            stream.cancel()
+        for stream in list(self._running):
+            if match(stream):
+                # The backend sees should_stop() and returns; the slot frees itself
+                stream.cancel()
+        if dropped:
+            self.queue_changed.emit()
+
+    def _pump(self):
+        while self._pending and len(self._running) < self.max_concurrent:
+            stream = self._pending.popleft()
+            self._running.add(stream)
+            stream.begin()
+            future = self._pool.submit(stream.run)
+            future.add_done_callback(lambda _f, s=stream: self._slot_freed.emit(s))
+
+    @Slot(object)
+    def _on_slot_freed(self, stream):
+        self._running.discard(stream)
+        self._pump()
+        self.queue_changed.emit()
+
+
+# -------------------------
+# Process-wide executor
+# -------------------------
+_executor: Optional[RequestExecutor] = None
+
+def get_request_executor() -> RequestExecutor:
+    """Created on first use, which must happen on the UI thread."""
+    global _executor
+    if _executor is None:
+        _executor = RequestExecutor()
+    return _executor
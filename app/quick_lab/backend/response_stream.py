@@ -0,0 +1,108 @@
+import queue
+import threading
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from quick_lab.backend.chat_backend import ChatBackend
+from quick_lab.backend.request_executor import get_request_executor
+
+
+class ResponseStream(QObject):
+    """
+    Runs one backend response on a RequestExecutor thread and hands its
+    tokens to the UI thread in batches: tokens are queued as they arrive and flushed
+    at most every FLUSH_INTERVAL_MS as a single `chunk`, so a fast backend
+    costs one bubble update per frame, not one per token.
+    """
+
+    FLUSH_INTERVAL_MS = 16
+
+    chunk = Signal(str)         # batched text to append to the response
+    finished = Signal(str)      # full response text
+    failed = Signal(str)        # error message
+
+    _DONE = object()
+
+    def __init__(self, backend: ChatBackend, prompt: str, history: list,
+                 lab_id: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self.lab_id = lab_id        # requests are cancelled when this lab closes
+        self.backend = backend
+        self.prompt = prompt
+        self.history = list(history)
+
+        self.text = ""
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._error = None
+        self._started = False
+        self._done = False
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def start(self):
+        """Queue on the shared executor; tokens flow once a slot is free."""
+        get_request_executor().submit(self)
+
+    def begin(self):
+        """Called by the executor on the UI thread right before run() is scheduled."""
+        self._started = True
+        self._flush_timer.start()
+
+    def run(self):
+        """Produce tokens into the queue. Runs on an executor thread."""
+        try:
+            for token in self.backend.stream(self.prompt, self.history, self._stop.is_set):
+                if self._stop.is_set():
+                    break
+                if token:
+                    self._queue.put(token)
+        except Exception as e:
+            self._error = f"{type(e).__name__}: {e}"
+        finally:
+            self._queue.put(self._DONE)
+
+    def cancel(self):
+        self._stop.set()
+        if not self._started and not self._done:
+            # Never started (still queued): nothing will report back otherwise
+            self._done = True
+            self.failed.emit("cancelled")
+
+    def is_cancelled(self) -> bool:
+        return self._stop.is_set()
+
+    # -------------------------
+    # UI thread
+    # -------------------------
+    def _flush(self):
+        parts = []
+        done = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._DONE:
+                done = True
+                break
+            parts.append(item)
+
+        if parts:
+            batch = "".join(parts)
+            self.text += batch
+            self.chunk.emit(batch)
+
+        if done:
+            self._done = True
+            self._flush_timer.stop()
+            if self._error is not None:
+                self.failed.emit(self._error)
+            else:
+                self.finished.emit(self.text)
@@ -0,0 +1,184 @@
+import math
+
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtCore import Qt, QSize, QRect, QRectF, Signal
+from PySide6.QtGui import QFont, QFontMetrics, QColor, QPainter
+
+from quick_lab.chat_window.chat_model import ChatMessageModel
+
+
+class BubbleDelegate(QStyledItemDelegate):
+    """
+    Paints a chat message as a rounded bubble (sent: blue / right,
+    received: light / left) directly onto the list viewport.
+
+    Text is wrapped at 60% of the viewport width, rounded down to a
+    WIDTH_BUCKET so small resizes keep every cached measurement valid.
+    The wrapped text size of each message is measured once per bucket;
+    painting only happens for the rows in view.
+
+    When the bucket changes, rows are not all re-measured: off-screen rows
+    get a height estimated from their previous measurement, and are
+    measured for real the first time they are painted; `sizes_corrected`
+    then asks the owner for a (debounced) relayout to fix the row heights.
+    """
+
+    sizes_corrected = Signal()
+
+
+    WIDTH_RATIO = 0.60
+    WIDTH_BUCKET = 32       # px
+    PADDING = 10
+    RADIUS = 12
+    SPACING = 10            # vertical gap between bubbles
+
+    COLORS = {
+        ChatMessageModel.SENT: (QColor("#0084FF"), QColor("white")),
+        ChatMessageModel.RECEIVED: (QColor("#F1F1F1"), QColor("black")),
+    }
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.font = QFont("Segoe UI", 12)
+        self.metrics = QFontMetrics(self.font)
+
+        self._wrap_width = None
+        self._sizes = {}        # message id -> exact QSize of the bubble at _wrap_width
+        self._estimates = {}    # message id -> estimated QSize at _wrap_width
+        self._stale = {}        # message id -> (QSize, wrap width it was measured at)
+        self._viewport_width = 0
+        self._hints = {}        # message id -> row size hint at _viewport_width
+
+    # -------------------------
+    # Width bucket
+    # -------------------------
+    def wrap_width_for(self, viewport_width: int) -> int:
+        max_w = int(viewport_width * self.WIDTH_RATIO)
+        max_w = max(self.WIDTH_BUCKET, (max_w // self.WIDTH_BUCKET) * self.WIDTH_BUCKET)
+        return max(1, max_w - 2 * self.PADDING)
+
+    def wrap_width(self) -> int:
+        viewport_width = self.view.viewport().width()
+        if viewport_width != self._viewport_width:
+            # Row hints carry the viewport width (bubbles align to its right edge)
+            self._viewport_width = viewport_width
+            self._hints.clear()
+
+        wrap = self.wrap_width_for(viewport_width)
+        if wrap != self._wrap_width:
+            # Bubble sizes depend on the wrap width; keep the old ones to estimate from
+            if self._wrap_width is not None:
+                for message_id, size in self._sizes.items():
+                    self._stale[message_id] = (size, self._wrap_width)
+            self._wrap_width = wrap
+            self._sizes.clear()
+            self._estimates.clear()
+            self._hints.clear()
+        return wrap
+
+    def invalidate(self, message_id=None):
+        """Forget cached sizes (for one message, or all)."""
+        if message_id is None:
+            self._sizes.clear()
+            self._estimates.clear()
+            self._stale.clear()
+            self._hints.clear()
+        else:
+            self._sizes.pop(message_id, None)
+            self._estimates.pop(message_id, None)
+            self._stale.pop(message_id, None)
+            self._hints.pop(message_id, None)
+
+    def remeasure(self, message_id, text: str) -> bool:
+        """Re-measure a message whose text changed; True if its row height changed."""
+        old = self._sizes.get(message_id) or self._estimates.get(message_id)
+        self.invalidate(message_id)
+        new = self._bubble_size(message_id, text)
+        return old is None or old.height() != new.height()
+
+    # -------------------------
+    # Text measurement
+    # -------------------------
+    def _bubble_size(self, message_id, text: str) -> QSize:
+        wrap = self.wrap_width()
+        size = self._sizes.get(message_id)
+        if size is not None:
+            return size
+
+        text_rect = self.metrics.boundingRect(QRect(0, 0, wrap, 1_000_000), Qt.TextWordWrap, text)
+        size = QSize(
+            text_rect.width() + 2 * self.PADDING,
+            text_rect.height() + 2 * self.PADDING
+        )
+        self._sizes[message_id] = size
+        self._stale.pop(message_id, None)
+        return size
+
+    def _hint_size(self, message_id, text: str) -> QSize:
+        """Exact size if known, else an estimate from an older width, else measure."""
+        wrap = self.wrap_width()
+        size = self._sizes.get(message_id) or self._estimates.get(message_id)
+        if size is not None:
+            return size
+
+        stale = self._stale.get(message_id)
+        if stale is None:
+            return self._bubble_size(message_id, text)
+
+        # Same amount of text, reflowed: height scales with old_wrap / new_wrap
+        old_size, old_wrap = stale
+        line = self.metrics.lineSpacing()
+        old_text_h = old_size.height() - 2 * self.PADDING
+        lines = max(1, math.ceil(old_text_h * old_wrap / wrap / line))
+        size = QSize(
+            min(old_size.width(), wrap + 2 * self.PADDING),
+            lines * line + 2 * self.PADDING
+        )
+        self._estimates[message_id] = size
+        return size
+
+    # -------------------------
+    # QStyledItemDelegate API
+    # -------------------------
+    def sizeHint(self, option, index):
+        # Called for every row on each relayout: read the model directly
+        message = index.model().messages[index.row()]
+        hint = self._hints.get(message["id"])
+        if hint is None:
+            bubble = self._hint_size(message["id"], message["text"])
+            hint = QSize(self._viewport_width, bubble.height() + self.SPACING)
+            self._hints[message["id"]] = hint
+        return hint
+
+    def paint(self, painter: QPainter, option, index):
+        message_id = index.data(ChatMessageModel.IdRole)
+        text = index.data(Qt.DisplayRole) or ""
+        role = index.data(ChatMessageModel.RoleRole)
+        bg, fg = self.COLORS.get(role, self.COLORS[ChatMessageModel.RECEIVED])
+
+        estimate = self._estimates.pop(message_id, None)
+        bubble = self._bubble_size(message_id, text)
+        if estimate is not None and estimate.height() != bubble.height():
+            # Row scrolled into view with a guessed height: have the view fix it
+            self._hints.pop(message_id, None)
+            self.sizes_corrected.emit()
+
+        rect = option.rect
+        if role == ChatMessageModel.SENT:
+            x = rect.right() - bubble.width() + 1      # push bubble to right
+        else:
+            x = rect.left()
+        bubble_rect = QRectF(x, rect.top(), bubble.width(), bubble.height())
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(bubble_rect, self.RADIUS, self.RADIUS)
+
+        painter.setPen(fg)
+        painter.setFont(self.font)
+        text_rect = bubble_rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        painter.drawText(text_rect, Qt.TextWordWrap, text)
+        painter.restore()
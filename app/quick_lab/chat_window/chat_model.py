@@ -0,0 +1,99 @@
+from itertools import count
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class ChatMessageModel(QAbstractListModel):
+    """
+    Flat list of chat messages: {"id", "role", "text"}.
+    `id` is unique for the lifetime of the model so the delegate can cache
+    per-message layouts even when older messages are inserted above.
+    """
+
+    RoleRole = Qt.UserRole + 1      # "sent" / "received"
+    IdRole = Qt.UserRole + 2
+
+    SENT = "sent"
+    RECEIVED = "received"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.messages = []
+        self._ids = count()
+
+    # -------------------------
+    # Qt model API
+    # -------------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.messages)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self.messages)):
+            return None
+
+        message = self.messages[index.row()]
+        if role == Qt.DisplayRole:
+            return message["text"]
+        if role == self.RoleRole:
+            return message["role"]
+        if role == self.IdRole:
+            return message["id"]
+        return None
+
+    # -------------------------
+    # Mutations
+    # -------------------------
+    def _make(self, role: str, text: str) -> dict:
+        return {"id": next(self._ids), "role": role, "text": text}
+
+    def append_message(self, role: str, text: str) -> int:
+        row = len(self.messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.messages.append(self._make(role, text))
+        self.endInsertRows()
+        return row
+
+    def extend_messages(self, messages: list):
+        """Append many messages with a single insert notification."""
+        if not messages:
+            return
+        first = len(self.messages)
+        self.beginInsertRows(QModelIndex(), first, first + len(messages) - 1)
+        for m in messages:
+            self.messages.append(self._make(m.get("role", self.RECEIVED), m.get("text", "")))
+        self.endInsertRows()
+
+    def row_of(self, message_id) -> int:
+        """Row of a message id, -1 if gone. Searches from the end (new messages)."""
+        for row in range(len(self.messages) - 1, -1, -1):
+            if self.messages[row]["id"] == message_id:
+                return row
+        return -1
+
+    def set_text(self, row: int, text: str) -> dict:
+        """Replace a message's text in place (streaming responses)."""
+        message = self.messages[row]
+        message["text"] = text
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        return message
+
+    def prepend_messages(self, messages: list):
+        """Insert older messages above the current first row."""
+        if not messages:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(messages) - 1)
+        self.messages[0:0] = [
+            self._make(m.get("role", self.RECEIVED), m.get("text", "")) for m in messages
+        ]
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.messages = []
+        self.endResetModel()
+
+    def transcript(self) -> list:
+        return [{"role": m["role"], "text": m["text"]} for m in self.messages]
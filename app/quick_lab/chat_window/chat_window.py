@@ -1,17 +1,26 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QScrollArea, QLabel,
-    QFrame, QHBoxLayout, QSizePolicy
+    QVBoxLayout, QFrame, QListView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer, Signal
+
+from quick_lab.chat_window.chat_model import ChatMessageModel
+from quick_lab.chat_window.bubble_delegate import BubbleDelegate
 
 
 class ChatHistoryWindow(QFrame):
     """
     Modern message chat window with dynamic bubble width and modern scrollbar.
+    Messages live in a ChatMessageModel and are painted by BubbleDelegate,
+    so only the rows in view cost anything, however long the history is.
+    Resizes are coalesced into one relayout per frame (RESIZE_DEBOUNCE_MS).
     """
+    RESIZE_DEBOUNCE_MS = 16
+
+    # Scrolled to the top: the owner may page in older history via prepend_messages()
+    older_messages_requested = Signal()
+
     MODERN_SCROLLBAR_QSS = """
-        QScrollArea {
+        QListView {
             background: transparent; 
             border: none;
         }
@@ -51,112 +60,131 @@ class ChatHistoryWindow(QFrame):
         self.layout.setContentsMargins(20, 20, 20, 20)
         self.layout.setSpacing(10)
 
-        # Scroll area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
+        # Message list (virtualized: rows are painted, not built as widgets)
+        self.model = ChatMessageModel(self)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.delegate = BubbleDelegate(self.list_view, self.list_view)
+        self.list_view.setItemDelegate(self.delegate)
+        self.delegate.sizes_corrected.connect(self._schedule_relayout)
+
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.verticalScrollBar().setSingleStep(20)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.list_view.setFocusPolicy(Qt.NoFocus)
+        self.list_view.setResizeMode(QListView.Fixed)     # relayout is driven by _apply_resize
+        self.list_view.setUniformItemSizes(False)
 
         # --- apply modern scroll area QSS ---
-        self.scroll_area.setStyleSheet(self.MODERN_SCROLLBAR_QSS)
+        self.list_view.setStyleSheet(self.MODERN_SCROLLBAR_QSS)
 
-        self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
+        self.layout.addWidget(self.list_view)
 
-        self.chat_layout = QVBoxLayout(self.scroll_content)
-        self.chat_layout.setAlignment(Qt.AlignTop)
-        self.chat_layout.setSpacing(10)
+        # Coalesce resize events (window / splitter drag) into one pass per frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._apply_resize)
+        self._stick_to_bottom = True
 
-        self.scroll_area.setWidget(self.scroll_content)
-        self.layout.addWidget(self.scroll_area)
-        
-        # Store message bubbles for dynamic resizing
-        self.message_bubbles = [] 
+        self.list_view.verticalScrollBar().valueChanged.connect(self._on_scrolled)
 
     def resizeEvent(self, event):
         """Handle window resizing to update bubble maximum width."""
         super().resizeEvent(event)
-        self._update_bubble_widths()
-
-    def _update_bubble_widths(self):
-        """Recalculates and sets the maximum width for all message bubbles (60%)."""
-        # We use the width of the scroll area viewport for accurate 60% calculation
-        if self.scroll_area.viewport().width() > 0:
-            max_w = int(self.scroll_area.viewport().width() * 0.60)
-            
-            for bubble in self.message_bubbles:
-                bubble.setMaximumWidth(max_w)
-                
-            # Must re-layout the container after changing size hint
-            if self.scroll_content.layout():
-                self.scroll_content.layout().invalidate()
-            
-            self.scroll_to_bottom() # Ensure position is maintained after resize
-
-    def _create_bubble(self, text: str, bg_color: str, text_color: str) -> QLabel:
-        """Helper to create and style a message bubble."""
-        bubble = QLabel(text)
-        bubble.setWordWrap(True)
-        bubble.setFont(QFont("Segoe UI", 12))
-
-        bubble.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {text_color};
-                padding: 10px;
-                border-radius: 12px;
-            }}
-        """)
-        bubble.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Minimum)
-        
-        # Initial width calculation (will be updated by resizeEvent)
-        max_width = int(self.scroll_area.width() * 0.60) if self.scroll_area.width() > 0 else 400
-        bubble.setMaximumWidth(max_width)
-        
-        self.message_bubbles.append(bubble)
-        return bubble
+        self._schedule_relayout()
+
+    def _schedule_relayout(self):
+        if not self._resize_timer.isActive():
+            # Remember the anchor from before the drag started
+            bar = self.list_view.verticalScrollBar()
+            self._stick_to_bottom = bar.value() >= bar.maximum()
+        self._resize_timer.start()
+
+    def _apply_resize(self):
+        """Relayout with cached sizes; only rows that get painted are re-measured."""
+        self.delegate.wrap_width()      # pick up the new viewport width before sizeHint()
+        self.list_view.doItemsLayout()
+        if self._stick_to_bottom:
+            self.list_view.scrollToBottom()
 
     # ===============================================================
     # Add SENT message (blue bubble, right aligned)
     # ===============================================================
-    def add_sent_message(self, text: str):
-        bubble = self._create_bubble(text, "#0084FF", "white")
-
-        holder = QHBoxLayout()
-        holder.addStretch()           # push bubble to right
-        holder.addWidget(bubble)
-        holder.setContentsMargins(0, 0, 0, 0)
-
-        container = QWidget()
-        container.setLayout(holder)
-        self.chat_layout.addWidget(container)
-
+    def add_sent_message(self, text: str) -> int:
+        row = self.model.append_message(ChatMessageModel.SENT, text)
         self.scroll_to_bottom()
+        return row
 
     # ===============================================================
     # Add RECEIVED message (light bubble, left aligned)
     # ===============================================================
-    def add_received_message(self, text: str):
-        bubble = self._create_bubble(text, "#F1F1F1", "black")
+    def add_received_message(self, text: str) -> int:
+        row = self.model.append_message(ChatMessageModel.RECEIVED, text)
+        self.scroll_to_bottom()
+        return row
 
-        holder = QHBoxLayout()
-        holder.addWidget(bubble)
-        holder.addStretch()           # push bubble left -> right side empty
-        holder.setContentsMargins(0, 0, 0, 0)
+    # ===============================================================
+    # Update a message in place (streamed responses)
+    # ===============================================================
+    def message_id(self, row: int):
+        """Stable id of a row (rows shift when older history is prepended)."""
+        return self.model.messages[row]["id"]
+
+    def set_message_text(self, message_id, text: str):
+        row = self.model.row_of(message_id)
+        if row < 0:
+            return
+        bar = self.list_view.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+
+        message = self.model.set_text(row, text)
+        if self.delegate.remeasure(message["id"], text):
+            # Bubble grew a line: relayout (coalesced), keep following the end
+            self._schedule_relayout()
+        elif at_bottom:
+            self.list_view.scrollToBottom()
+
+    def append_to_message(self, message_id, text: str):
+        row = self.model.row_of(message_id)
+        if row >= 0:
+            self.set_message_text(message_id, self.model.messages[row]["text"] + text)
 
-        container = QWidget()
-        container.setLayout(holder)
-        self.chat_layout.addWidget(container)
+    # ===============================================================
+    # Transcript (session suspend / restore)
+    # ===============================================================
+    def get_transcript(self) -> list:
+        return self.model.transcript()
 
+    def load_transcript(self, messages: list):
+        """Append a transcript returned by get_transcript() in one batch."""
+        self.model.extend_messages(messages)
         self.scroll_to_bottom()
 
+    # ===============================================================
+    # Older history (paged in from the transcript store)
+    # ===============================================================
+    def prepend_messages(self, messages: list):
+        """Insert older messages above, keeping the visible rows where they are."""
+        if not messages:
+            return
+        bar = self.list_view.verticalScrollBar()
+        from_bottom = bar.maximum() - bar.value()
+
+        self.model.prepend_messages(messages)
+        self.list_view.doItemsLayout()
+        bar.setValue(bar.maximum() - from_bottom)
+
+    def _on_scrolled(self, value: int):
+        bar = self.list_view.verticalScrollBar()
+        if value == bar.minimum() and bar.maximum() > 0:
+            self.older_messages_requested.emit()
+
     # ===============================================================
     # Auto scroll to bottom
     # ===============================================================
     def scroll_to_bottom(self):
-        # We use a singleShot to ensure the layout has time to calculate the max height
-        from PySide6.QtCore import QTimer 
-        QTimer.singleShot(50, lambda: self.scroll_area.verticalScrollBar().setValue(
-            self.scroll_area.verticalScrollBar().maximum()
-        ))
-        
-# Example usage for testing (Omitted for brevity in the final application file, 
-# but logic remains inside the class).
\ No newline at end of file
+        # We use a singleShot to ensure the list has laid out the new rows
+        QTimer.singleShot(50, self.list_view.scrollToBottom)
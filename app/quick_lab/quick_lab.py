@@ -14,6 +14,9 @@ from quick_lab.message_input.message_input import  AdvancedMessageInputBar
 from quick_lab.chat_window.chat_window import ChatHistoryWindow as ChatWindow 
 from quick_lab.message_input.message_input import AdvancedMessageInputBar
 from quick_lab.chat_window.chat_window import ChatHistoryWindow as ChatWindow 
+from quick_lab.backend.chat_backend import EchoBackend
+from quick_lab.backend.response_stream import ResponseStream
+from quick_lab.backend.request_executor import get_request_executor
 
 try:
     from core.signal_manager import Lab_eb
@@ -25,11 +28,21 @@ except ImportError:
 
 
 class QuickLab(QWidget):
+    TAIL_MESSAGES = 30      # shown when a lab is reopened
+    PAGE_SIZE = 50          # older messages loaded per scroll to the top
+    PENDING_TEXT = "…"      # response bubble content until the first tokens arrive
+    QUEUED_TEXT = "Queued ({position} in line)…"
+    NO_BACKEND_TEXT = "Waiting for Gemini integration..."
+
     def __init__(self):
         super().__init__()
         
         self.is_named = False 
         self.lab_id = None 
+        self.store = None           # TranscriptStore, see attach_store()
+        self._loaded_from = 0       # transcript index of the first message shown
+        self.backend = None             # a ChatBackend; see set_backend()
+        self.streams = []               # responses still streaming
         self.setWindowTitle("QuickLab")
         self.resize(700, 800) 
 
@@ -54,6 +67,8 @@ class QuickLab(QWidget):
 
         # Connect the send signal
         self.input_bar.on_send(self.send_message)
+        self.chat.older_messages_requested.connect(self.load_older_messages)
+        get_request_executor().queue_changed.connect(self._show_queue_positions)
 
         # Initialize with a welcome message
         
@@ -61,21 +76,113 @@ class QuickLab(QWidget):
         msg = self.input_bar.message_input.toPlainText().strip()
         
         if msg:
+            history = self.chat.get_transcript()
             self.chat.add_sent_message(msg)
+            self._record("sent", msg)
 
             # Clear the input (Fix for previous problem)
             self.input_bar.clear_text()
+
+            if self.backend is None:
+                # Placeholder only; not a reply, so it stays out of the transcript
+                self.chat.add_received_message(self.NO_BACKEND_TEXT)
+                return
             
-            # Placeholder Echo Logic (Simulate start and end)
-            echo_text = "Waiting for Gemini integration..."
-            self.chat.add_received_message(echo_text)
-            
-            # Simulate the echo end
-            final_response = f"Simulated Gemini response to: '{msg[:20]}...' (Code verified.)"
-           
+            # The response streams into this one bubble
+            row = self.chat.add_received_message(self.PENDING_TEXT)
+            message_id = self.chat.message_id(row)
+
+            stream = ResponseStream(self.backend, msg, history, lab_id=self.lab_id, parent=self)
+            stream.message_id = message_id
+            stream.shows_placeholder = True     # until the first chunk replaces it
+            stream.chunk.connect(lambda text, s=stream, mid=message_id: self._on_response_chunk(s, mid, text))
+            stream.finished.connect(lambda text, s=stream, mid=message_id: self._on_response_finished(s, mid, text))
+            stream.failed.connect(lambda error, s=stream, mid=message_id: self._on_response_failed(s, mid, error))
+            self.streams.append(stream)
+            stream.start()
+
+    def set_backend(self, backend):
+        """Use `backend` (a ChatBackend, or None for the placeholder reply) for new messages."""
+        self.backend = backend
+
+    # -------------------------
+    # Streaming responses
+    # -------------------------
+    def _on_response_chunk(self, stream, message_id, text: str):
+        if stream.shows_placeholder:
+            # First batch replaces the pending placeholder
+            stream.shows_placeholder = False
+            self.chat.set_message_text(message_id, text)
+        else:
+            self.chat.append_to_message(message_id, text)
+
+    def _on_response_finished(self, stream, message_id, text: str):
+        self._drop_stream(stream)
+        if stream.is_cancelled():
+            self.chat.set_message_text(message_id, f"{text}\n[Cancelled]".lstrip())
+        elif not text:
+            self.chat.set_message_text(message_id, "(empty response)")
+            return
+        self._record("received", text)
+
+    def _on_response_failed(self, stream, message_id, error: str):
+        self._drop_stream(stream)
+        if stream.is_cancelled():
+            note = "[Cancelled]"
+        else:
+            print(f"[QuickLab] Response failed: {error}")
+            note = f"[Response failed: {error}]"
+        self.chat.set_message_text(message_id, f"{stream.text}\n{note}".lstrip())
+
+    def _show_queue_positions(self):
+        """Show waiting requests' place in the shared queue inside their bubble."""
+        executor = get_request_executor()
+        for stream in self.streams:
+            if not stream.shows_placeholder:
+                continue
+            ahead = executor.position(stream)
+            text = self.QUEUED_TEXT.format(position=ahead + 1) if ahead >= 0 else self.PENDING_TEXT
+            self.chat.set_message_text(stream.message_id, text)
+
+    def has_active_requests(self) -> bool:
+        return bool(self.streams)
+
+    def _drop_stream(self, stream):
+        if stream in self.streams:
+            self.streams.remove(stream)
+        stream.deleteLater()
+
+    # -------------------------
+    # Transcript persistence
+    # -------------------------
+    def attach_store(self, store):
+        """Show the end of a persisted transcript and record new messages into it."""
+        self.store = store
+        if store is None:
+            return
+        count = store.count()
+        self._loaded_from = max(0, count - self.TAIL_MESSAGES)
+        self.chat.load_transcript(store.read(self._loaded_from, count))
+
+    def load_older_messages(self):
+        if self.store is None or self._loaded_from == 0:
+            return
+        start = max(0, self._loaded_from - self.PAGE_SIZE)
+        self.chat.prepend_messages(self.store.read(start, self._loaded_from))
+        self._loaded_from = start
+
+    def _record(self, role: str, text: str):
+        if self.store is None:
+            return
+        try:
+            self.store.append(role, text)
+        except OSError as e:
+            print(f"[QuickLab] Could not save message: {e}")
+
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     demo = QuickLab()
+    demo.set_backend(EchoBackend())
     demo.show()
     sys.exit(app.exec())
\ No newline at end of file
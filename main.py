@@ -1,11 +1,14 @@
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
-from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QSizePolicy, QLabel
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QColor, QPalette
+# Measured from the very first line so the first-paint report covers the whole cold start
+_LAUNCH_T0 = time.perf_counter()
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QObject, QEvent, QTimer
 
 # import ctypes
 # from ctypes import wintypes
@@ -38,24 +41,27 @@ from PySide6.QtGui import QColor, QPalette
 #     subprocess.run([sys.executable, app_gui])
 
 
-from app.app import App
-
-
-
+ROOT_DIR = Path(__file__).resolve().parent
+APP_DIR = ROOT_DIR / "app"
 
-
-from pathlib import Path
+# The app packages import each other as `core.*`, `gui.*` and `quick_lab.*`,
+# which only resolves when the app folder itself is on sys.path. It goes
+# after the project root so `import app` still finds the package, not app/app.py.
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+if str(APP_DIR) not in sys.path:
+    sys.path.append(str(APP_DIR))
 
 from app.user_profile_handler.profile_manager import ProfileManager
 
 
 def user_setup():
-    setup_script = Path(__file__).parent / "user_setup" / "main.py"   
+    setup_script = ROOT_DIR / "user_setup" / "main.py"
     # Runs setup as a SEPARATE process
-    subprocess.Popen(["python", str(setup_script)])
+    subprocess.Popen([sys.executable, str(setup_script)])
 
 def get_profile():
-    handler_dir = Path(__file__).parent / "app" / "user_profile_handler"
+    handler_dir = APP_DIR / "user_profile_handler"
     manager = ProfileManager(handler_dir)
     result = manager.get_profile()
 
@@ -69,60 +75,58 @@ def get_profile():
         return result
 
 
-
-app.profile_path = profile        
-
-
-def main():
-    profile_path =get_profile()     
-    setup_script = Path(__file__).parent / "app" / "app.py" 
-    subprocess.Popen(["python", str(setup_script)])   
-
-if __name__ == "__main__":
-    get_profile()
-    main()
-
-
-  
-
-
-
-from app.app import App
-
-
-
-
-
-from pathlib import Path
-
-from app.user_profile_handler.profile_manager import ProfileManager
-
-
-def user_setup():
-    setup_script = Path(__file__).parent / "user_setup" / "main.py"   
-    # Runs setup as a SEPARATE process
-    subprocess.Popen(["python", str(setup_script)])
-
-def get_profile():
-    handler_dir = Path(__file__).parent / "app" / "user_profile_handler"
-    manager = ProfileManager(handler_dir)
-    result = manager.get_profile()
-
-    if result == "No profile":
-        user_setup()
-        exit()
-    elif result == "All profiles are corrupt":
-        user_setup()
-        exit()
-    else:
-        return result
-      
-
-
-def main():
-    profile_path = get_profile()
-
-    setup_script = Path(__file__).parent / "app" / "app.py"
+class FirstPaintProbe(QObject):
+    """
+    Watches a top-level window and reports the time from launcher start
+    until the window's first paint reaches the screen.
+    """
+
+    def __init__(self, window, t0: float, on_painted=None):
+        super().__init__(window)
+        self.window = window
+        self.t0 = t0
+        self.on_painted = on_painted
+        self.elapsed_ms = None
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        # UpdateRequest is delivered to the top-level widget when its backing
+        # store is flushed, i.e. when pixels actually hit the window.
+        if obj is self.window and event.type() in (QEvent.Paint, QEvent.UpdateRequest):
+            self.window.removeEventFilter(self)
+            self.elapsed_ms = (time.perf_counter() - self.t0) * 1000
+            print(f"[Launcher] Time to first paint: {self.elapsed_ms:.0f} ms")
+            if self.on_painted:
+                # Let the event loop finish flushing this frame before any
+                # startup work runs
+                elapsed_ms = self.elapsed_ms
+                QTimer.singleShot(0, lambda: self.on_painted(elapsed_ms))
+        return False
+
+
+def launch_in_process(profile_path) -> int:
+    """Boot the shell inside this interpreter (single Python + PySide6 startup)."""
+    qt_app = QApplication.instance() or QApplication(sys.argv)
+    qt_app.profile_path = Path(profile_path).resolve()
+    print("Using profile path:", qt_app.profile_path)
+
+    from app.app import App
+    from core.lab_and_session_manager.registor_external_app import cleanup
+    qt_app.aboutToQuit.connect(cleanup)
+
+    window = App(qt_app.profile_path)
+    # Lazy pages and the external-app worker pool warm up once the shell is on screen
+    window.first_paint_probe = FirstPaintProbe(
+        window, _LAUNCH_T0,
+        on_painted=lambda _ms: window.start_background_services()
+    )
+    window.show()
+    return qt_app.exec()
+
+
+def launch_subprocess(profile_path):
+    """Legacy launch: run app/app.py in a fresh interpreter."""
+    setup_script = APP_DIR / "app.py"
     print("profile_path:", profile_path)
 
     subprocess.Popen([
@@ -130,26 +134,31 @@ def main():
         str(setup_script),
         str(profile_path)
     ])
- 
 
-if __name__ == "__main__":
-    get_profile()
-    main()
 
+def enable_bus_stats(argv) -> None:
+    """
+    --bus-stats          print the slowest event bus handlers on exit
+    --bus-stats=<path>   also write the full report to <path> as JSON
+    Read by core.signal_manager when it is first imported, so set it early.
+    """
+    for arg in argv:
+        if arg == "--bus-stats":
+            os.environ["TOOLKIT_BUS_STATS"] = "1"
+        elif arg.startswith("--bus-stats="):
+            os.environ["TOOLKIT_BUS_STATS"] = arg.split("=", 1)[1] or "1"
 
-  
 
-# def main():
-#     app = QApplication(sys.argv)
+def main():
+    enable_bus_stats(sys.argv[1:])
+    profile_path = get_profile()
 
-#     profile = get_profile()
-#     app.profile_path = profile
+    if "--subprocess" in sys.argv[1:]:
+        launch_subprocess(profile_path)
+        return 0
 
-#     from app.app import App
-#     win = App()
-#     win.show()
+    return launch_in_process(profile_path)
 
-#     sys.exit(app.exec())
 
-# if __name__ == "__main__":
-#     main()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1510 @@
+"""
+Universal File Converter - conversion core.
+
+Everything that turns one file into another, with no Tk involved, so it
+can be imported by the GUI (main.py), used from scripts, or run headless
+on build machines and in cron:
+
+    python -m converter_core convert SRC [SRC ...] --to PNG --jobs 8
+    python -m converter_core formats
+"""
+from PIL import Image
+import os
+import sys
+import argparse
+import fnmatch
+import hashlib
+import json
+import re
+import shutil
+import sqlite3
+import time
+import subprocess
+import threading
+import multiprocessing
+from pathlib import Path
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import tempfile
+from io import BytesIO
+
+# Add FFmpeg to system path dynamically
+ffmpeg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ffmpeg', 'bin')
+if os.path.exists(ffmpeg_path):
+    os.environ['PATH'] = ffmpeg_path + os.pathsep + os.environ['PATH']
+
+# Check dependencies
+def check_dependency(module_name, package_name=None):
+    try:
+        __import__(module_name)
+        return True
+    except ImportError:
+        print(f"Warning: {module_name} not installed.")
+        return False
+
+# Check if FFmpeg is available
+def check_ffmpeg():
+    try:
+        result = subprocess.run(['ffmpeg', '-version'], 
+                              capture_output=True, text=True, timeout=5)
+        return result.returncode == 0
+    except:
+        return False
+
+# Import modules if available
+FFMPEG_AVAILABLE = check_ffmpeg()
+PDF_SUPPORT = check_dependency('PyPDF2') or check_dependency('pypdf2')
+DOCX_SUPPORT = check_dependency('docx')
+AUDIO_SUPPORT = check_dependency('pydub') and FFMPEG_AVAILABLE
+FITZ_SUPPORT = check_dependency('fitz')
+REPORTLAB_SUPPORT = check_dependency('reportlab')
+PPTX_SUPPORT = check_dependency('pptx')
+COMTYPES_SUPPORT = check_dependency('comtypes')
+
+if FITZ_SUPPORT:
+    import fitz
+if REPORTLAB_SUPPORT:
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter, A4
+if AUDIO_SUPPORT:
+    from pydub import AudioSegment
+if PPTX_SUPPORT:
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN
+
+
+def get_supported_formats():
+    """Input categories -> extensions / target formats available with the installed libraries"""
+    formats = {
+        'Images': {
+            'extensions': ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp', '.tiff', '.ico'],
+            'convert_to': ['PNG', 'JPEG', 'BMP', 'GIF', 'WEBP', 'PDF', 'PPTX', 'TIFF'],
+            'category': 'image',
+            'icon': '🖼️'
+        },
+        'PDF': {
+            'extensions': ['.pdf'],
+            'convert_to': ['PNG', 'JPG', 'TXT', 'PPTX'] + (['PDF/A'] if FITZ_SUPPORT else []),
+            'category': 'document',
+            'icon': '📄'
+        },
+        'Documents': {
+            'extensions': ['.docx', '.doc', '.txt', '.rtf'],
+            'convert_to': ['PDF', 'TXT'] + (['DOCX'] if DOCX_SUPPORT else []),
+            'category': 'document',
+            'icon': '📝'
+        },
+        'Presentations': {
+            'extensions': ['.pptx', '.ppt'],
+            'convert_to': ['PDF', 'PNG', 'JPG', 'TXT'] + (['PPTX'] if PPTX_SUPPORT else []),
+            'category': 'presentation',
+            'icon': '📊'
+        },
+        'Audio': {
+            'extensions': ['.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'],
+            'convert_to': ['MP3', 'WAV', 'OGG', 'FLAC'] if AUDIO_SUPPORT else [],
+            'category': 'audio',
+            'icon': '🎵'
+        }
+    }
+    
+    # Remove empty categories
+    return {k: v for k, v in formats.items() if v['convert_to']}
+
+
+def extension_map(supported_formats):
+    """'.ext' -> category name, so files are classified without one listing per extension"""
+    return {ext.lower(): category
+            for category, info in supported_formats.items()
+            for ext in info['extensions']}
+
+
+def _matches(rel_path, name, patterns):
+    return any(fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, pattern)
+               for pattern in patterns)
+
+
+def _relative(path, root):
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+
+def scan_files(root, supported_formats, recursive=False, include=None, exclude=None, sort=False):
+    """
+    Yield (path, category) for every supported file in `root`, reading each
+    directory with a single os.scandir() and classifying by extension
+    (case-insensitive). Results stream out as the listing goes, so large
+    folders and network shares don't have to be read in full first; with
+    sort=True each directory is listed in full and yielded in name order.
+    
+    include / exclude are glob patterns matched against the file name or
+    its path relative to `root` ("/" separated): a file must match one
+    include pattern (if any are given) and no exclude pattern. Excluded
+    folders are not descended into when scanning recursively, and neither
+    are symlinked folders, so link cycles can't make the scan endless.
+    """
+    categories = extension_map(supported_formats)
+    include = list(include or [])
+    exclude = list(exclude or [])
+    patterns = bool(include or exclude)
+    root = str(root)
+    
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError as e:
+            print(f"Warning: cannot read {directory}: {e}", file=sys.stderr)
+            continue
+        
+        subdirs = []
+        with it:
+            entries = sorted(it, key=lambda entry: entry.name) if sort else it
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not (exclude and _matches(_relative(entry.path, root), entry.name, exclude)):
+                            subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                
+                category = categories.get(os.path.splitext(entry.name)[1].lower())
+                if category is None:
+                    continue
+                # relpath() only for files that get matched against patterns
+                rel_path = _relative(entry.path, root) if patterns else None
+                if include and not _matches(rel_path, entry.name, include):
+                    continue
+                if exclude and _matches(rel_path, entry.name, exclude):
+                    continue
+                yield Path(entry.path), category
+        
+        # Depth-first (in name order with sort=True)
+        pending.extend(reversed(subdirs))
+
+
+def output_name(input_path, target_format):
+    """File name a converted file gets: <stem>_converted.<format>"""
+    return f"{Path(input_path).stem}_converted.{target_format.lower()}"
+
+
+def page_output_path(output_path, page_number):
+    """Where page N (1-based) goes when a multi-page PDF is converted to images"""
+    name, ext = os.path.splitext(output_path)
+    return f"{name}_page_{page_number}{ext}"
+
+
+# -------------------------
+# Batch planning
+# -------------------------
+COLLISION_POLICIES = ('overwrite', 'rename', 'skip')
+
+
+CONVERTER_OUTPUT_REASON = "named like converter output (*_converted)"
+
+
+class BatchPlan:
+    """Result of plan_batch: what to convert, and what was left out and why"""
+    
+    def __init__(self):
+        self.jobs = []          # (input_path, output_path)
+        self.skipped = []       # (input_path, output_path or None, reason)
+
+
+def skip_summary(skipped):
+    """'3 up to date, 1 named like converter output (*_converted)' for BatchPlan.skipped"""
+    counts = Counter(reason for _, _, reason in skipped)
+    return ", ".join(f"{n} {reason}" for reason, n in counts.most_common())
+
+
+def _is_up_to_date(input_path, output_path):
+    try:
+        return os.stat(output_path).st_mtime >= os.stat(input_path).st_mtime
+    except OSError:
+        return False
+
+
+def _written_with(cache, input_path, output_path, target_format, options):
+    """
+    True if output_path was last written with these options (always True
+    without options / cache). Outputs with no recorded settings count if
+    they hold the cached conversion of input_path with these options.
+    """
+    if options is None or cache is None:
+        return True
+    try:
+        written_with = cache.output_written_with(output_path, target_format, options)
+        if written_with is None and os.path.isfile(output_path):
+            written_with = cache.holds(cache.key(input_path, target_format, options), output_path)
+            if written_with:
+                cache.record_output(output_path, target_format, options)
+        return bool(written_with)
+    except (sqlite3.Error, OSError):
+        return False
+
+
+def _existing_output(input_path, output_path):
+    """
+    The file showing input_path was converted to output_path, or None.
+    Multi-page PDFs converted to images write <output>_page_N instead of
+    the output itself, so their first page stands for the whole set.
+    """
+    if os.path.exists(output_path):
+        return output_path
+    if Path(input_path).suffix.lower() == '.pdf':
+        first_page = page_output_path(output_path, 1)
+        if os.path.exists(first_page):
+            return first_page
+    return None
+
+
+def _numbered(output_path, n):
+    stem, suffix = os.path.splitext(output_path)
+    return f"{stem} ({n}){suffix}"
+
+
+def plan_batch(sources, target_format, dest_root=None, collision='overwrite', skip_up_to_date=True,
+               options=None, cache=None):
+    """
+    Decide every output path of a batch before anything is converted, so the
+    run needs no questions and an interrupted run can simply be started again.
+    
+    sources are (input_path, source_root) pairs. Outputs go next to their
+    input, or under dest_root in the same subfolder the input has below its
+    source_root. When an output already exists:
+      - it is skipped if skip_up_to_date and it is newer than its input
+        and, given `options` and a ConversionCache, was written with them
+      - otherwise `collision` decides: 'overwrite' it, 'rename' the new
+        output to "name (1).ext", or 'skip' the input
+    Inputs that would share an output (photo.png and photo.jpg -> PDF) get
+    numbered names in input order, and files produced by an earlier run
+    (*_converted.<format>, numbered or not, including the *_page_N images
+    of multi-page PDFs) are never converted again; they are listed in
+    skipped with CONVERTER_OUTPUT_REASON, so a user's own file that only
+    happens to be named like that shows up in the report.
+    """
+    if collision not in COLLISION_POLICIES:
+        raise ValueError(f"Unknown collision policy: {collision}")
+    
+    plan = BatchPlan()
+    converted_name = re.compile(rf"_converted( \(\d+\))?(_page_\d+)?\.{re.escape(target_format)}$", re.IGNORECASE)
+    planned = set()
+    
+    for input_path, source_root in sources:
+        input_path = Path(input_path)
+        if converted_name.search(input_path.name):
+            plan.skipped.append((str(input_path), None, CONVERTER_OUTPUT_REASON))
+            continue
+        
+        if dest_root:
+            try:
+                subfolder = input_path.parent.relative_to(source_root)
+            except (TypeError, ValueError):
+                subfolder = Path()
+            output_path = str(Path(dest_root) / subfolder / output_name(input_path, target_format))
+        else:
+            output_path = str(input_path.parent / output_name(input_path, target_format))
+        
+        n = 1
+        base_path = output_path
+        while output_path in planned:
+            output_path = _numbered(base_path, n)
+            n += 1
+        
+        def up_to_date(candidate):
+            existing = _existing_output(input_path, candidate)
+            return (skip_up_to_date and existing is not None and _is_up_to_date(input_path, existing)
+                    and _written_with(cache, input_path, candidate, target_format, options))
+        
+        if _existing_output(input_path, output_path):
+            if up_to_date(output_path):
+                planned.add(output_path)
+                plan.skipped.append((str(input_path), output_path, "up to date"))
+                continue
+            if collision == 'skip':
+                plan.skipped.append((str(input_path), output_path, "output exists"))
+                continue
+            if collision == 'rename':
+                # A numbered output from an earlier run with these options still counts
+                base_path = output_path
+                while output_path in planned or _existing_output(input_path, output_path):
+                    output_path = _numbered(base_path, n)
+                    n += 1
+                    if output_path not in planned and up_to_date(output_path):
+                        break
+                if up_to_date(output_path):
+                    planned.add(output_path)
+                    plan.skipped.append((str(input_path), output_path, "up to date"))
+                    continue
+        
+        planned.add(output_path)
+        plan.jobs.append((str(input_path), output_path))
+    
+    return plan
+
+
+# Defaults match the GUI controls
+DEFAULT_OPTIONS = {
+    'quality': 85,
+    'pdf_ppt_options': "One slide per page",
+    'ppt_layout': "Single Image",
+}
+
+PPT_LAYOUTS = ["Single Image", "Multiple Images - One per Slide", "Grid Layout (2x2)", "Grid Layout (3x3)"]
+PDF_PPT_OPTIONS = ["One slide per page", "Extract text content", "High quality images", "Fast conversion"]
+
+
+class FileConverter:
+    """
+    The conversion routines. Options are plain values (see DEFAULT_OPTIONS);
+    progress / warning messages go to the `log` callback (print by default).
+    """
+    
+    def __init__(self, options=None, log=None):
+        options = {**DEFAULT_OPTIONS, **(options or {})}
+        self.quality = int(options['quality'])
+        self.pdf_ppt_options = options['pdf_ppt_options']
+        self.ppt_layout = options['ppt_layout']
+        self.supported_formats = get_supported_formats()
+        self.log = log or print
+    
+    def log_message(self, message):
+        self.log(message)
+    
+    def convert_image(self, input_path, output_path, target_format):
+        """Convert image files to various formats"""
+        try:
+            if target_format.upper() == 'PPTX':
+                return self.image_to_pptx(input_path, output_path)
+            elif target_format.upper() == 'PDF/A':
+                # Convert to standard PDF first
+                with Image.open(input_path) as img:
+                    if img.mode in ('RGBA', 'P'):
+                        img = img.convert('RGB')
+                    img.save(output_path.replace('.pdfa', '.pdf'), 'PDF', resolution=100.0)
+                return True, "Converted to PDF (PDF/A requires specialized library)"
+            else:
+                with Image.open(input_path) as img:
+                    if target_format.lower() in ['jpeg', 'jpg']:
+                        if img.mode in ('RGBA', 'P'):
+                            img = img.convert('RGB')
+                        img.save(output_path, quality=self.quality)
+                    elif target_format.upper() == 'PDF':
+                        if img.mode in ('RGBA', 'P'):
+                            img = img.convert('RGB')
+                        img.save(output_path, 'PDF', resolution=100.0)
+                    else:
+                        img.save(output_path)
+                return True, "Success"
+        except Exception as e:
+            return False, str(e)
+    
+    def convert_pdf(self, input_path, output_path, target_format):
+        """Convert PDF files"""
+        try:
+            if not FITZ_SUPPORT:
+                return False, "PDF conversion requires PyMuPDF (fitz)"
+            
+            if target_format.upper() in ['PNG', 'JPG']:
+                return self.convert_pdf_to_image(input_path, output_path, target_format)
+            elif target_format.upper() == 'TXT':
+                return self.convert_pdf_to_text(input_path, output_path)
+            elif target_format.upper() == 'PPTX':
+                return self.pdf_to_pptx_advanced(input_path, output_path)
+            elif target_format.upper() == 'PDF/A':
+                # Simple PDF to PDF/A conversion (basic implementation)
+                doc = fitz.open(input_path)
+                doc.save(output_path, garbage=4, deflate=True, clean=True)
+                doc.close()
+                return True, "Converted to optimized PDF"
+            else:
+                return False, f"Unsupported PDF conversion: {target_format}"
+                
+        except Exception as e:
+            return False, str(e)
+    
+    def convert_pdf_to_text(self, input_path, output_path):
+        """Convert PDF to text"""
+        try:
+            doc = fitz.open(input_path)
+            text = ""
+            for page in doc:
+                text += page.get_text() + "\n"
+            doc.close()
+            
+            with open(output_path, 'w', encoding='utf-8') as file:
+                file.write(text)
+            return True, "Success"
+        except Exception as e:
+            return False, str(e)
+    
+    def convert_pdf_to_image(self, input_path, output_path, target_format):
+        """Convert PDF to images"""
+        try:
+            doc = fitz.open(input_path)
+            output_files = []
+            
+            for page_num in range(len(doc)):
+                page = doc.load_page(page_num)
+                pix = page.get_pixmap()
+                
+                if len(doc) == 1:
+                    # Single page - use original output path
+                    page_output = output_path
+                else:
+                    # Multiple pages - add page number
+                    page_output = page_output_path(output_path, page_num + 1)
+                
+                if target_format.upper() == 'JPG':
+                    pix.save(page_output)
+                else:
+                    pix.save(page_output)
+                
+                output_files.append(page_output)
+            
+            doc.close()
+            return True, f"Created {len(output_files)} pages"
+        except Exception as e:
+            return False, str(e)
+    
+    def pdf_to_pptx_advanced(self, input_path, output_path):
+        """Advanced PDF to PowerPoint conversion with multiple strategies"""
+        try:
+            if not PPTX_SUPPORT:
+                return False, "PPTX conversion requires python-pptx"
+            if not FITZ_SUPPORT:
+                return False, "PDF to PPTX requires PyMuPDF (fitz)"
+            
+            doc = fitz.open(input_path)
+            total_pages = len(doc)
+            
+            # Create a new presentation
+            prs = Presentation()
+            blank_slide_layout = prs.slide_layouts[6]  # Blank layout
+            
+            conversion_mode = self.pdf_ppt_options
+            # Per-job folder: pool workers convert several PDFs at once
+            temp_dir = tempfile.TemporaryDirectory(prefix="pdf_to_pptx_")
+            
+            try:
+                for page_num in range(total_pages):
+                    page = doc.load_page(page_num)
+                    
+                    if conversion_mode == "Extract text content":
+                        # Strategy 1: Extract text and create text-based slides
+                        success = self._create_text_slide(prs, page, page_num, blank_slide_layout)
+                        if not success:
+                            # Fallback to image-based conversion
+                            success = self._create_image_slide(prs, page, page_num, blank_slide_layout, temp_dir.name)
+                    
+                    elif conversion_mode == "High quality images":
+                        # Strategy 2: High-quality image conversion
+                        success = self._create_high_quality_image_slide(prs, page, page_num, blank_slide_layout, temp_dir.name)
+                    
+                    else:
+                        # Strategy 3: Standard image conversion (default)
+                        success = self._create_image_slide(prs, page, page_num, blank_slide_layout, temp_dir.name)
+                    
+                    if not success:
+                        self.log_message(f"Warning: Failed to convert page {page_num + 1}")
+                
+                # Save the presentation
+                prs.save(output_path)
+                result_message = f"Converted {total_pages} PDF pages to PowerPoint"
+                
+                if conversion_mode == "Extract text content":
+                    result_message += " (text-based)"
+                elif conversion_mode == "High quality images":
+                    result_message += " (high-quality images)"
+                else:
+                    result_message += " (standard images)"
+                
+                return True, result_message
+                
+            finally:
+                # Clean up temporary files
+                temp_dir.cleanup()
+                doc.close()
+                
+        except Exception as e:
+            return False, f"PDF to PPTX conversion error: {str(e)}"
+    
+    def _create_text_slide(self, prs, page, page_num, blank_slide_layout):
+        """Create a slide from extracted PDF text"""
+        try:
+            text = page.get_text()
+            if not text.strip():
+                return False  # No text found, fallback to image
+            
+            slide = prs.slides.add_slide(blank_slide_layout)
+            
+            # Add title
+            title_shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+            title_frame = title_shape.text_frame
+            title_frame.text = f"Page {page_num + 1}"
+            title_frame.paragraphs[0].font.size = Pt(24)
+            title_frame.paragraphs[0].font.bold = True
+            
+            # Add content
+            content_shape = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+            content_frame = content_shape.text_frame
+            content_frame.text = text[:2000]  # Limit text length
+            content_frame.paragraphs[0].font.size = Pt(12)
+            
+            return True
+        except:
+            return False
+    
+    def _create_image_slide(self, prs, page, page_num, blank_slide_layout, temp_dir):
+        """Create a slide from PDF page image (standard quality)"""
+        try:
+            # Render page as image
+            mat = fitz.Matrix(1.5, 1.5)  # Standard resolution
+            pix = page.get_pixmap(matrix=mat)
+            img_data = pix.tobytes("png")
+            
+            # Save temporary image
+            temp_img_path = os.path.join(temp_dir, f"page_{page_num}.png")
+            with open(temp_img_path, "wb") as f:
+                f.write(img_data)
+            
+            # Create slide and add image
+            slide = prs.slides.add_slide(blank_slide_layout)
+            
+            # Calculate image dimensions to fit slide
+            slide_width = Inches(10)
+            slide_height = Inches(7.5)
+            img_ratio = pix.width / pix.height
+            
+            if img_ratio > (slide_width / slide_height):
+                width = slide_width
+                height = width / img_ratio
+            else:
+                height = slide_height
+                width = height * img_ratio
+            
+            left = (slide_width - width) / 2
+            top = (slide_height - height) / 2
+            
+            slide.shapes.add_picture(BytesIO(img_data), left, top, width, height)
+            
+            return True
+        except:
+            return False
+    
+    def _create_high_quality_image_slide(self, prs, page, page_num, blank_slide_layout, temp_dir):
+        """Create a slide from PDF page image (high quality)"""
+        try:
+            # Render page as high-quality image
+            mat = fitz.Matrix(2.0, 2.0)  # Higher resolution
+            pix = page.get_pixmap(matrix=mat)
+            img_data = pix.tobytes("png")
+            
+            # Save temporary image
+            temp_img_path = os.path.join(temp_dir, f"page_hq_{page_num}.png")
+            with open(temp_img_path, "wb") as f:
+                f.write(img_data)
+            
+            # Create slide and add image
+            slide = prs.slides.add_slide(blank_slide_layout)
+            
+            # Calculate image dimensions to fit slide
+            slide_width = Inches(10)
+            slide_height = Inches(7.5)
+            img_ratio = pix.width / pix.height
+            
+            if img_ratio > (slide_width / slide_height):
+                width = slide_width
+                height = width / img_ratio
+            else:
+                height = slide_height
+                width = height * img_ratio
+            
+            left = (slide_width - width) / 2
+            top = (slide_height - height) / 2
+            
+            slide.shapes.add_picture(BytesIO(img_data), left, top, width, height)
+            
+            return True
+        except:
+            return False
+    
+    def image_to_pptx(self, input_path, output_path):
+        """Convert image to PowerPoint presentation"""
+        try:
+            if not PPTX_SUPPORT:
+                return False, "PPTX conversion requires python-pptx"
+            
+            from pptx import Presentation
+            from pptx.util import Inches
+            
+            prs = Presentation()
+            blank_slide_layout = prs.slide_layouts[6]
+            
+            slide = prs.slides.add_slide(blank_slide_layout)
+            
+            with Image.open(input_path) as img:
+                img_width, img_height = img.size
+                img_ratio = img_width / img_height
+            
+            slide_width = Inches(10)
+            slide_height = Inches(7.5)
+            
+            if img_ratio > (slide_width / slide_height):
+                width = slide_width
+                height = width / img_ratio
+            else:
+                height = slide_height
+                width = height * img_ratio
+            
+            left = (slide_width - width) / 2
+            top = (slide_height - height) / 2
+            
+            slide.shapes.add_picture(input_path, left, top, width, height)
+            
+            prs.save(output_path)
+            return True, "Created PowerPoint with 1 slide"
+            
+        except Exception as e:
+            return False, f"Image to PPTX error: {str(e)}"
+    
+    def images_to_pptx_batch(self, image_paths, output_path):
+        """Convert multiple images to a single PowerPoint presentation"""
+        try:
+            if not PPTX_SUPPORT:
+                return False, "PPTX conversion requires python-pptx"
+            
+            from pptx import Presentation
+            from pptx.util import Inches
+            
+            prs = Presentation()
+            blank_slide_layout = prs.slide_layouts[6]
+            
+            layout = self.ppt_layout
+            
+            if layout == "Multiple Images - One per Slide":
+                for img_path in image_paths:
+                    slide = prs.slides.add_slide(blank_slide_layout)
+                    
+                    with Image.open(img_path) as img:
+                        img_width, img_height = img.size
+                        img_ratio = img_width / img_height
+                    
+                    slide_width = Inches(10)
+                    slide_height = Inches(7.5)
+                    
+                    if img_ratio > (slide_width / slide_height):
+                        width = slide_width
+                        height = width / img_ratio
+                    else:
+                        height = slide_height
+                        width = height * img_ratio
+                    
+                    left = (slide_width - width) / 2
+                    top = (slide_height - height) / 2
+                    
+                    slide.shapes.add_picture(str(img_path), left, top, width, height)
+            
+            prs.save(output_path)
+            return True, f"Created PowerPoint with {len(image_paths)} slides"
+            
+        except Exception as e:
+            return False, f"Batch images to PPTX error: {str(e)}"
+    
+    def images_to_pdf_batch(self, image_paths, output_path):
+        """Convert multiple images to a single PDF"""
+        try:
+            images = []
+            for p in image_paths:
+                img = Image.open(p)
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                images.append(img)
+            
+            if images:
+                images[0].save(output_path, "PDF", resolution=100.0, save_all=True, append_images=images[1:])
+                return True, f"Created PDF with {len(images)} pages"
+            return False, "No images"
+        except Exception as e:
+            return False, str(e)
+    
+    def convert_presentation(self, input_path, output_path, target_format):
+        """Convert PowerPoint presentations to various formats"""
+        try:
+            if not PPTX_SUPPORT:
+                return False, "PowerPoint conversion requires python-pptx"
+            
+            file_ext = Path(input_path).suffix.lower()
+            
+            if target_format.upper() == 'PDF':
+                return self.ppt_to_pdf(input_path, output_path)
+            elif target_format.upper() in ['PNG', 'JPG']:
+                return self.ppt_to_images(input_path, output_path, target_format)
+            elif target_format.upper() == 'TXT':
+                return self.ppt_to_text(input_path, output_path)
+            elif target_format.upper() == 'PPTX':
+                if file_ext == '.pptx':
+                    prs = Presentation(input_path)
+                    prs.save(output_path)
+                    return True, "Converted presentation format"
+                elif file_ext == '.ppt' and COMTYPES_SUPPORT:
+                    import comtypes.client
+                    powerpoint = comtypes.client.CreateObject('Powerpoint.Application')
+                    powerpoint.Visible = False
+                    abs_input = os.path.abspath(input_path)
+                    abs_output = os.path.abspath(output_path)
+                    pres = powerpoint.Presentations.Open(abs_input)
+                    pres.SaveAs(abs_output, 11)  # 11 = ppSaveAsOpenXMLPresentation
+                    pres.Close()
+                    powerpoint.Quit()
+                    return True, "Converted to PPTX"
+                else:
+                    return False, "Cannot convert to PPTX"
+            else:
+                return False, f"Unsupported presentation conversion: {target_format}"
+                
+        except Exception as e:
+            return False, f"Presentation conversion error: {str(e)}"
+    
+    def ppt_to_pdf(self, input_path, output_path):
+        """Convert PowerPoint to PDF"""
+        try:
+            if COMTYPES_SUPPORT:
+                import comtypes.client
+                powerpoint = comtypes.client.CreateObject('Powerpoint.Application')
+                powerpoint.Visible = False
+                abs_input = os.path.abspath(input_path)
+                abs_output = os.path.abspath(output_path)
+                pres = powerpoint.Presentations.Open(abs_input)
+                pres.SaveAs(abs_output, 32)  # 32 = ppSaveAsPDF
+                pres.Close()
+                powerpoint.Quit()
+                return True, "Success"
+            else:
+                # Fallback to text-based
+                prs = Presentation(input_path)
+                return self._create_pdf_from_ppt_text(prs, output_path)
+                
+        except Exception as e:
+            return False, f"PPT to PDF error: {str(e)}"
+    
+    def _create_pdf_from_ppt_text(self, prs, output_path):
+        """Create a simple PDF from PowerPoint text content"""
+        try:
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import letter
+            
+            c = canvas.Canvas(output_path, pagesize=letter)
+            width, height = letter
+            
+            y_position = height - 50
+            c.setFont("Helvetica", 16)
+            c.drawString(50, y_position, f"Presentation: {len(prs.slides)} Slides")
+            y_position -= 30
+            
+            for i, slide in enumerate(prs.slides):
+                if y_position < 100:
+                    c.showPage()
+                    y_position = height - 50
+                    c.setFont("Helvetica", 12)
+                
+                c.setFont("Helvetica-Bold", 14)
+                c.drawString(50, y_position, f"Slide {i+1}:")
+                y_position -= 20
+                c.setFont("Helvetica", 10)
+                
+                for shape in slide.shapes:
+                    if hasattr(shape, "text") and shape.text.strip():
+                        lines = shape.text.split('\n')
+                        for line in lines:
+                            if line.strip():
+                                if y_position < 50:
+                                    c.showPage()
+                                    y_position = height - 50
+                                    c.setFont("Helvetica", 10)
+                                c.drawString(70, y_position, line.strip())
+                                y_position -= 15
+                
+                y_position -= 10
+            
+            c.save()
+            return True, f"Created PDF with {len(prs.slides)} slides content"
+        except Exception as e:
+            return False, f"PDF creation error: {str(e)}"
+    
+    def ppt_to_images(self, input_path, output_path, target_format):
+        """Convert PowerPoint to images"""
+        try:
+            if not COMTYPES_SUPPORT:
+                return False, "COM not available for PPT rendering"
+            import comtypes.client
+            powerpoint = comtypes.client.CreateObject('Powerpoint.Application')
+            powerpoint.Visible = True  # May need to be visible for export
+            pres = powerpoint.Presentations.Open(os.path.abspath(input_path))
+            base_name, _ = os.path.splitext(output_path)
+            export_folder = base_name + "_slides"
+            os.makedirs(export_folder, exist_ok=True)
+            pres.Export(export_folder, target_format.upper())
+            pres.Close()
+            powerpoint.Quit()
+            return True, f"Exported slides to {export_folder}"
+        except Exception as e:
+            return False, str(e)
+    
+    def ppt_to_text(self, input_path, output_path):
+        """Extract text from PowerPoint presentation"""
+        try:
+            if not PPTX_SUPPORT:
+                return False, "PPT to text requires python-pptx"
+            
+            prs = Presentation(input_path)
+            text_content = []
+            
+            for i, slide in enumerate(prs.slides):
+                text_content.append(f"--- Slide {i+1} ---")
+                for shape in slide.shapes:
+                    if hasattr(shape, "text"):
+                        text_content.append(shape.text)
+                text_content.append("")  # Empty line between slides
+            
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(text_content))
+            
+            return True, f"Extracted text from {len(prs.slides)} slides"
+            
+        except Exception as e:
+            return False, f"PPT to text error: {str(e)}"
+    
+    def convert_document(self, input_path, output_path, target_format):
+        """Convert document files"""
+        file_ext = Path(input_path).suffix.lower()
+        if target_format.upper() == 'TXT':
+            return self.document_to_text(input_path, output_path)
+        elif target_format.upper() == 'PDF':
+            return self.document_to_pdf(input_path, output_path)
+        elif target_format.upper() == 'DOCX':
+            return self.document_to_docx(input_path, output_path)
+        else:
+            return False, "Unsupported"
+    
+    def document_to_text(self, input_path, output_path):
+        """Convert document to text"""
+        try:
+            file_ext = Path(input_path).suffix.lower()
+            if file_ext == '.txt':
+                with open(input_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                return True, "Success"
+            elif file_ext == '.docx' and DOCX_SUPPORT:
+                from docx import Document
+                doc = Document(input_path)
+                text = '\n'.join([para.text for para in doc.paragraphs])
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                return True, "Success"
+            elif COMTYPES_SUPPORT and file_ext in ('.doc', '.rtf', '.docx'):
+                import comtypes.client
+                word = comtypes.client.CreateObject('Word.Application')
+                word.Visible = False
+                doc = word.Documents.Open(os.path.abspath(input_path))
+                doc.SaveAs(os.path.abspath(output_path), FileFormat=0)  # 0 = txt
+                doc.Close()
+                word.Quit()
+                return True, "Success"
+            else:
+                return False, "Cannot extract text"
+        except Exception as e:
+            return False, str(e)
+    
+    def document_to_pdf(self, input_path, output_path):
+        """Convert document to PDF"""
+        try:
+            file_ext = Path(input_path).suffix.lower()
+            if COMTYPES_SUPPORT:
+                import comtypes.client
+                word = comtypes.client.CreateObject('Word.Application')
+                word.Visible = False
+                abs_input = os.path.abspath(input_path)
+                abs_output = os.path.abspath(output_path)
+                doc = word.Documents.Open(abs_input)
+                doc.SaveAs(abs_output, FileFormat=17)  # 17 = wdFormatPDF
+                doc.Close()
+                word.Quit()
+                return True, "Success"
+            elif file_ext == '.txt' and REPORTLAB_SUPPORT:
+                from reportlab.pdfgen import canvas
+                from reportlab.lib.pagesizes import letter
+                c = canvas.Canvas(output_path, pagesize=letter)
+                width, height = letter
+                y = height - 50
+                c.setFont("Helvetica", 12)
+                with open(input_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if y < 50:
+                            c.showPage()
+                            y = height - 50
+                            c.setFont("Helvetica", 12)
+                        c.drawString(50, y, line.strip())
+                        y -= 15
+                c.save()
+                return True, "Success"
+            elif file_ext == '.docx' and DOCX_SUPPORT and REPORTLAB_SUPPORT:
+                from docx import Document
+                from reportlab.pdfgen import canvas
+                from reportlab.lib.pagesizes import letter
+                doc = Document(input_path)
+                text = '\n'.join([para.text for para in doc.paragraphs])
+                c = canvas.Canvas(output_path, pagesize=letter)
+                width, height = letter
+                y = height - 50
+                c.setFont("Helvetica", 12)
+                for line in text.split('\n'):
+                    if y < 50:
+                        c.showPage()
+                        y = height - 50
+                        c.setFont("Helvetica", 12)
+                    c.drawString(50, y, line.strip())
+                    y -= 15
+                c.save()
+                return True, "Success"
+            else:
+                return False, "Cannot convert to PDF"
+        except Exception as e:
+            return False, str(e)
+    
+    def document_to_docx(self, input_path, output_path):
+        """Convert document to DOCX"""
+        try:
+            if not DOCX_SUPPORT:
+                return False, "python-docx not available"
+            file_ext = Path(input_path).suffix.lower()
+            from docx import Document
+            if file_ext == '.docx':
+                doc = Document(input_path)
+                doc.save(output_path)
+                return True, "Success"
+            elif file_ext == '.txt':
+                doc = Document()
+                with open(input_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        doc.add_paragraph(line.strip())
+                doc.save(output_path)
+                return True, "Success"
+            elif COMTYPES_SUPPORT and file_ext in ('.doc', '.rtf'):
+                import comtypes.client
+                word = comtypes.client.CreateObject('Word.Application')
+                word.Visible = False
+                abs_input = os.path.abspath(input_path)
+                abs_output = os.path.abspath(output_path)
+                doc = word.Documents.Open(abs_input)
+                doc.SaveAs(abs_output, FileFormat=16)  # 16 = wdFormatXMLDocument
+                doc.Close()
+                word.Quit()
+                return True, "Success"
+            else:
+                return False, "Cannot convert to DOCX"
+        except Exception as e:
+            return False, str(e)
+    
+    def convert_audio(self, input_path, output_path, target_format):
+        """Convert audio files"""
+        try:
+            audio = AudioSegment.from_file(input_path)
+            audio.export(output_path, format=target_format.lower())
+            return True, "Success"
+        except Exception as e:
+            return False, str(e)
+    
+    def convert_path(self, input_path, output_path, target_format):
+        """Route one file to the converter for its category"""
+        file_ext = Path(input_path).suffix.lower()
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if file_ext in self.supported_formats.get('Images', {}).get('extensions', []):
+            return self.convert_image(input_path, output_path, target_format)
+        elif file_ext in self.supported_formats.get('PDF', {}).get('extensions', []):
+            return self.convert_pdf(input_path, output_path, target_format)
+        elif file_ext in self.supported_formats.get('Documents', {}).get('extensions', []):
+            return self.convert_document(input_path, output_path, target_format)
+        elif file_ext in self.supported_formats.get('Presentations', {}).get('extensions', []):
+            return self.convert_presentation(input_path, output_path, target_format)
+        elif file_ext in self.supported_formats.get('Audio', {}).get('extensions', []):
+            return self.convert_audio(input_path, output_path, target_format)
+        return False, f"Unsupported file type: {file_ext}"
+
+
+# -------------------------
+# Conversion cache
+# -------------------------
+DEFAULT_CACHE_PATH = Path.home() / ".universal_converter" / "conversion_cache.sqlite3"
+
+
+def file_checksum(path, chunk_size=1 << 20):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """
+    Finished conversions, persisted in SQLite and keyed by (input content
+    hash, target format, conversion options), each with the output path it
+    produced and that output's checksum.
+    
+    A lookup hits only while the recorded output still has its recorded
+    checksum; if the batch wants the result somewhere else it is copied
+    there. Checksums are remembered per (path, size, mtime), so unchanged
+    files are hashed once. Conversions that write several files (PDF pages,
+    exported slides) are not cached.
+    
+    It also remembers the format and options every batch output was last
+    written with, so plan_batch can tell an output made with other
+    settings from an up-to-date one.
+    
+    Pool workers each open their own connection to the same file (WAL mode).
+    """
+    
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS checksums (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS conversions (
+                input_sha256 TEXT NOT NULL,
+                target_format TEXT NOT NULL,
+                options TEXT NOT NULL,
+                output_path TEXT NOT NULL,
+                output_sha256 TEXT NOT NULL,
+                created REAL NOT NULL,
+                PRIMARY KEY (input_sha256, target_format, options)
+            );
+            CREATE TABLE IF NOT EXISTS outputs (
+                path TEXT PRIMARY KEY,
+                target_format TEXT NOT NULL,
+                options TEXT NOT NULL
+            );
+        """)
+    
+    def checksum(self, path):
+        """Content hash of path, reusing the stored one while size and mtime match"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        row = self._db.execute(
+            "SELECT sha256 FROM checksums WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row:
+            return row[0]
+        
+        sha256 = file_checksum(path)
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?)",
+                             (path, stat.st_size, stat.st_mtime_ns, sha256))
+        return sha256
+    
+    @staticmethod
+    def options_key(options):
+        return json.dumps(options, sort_keys=True)
+    
+    def key(self, input_path, target_format, options):
+        return (self.checksum(input_path), target_format.lower(), self.options_key(options))
+    
+    def record_output(self, output_path, target_format, options):
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO outputs VALUES (?, ?, ?)",
+                             (os.path.abspath(output_path), target_format.lower(), self.options_key(options)))
+    
+    def output_written_with(self, output_path, target_format, options):
+        """
+        True if output_path was last written by a batch with this format and
+        these options, False if with others, None if that was never recorded
+        """
+        row = self._db.execute("SELECT target_format, options FROM outputs WHERE path = ?",
+                               (os.path.abspath(output_path),)).fetchone()
+        if row is None:
+            return None
+        return row == (target_format.lower(), self.options_key(options))
+    
+    def holds(self, key, output_path):
+        """True if output_path is where key's cached result was written, still unchanged"""
+        row = self._db.execute(
+            "SELECT output_path, output_sha256 FROM conversions "
+            "WHERE input_sha256 = ? AND target_format = ? AND options = ?", key).fetchone()
+        return bool(row) and row[0] == os.path.abspath(output_path) and self.checksum(output_path) == row[1]
+    
+    def lookup(self, key, output_path):
+        """True if output_path now holds the cached result for key"""
+        row = self._db.execute(
+            "SELECT output_path, output_sha256 FROM conversions "
+            "WHERE input_sha256 = ? AND target_format = ? AND options = ?", key).fetchone()
+        if not row:
+            return False
+        
+        cached_path, cached_sha256 = row
+        try:
+            if self.checksum(cached_path) != cached_sha256:
+                return False
+            if os.path.abspath(output_path) != cached_path:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                # copyfile, not copy2: the copy must be newer than its input,
+                # or plan_batch would never see it as up to date
+                shutil.copyfile(cached_path, output_path)
+        except OSError:
+            return False
+        return True
+    
+    def record(self, key, output_path):
+        if not os.path.isfile(output_path):
+            return
+        output_sha256 = self.checksum(output_path)
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?, ?)",
+                             key + (os.path.abspath(output_path), output_sha256, time.time()))
+    
+    def prune(self):
+        """
+        Forget checksums of files that are gone and conversions and output
+        settings whose output is gone; returns the number of rows removed. Stats every recorded
+        path, so it is run on request (converter_core cache prune), not per batch.
+        """
+        removed = 0
+        with self._db:
+            for table, column in (('checksums', 'path'), ('conversions', 'output_path'), ('outputs', 'path')):
+                rows = self._db.execute(f"SELECT DISTINCT {column} FROM {table}").fetchall()
+                # Multi-page PDF outputs only exist as their _page_N images
+                missing = [(path,) for (path,) in rows
+                           if not os.path.exists(path) and not os.path.exists(page_output_path(path, 1))]
+                removed += self._db.executemany(f"DELETE FROM {table} WHERE {column} = ?", missing).rowcount
+        return removed
+    
+    def close(self):
+        self._db.close()
+
+
+def open_cache(path):
+    """ConversionCache at path, or None (with a warning) if it can't be opened"""
+    try:
+        return ConversionCache(path)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: conversion cache unavailable, outputs are checked by date only: {e}",
+              file=sys.stderr)
+        return None
+
+
+# -------------------------
+# Batch conversion on a process pool
+# -------------------------
+_worker_converter = None
+_worker_cache = None
+_worker_log = []
+
+def _open_worker_cache(cache_path):
+    global _worker_cache
+    if _worker_cache is None or _worker_cache.path != Path(cache_path):
+        _worker_cache = ConversionCache(cache_path)
+    return _worker_cache
+
+
+def _convert_job(input_path, output_path, target_format, options, cache_path=None, reuse=True):
+    """
+    Runs in a pool process: convert one file, return (success, message, log lines, cache hit).
+    With a cache_path the output's settings are recorded, and with reuse the
+    result is also looked up in / added to the cache.
+    """
+    global _worker_converter
+    if _worker_converter is None or _worker_converter.options != options:
+        _worker_converter = FileConverter(options, log=_worker_log.append)
+        _worker_converter.options = options
+    
+    _worker_log.clear()
+    cache = key = None
+    if cache_path:
+        try:
+            cache = _open_worker_cache(cache_path)
+            if reuse:
+                key = cache.key(input_path, target_format, options)
+                if cache.lookup(key, output_path):
+                    cache.record_output(output_path, target_format, options)
+                    return True, "Cached", [], True
+        except (sqlite3.Error, OSError) as e:
+            _worker_log.append(f"Cache unavailable: {e}")
+            cache = None
+    
+    try:
+        success, message = _worker_converter.convert_path(input_path, output_path, target_format)
+    except Exception as e:
+        success, message = False, str(e)
+    
+    if success and cache is not None:
+        try:
+            cache.record_output(output_path, target_format, options)
+            if key is not None:
+                cache.record(key, output_path)
+        except (sqlite3.Error, OSError) as e:
+            _worker_log.append(f"Could not cache result: {e}")
+    return success, message, list(_worker_log), False
+
+
+class BatchEngine:
+    """
+    Converts a list of (input_path, output_path) jobs on a process pool,
+    so CPU-bound PIL / PyMuPDF work uses every core instead of one thread.
+    
+    At most 2 x workers files are submitted at a time: pausing stops new
+    submissions and cancelling drops everything not started yet, while the
+    files already in a worker finish. Each result is handed to on_result
+    (from the thread calling run()) as soon as it is ready.
+    
+    With a cache_path, every output's settings are recorded in the
+    ConversionCache (see plan_batch), and with reuse_cache files whose
+    content was already converted with the same format and options are
+    taken from it instead.
+    """
+    
+    def __init__(self, jobs, target_format, options, workers=None, on_result=None, cache_path=None,
+                 reuse_cache=True):
+        self.jobs = list(jobs)
+        self.target_format = target_format
+        self.options = options
+        self.workers = max(1, min(int(workers or os.cpu_count() or 1), len(self.jobs) or 1))
+        self.on_result = on_result
+        self.cache_path = str(cache_path) if cache_path else None
+        self.reuse_cache = reuse_cache
+        
+        self.done = 0
+        self.succeeded = 0
+        self.cache_hits = 0
+        self._resume = threading.Event()
+        self._resume.set()
+        self._cancel = threading.Event()
+    
+    @property
+    def paused(self):
+        return not self._resume.is_set()
+    
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+    
+    def pause(self):
+        self._resume.clear()
+    
+    def resume(self):
+        self._resume.set()
+    
+    def cancel(self):
+        self._cancel.set()
+        self._resume.set()
+    
+    def run(self):
+        """Blocks until every job finished (or the batch was cancelled); returns the success count"""
+        queue = deque(self.jobs)
+        in_flight = {}
+        window = self.workers * 2
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                if self.cancelled:
+                    queue.clear()
+                    for future in in_flight:
+                        future.cancel()
+                elif not self.paused:
+                    while queue and len(in_flight) < window:
+                        input_path, output_path = queue.popleft()
+                        future = pool.submit(_convert_job, input_path, output_path,
+                                             self.target_format, self.options, self.cache_path,
+                                             self.reuse_cache)
+                        in_flight[future] = (input_path, output_path)
+                
+                if not in_flight:
+                    if not queue:
+                        break
+                    self._resume.wait(0.2)      # paused with nothing running
+                    continue
+                
+                finished, _ = wait(in_flight, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    input_path, output_path = in_flight.pop(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        success, message, worker_log, cached = future.result()
+                    except Exception as e:
+                        # Worker process died (e.g. a crash inside a native library)
+                        success, message, worker_log, cached = False, f"Worker failed: {e}", [], False
+                    
+                    self.done += 1
+                    if success:
+                        self.succeeded += 1
+                    if cached:
+                        self.cache_hits += 1
+                    if self.on_result:
+                        self.on_result(input_path, output_path, success, message, cached, worker_log,
+                                       self.done, len(self.jobs))
+        
+        return self.succeeded
+
+
+# -------------------------
+# Command line
+# -------------------------
+def collect_files(sources, supported_formats, recursive=False, include=None, exclude=None):
+    """
+    Supported files among `sources` (files, or folders scanned with scan_files)
+    as (path, source_root) pairs for plan_batch
+    """
+    files = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            files.extend((path, source)
+                         for path, _ in scan_files(source, supported_formats, recursive, include, exclude,
+                                                   sort=True))
+        elif source.is_file():
+            files.append((source, source.parent))
+        else:
+            print(f"Warning: {source} not found, skipped", file=sys.stderr)
+    return files
+
+
+def cmd_convert(args):
+    supported_formats = get_supported_formats()
+    files = collect_files(args.sources, supported_formats, args.recursive, args.include, args.exclude)
+    if not files:
+        print("No supported files found.", file=sys.stderr)
+        return 1
+    
+    target_format = args.to.lower()
+    options = {
+        'quality': args.quality,
+        'pdf_ppt_options': args.pdf_ppt,
+        'ppt_layout': args.ppt_layout,
+    }
+    cache = open_cache(args.cache)
+    try:
+        plan = plan_batch(files, target_format, dest_root=args.out, collision=args.on_exists,
+                          skip_up_to_date=not args.force, options=options, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
+    if args.verbose:
+        for input_path, output_path, reason in plan.skipped:
+            print(f"- {input_path}: skipped ({reason})")
+    if plan.skipped:
+        print(f"Skipping {len(plan.skipped)} files ({skip_summary(plan.skipped)})")
+    jobs = plan.jobs
+    if not jobs:
+        print("Nothing to convert.")
+        return 0
+    
+    def report(input_path, output_path, success, message, cached, worker_log, done, total):
+        for line in worker_log:
+            print(f"  {os.path.basename(input_path)}: {line}")
+        if cached:
+            print(f"[{done}/{total}] ✓ {input_path} -> {output_path} (cached)")
+        elif success:
+            print(f"[{done}/{total}] ✓ {input_path} -> {output_path}")
+        else:
+            print(f"[{done}/{total}] ✗ {input_path}: {message}", file=sys.stderr)
+    
+    engine = BatchEngine(jobs, target_format, options, workers=args.jobs, on_result=report,
+                         cache_path=args.cache if cache is not None else None, reuse_cache=not args.no_cache)
+    print(f"Converting {len(jobs)} files to {target_format} ({engine.workers} workers)")
+    try:
+        converted = engine.run()
+    except KeyboardInterrupt:
+        engine.cancel()
+        print("Cancelled.", file=sys.stderr)
+        return 130
+    
+    failed = engine.done - converted
+    print(f"Done: {converted} converted ({engine.cache_hits} from cache), {failed} failed")
+    return 0 if failed == 0 else 1
+
+
+def cmd_formats(args):
+    for category, info in get_supported_formats().items():
+        print(f"{info['icon']} {category}: {' '.join(info['extensions'])} -> {', '.join(info['convert_to'])}")
+    return 0
+
+
+def cmd_cache_prune(args):
+    try:
+        cache = ConversionCache(args.cache)
+        try:
+            removed = cache.prune()
+        finally:
+            cache.close()
+    except sqlite3.Error as e:
+        print(f"Could not prune conversion cache: {e}", file=sys.stderr)
+        return 1
+    print(f"Removed {removed} stale cache entries from {args.cache}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="converter_core", description="Universal File Converter (headless)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    convert = commands.add_parser("convert", help="Convert files or every supported file in folders")
+    convert.add_argument("sources", nargs="+", metavar="SRC", help="File or folder to convert")
+    convert.add_argument("--recursive", "-r", action="store_true", help="Also convert files in subfolders")
+    convert.add_argument("--include", action="append", metavar="GLOB",
+                         help="Only files matching this pattern (name or relative path, repeatable)")
+    convert.add_argument("--exclude", action="append", metavar="GLOB",
+                         help="Skip files / folders matching this pattern (repeatable)")
+    convert.add_argument("--to", required=True, metavar="FORMAT", help="Target format, e.g. PNG, PDF, TXT, MP3")
+    convert.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                         help="Worker processes (default: CPU count)")
+    convert.add_argument("--out", "-o", metavar="DIR",
+                         help="Output folder, subfolders mirrored (default: next to each input)")
+    convert.add_argument("--on-exists", choices=COLLISION_POLICIES, default='overwrite',
+                         help="What to do when an out-of-date output exists (default: overwrite)")
+    convert.add_argument("--force", action="store_true",
+                         help="Convert even when the output is newer than its input")
+    convert.add_argument("--cache", metavar="FILE", default=str(DEFAULT_CACHE_PATH),
+                         help="Conversion cache database (default: %(default)s)")
+    convert.add_argument("--no-cache", action="store_true",
+                         help="Don't reuse earlier conversions (output settings are still recorded)")
+    convert.add_argument("--verbose", "-v", action="store_true", help="List skipped files")
+    convert.add_argument("--quality", type=int, default=DEFAULT_OPTIONS['quality'], help="Image quality 1-100")
+    convert.add_argument("--ppt-layout", choices=PPT_LAYOUTS, default=DEFAULT_OPTIONS['ppt_layout'])
+    convert.add_argument("--pdf-ppt", choices=PDF_PPT_OPTIONS, default=DEFAULT_OPTIONS['pdf_ppt_options'])
+    convert.set_defaults(func=cmd_convert)
+    
+    formats = commands.add_parser("formats", help="List supported input and target formats")
+    formats.set_defaults(func=cmd_formats)
+    
+    cache = commands.add_parser("cache", help="Maintain the conversion cache")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    prune = cache_commands.add_parser("prune", help="Forget entries whose files no longer exist")
+    prune.add_argument("--cache", metavar="FILE", default=str(DEFAULT_CACHE_PATH),
+                       help="Conversion cache database (default: %(default)s)")
+    prune.set_defaults(func=cmd_cache_prune)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -4,58 +4,22 @@ from PIL import Image, ImageTk
 import os
 import sys
 from pathlib import Path
-import subprocess
 import threading
+import multiprocessing
 from datetime import datetime
 import webbrowser
-import tempfile
 
-# Add FFmpeg to system path dynamically
-ffmpeg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ffmpeg', 'bin')
-if os.path.exists(ffmpeg_path):
-    os.environ['PATH'] = ffmpeg_path + os.pathsep + os.environ['PATH']
-
-# Check dependencies
-def check_dependency(module_name, package_name=None):
-    try:
-        __import__(module_name)
-        return True
-    except ImportError:
-        print(f"Warning: {module_name} not installed.")
-        return False
-
-# Check if FFmpeg is available
-def check_ffmpeg():
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, timeout=5)
-        return result.returncode == 0
-    except:
-        return False
-
-# Import modules if available
-FFMPEG_AVAILABLE = check_ffmpeg()
-PDF_SUPPORT = check_dependency('PyPDF2') or check_dependency('pypdf2')
-DOCX_SUPPORT = check_dependency('docx')
-AUDIO_SUPPORT = check_dependency('pydub') and FFMPEG_AVAILABLE
-FITZ_SUPPORT = check_dependency('fitz')
-REPORTLAB_SUPPORT = check_dependency('reportlab')
-PPTX_SUPPORT = check_dependency('pptx')
-COMTYPES_SUPPORT = check_dependency('comtypes')
+from converter_core import (FileConverter, BatchEngine, get_supported_formats, output_name, scan_files,
+                            plan_batch, skip_summary, open_cache, COLLISION_POLICIES, DEFAULT_CACHE_PATH,
+                            PPT_LAYOUTS, PDF_PPT_OPTIONS,
+                            FFMPEG_AVAILABLE, PDF_SUPPORT, DOCX_SUPPORT, AUDIO_SUPPORT,
+                            FITZ_SUPPORT, REPORTLAB_SUPPORT, PPTX_SUPPORT)
 
+# File info previews read these directly
 if FITZ_SUPPORT:
     import fitz
-if REPORTLAB_SUPPORT:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter, A4
 if AUDIO_SUPPORT:
     from pydub import AudioSegment
-if PPTX_SUPPORT:
-    from pptx import Presentation
-    from pptx.util import Inches, Pt
-    from pptx.enum.shapes import MSO_SHAPE
-    from pptx.dml.color import RGBColor
-    from pptx.enum.text import PP_ALIGN
 
 class ModernTooltip:
     def __init__(self, widget, text):
@@ -98,6 +62,8 @@ class UniversalConverter:
             'total_files': 0,
             'successful': 0,
             'failed': 0,
+            'skipped': 0,
+            'cache_hits': 0,
             'start_time': None
         }
         
@@ -118,41 +84,7 @@ class UniversalConverter:
         self.style.configure("Subtitle.TLabel", font=("Arial", 12), foreground="#34495E")
         
     def setup_file_types(self):
-        self.supported_formats = {
-            'Images': {
-                'extensions': ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.webp', '.tiff', '.ico'],
-                'convert_to': ['PNG', 'JPEG', 'BMP', 'GIF', 'WEBP', 'PDF', 'PPTX', 'TIFF'],
-                'category': 'image',
-                'icon': '🖼️'
-            },
-            'PDF': {
-                'extensions': ['.pdf'],
-                'convert_to': ['PNG', 'JPG', 'TXT', 'PPTX'] + (['PDF/A'] if FITZ_SUPPORT else []),
-                'category': 'document',
-                'icon': '📄'
-            },
-            'Documents': {
-                'extensions': ['.docx', '.doc', '.txt', '.rtf'],
-                'convert_to': ['PDF', 'TXT'] + (['DOCX'] if DOCX_SUPPORT else []),
-                'category': 'document',
-                'icon': '📝'
-            },
-            'Presentations': {
-                'extensions': ['.pptx', '.ppt'],
-                'convert_to': ['PDF', 'PNG', 'JPG', 'TXT'] + (['PPTX'] if PPTX_SUPPORT else []),
-                'category': 'presentation',
-                'icon': '📊'
-            },
-            'Audio': {
-                'extensions': ['.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'],
-                'convert_to': ['MP3', 'WAV', 'OGG', 'FLAC'] if AUDIO_SUPPORT else [],
-                'category': 'audio',
-                'icon': '🎵'
-            }
-        }
-        
-        # Remove empty categories
-        self.supported_formats = {k: v for k, v in self.supported_formats.items() if v['convert_to']}
+        self.supported_formats = get_supported_formats()
         
     def setup_ui(self):
         # Main container with modern look
@@ -241,6 +173,34 @@ class UniversalConverter:
         tk.Button(button_frame, text="🗑️ Clear", command=self.clear_selection, 
                  bg="#95a5a6", fg="white", font=("Arial", 9), width=8).pack(side=tk.LEFT, padx=2)
         
+        # Folder scan options
+        scan_frame = tk.Frame(file_frame, bg='#f8f9fa')
+        scan_frame.pack(fill=tk.X, pady=(8, 0))
+        
+        self.recursive = tk.BooleanVar(value=False)
+        tk.Checkbutton(scan_frame, text="Include subfolders", variable=self.recursive,
+                       command=self.refresh_folder_info, font=("Arial", 9),
+                       bg='#f8f9fa').pack(side=tk.LEFT)
+        
+        tk.Label(scan_frame, text="Include:", font=("Arial", 9), 
+                bg='#f8f9fa').pack(side=tk.LEFT, padx=(15, 0))
+        self.include_patterns = tk.StringVar()
+        include_entry = tk.Entry(scan_frame, textvariable=self.include_patterns, width=18,
+                                 font=("Arial", 9), relief=tk.SOLID, bd=1)
+        include_entry.pack(side=tk.LEFT, padx=5)
+        ModernTooltip(include_entry, "Only these files, e.g. *.png; photos/*\n(separate patterns with ;)")
+        
+        tk.Label(scan_frame, text="Exclude:", font=("Arial", 9), 
+                bg='#f8f9fa').pack(side=tk.LEFT, padx=(10, 0))
+        self.exclude_patterns = tk.StringVar()
+        exclude_entry = tk.Entry(scan_frame, textvariable=self.exclude_patterns, width=18,
+                                 font=("Arial", 9), relief=tk.SOLID, bd=1)
+        exclude_entry.pack(side=tk.LEFT, padx=5)
+        ModernTooltip(exclude_entry, "Skip these files / folders, e.g. *_converted.*; backup\n(separate patterns with ;)")
+        for entry in (include_entry, exclude_entry):
+            entry.bind("<Return>", lambda e: self.refresh_folder_info())
+            entry.bind("<FocusOut>", lambda e: self.refresh_folder_info())
+        
         # Conversion settings frame
         settings_frame = tk.LabelFrame(main_container, text=" Conversion Settings ", 
                                       font=("Arial", 11, "bold"), bg='#f8f9fa', fg="#2C3E50", 
@@ -278,8 +238,7 @@ class UniversalConverter:
         self.ppt_layout_label.pack(side=tk.LEFT)
         self.ppt_layout = tk.StringVar(value="Single Image")
         self.ppt_layout_combo = ttk.Combobox(advanced_frame, textvariable=self.ppt_layout, 
-                                           values=["Single Image", "Multiple Images - One per Slide", 
-                                                  "Grid Layout (2x2)", "Grid Layout (3x3)"],
+                                           values=PPT_LAYOUTS,
                                            state="readonly", width=25)
         self.ppt_layout_combo.pack(side=tk.LEFT, padx=5)
         
@@ -288,8 +247,7 @@ class UniversalConverter:
                                             bg='#f8f9fa')
         self.pdf_ppt_options = tk.StringVar(value="One slide per page")
         self.pdf_ppt_options_combo = ttk.Combobox(advanced_frame, textvariable=self.pdf_ppt_options,
-                                                values=["One slide per page", "Extract text content", 
-                                                       "High quality images", "Fast conversion"],
+                                                values=PDF_PPT_OPTIONS,
                                                 state="readonly", width=25)
         
         # Output options
@@ -301,6 +259,39 @@ class UniversalConverter:
                                   state="readonly", width=12)
         output_combo.pack(side=tk.LEFT, padx=5)
         
+        # Worker processes for batch conversion
+        tk.Label(advanced_frame, text="Workers:", font=("Arial", 10), 
+                bg='#f8f9fa').pack(side=tk.LEFT, padx=(20, 0))
+        self.workers = tk.IntVar(value=os.cpu_count() or 1)
+        workers_spin = ttk.Spinbox(advanced_frame, from_=1, to=max(1, os.cpu_count() or 1),
+                                   textvariable=self.workers, width=4, state="readonly")
+        workers_spin.pack(side=tk.LEFT, padx=5)
+        ModernTooltip(workers_spin, "Files converted in parallel during batch conversion")
+        
+        # Batch output handling
+        batch_options_frame = tk.Frame(settings_frame, bg='#f8f9fa')
+        batch_options_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(batch_options_frame, text="If output exists:", font=("Arial", 10), 
+                bg='#f8f9fa').pack(side=tk.LEFT)
+        self.collision_policy = tk.StringVar(value=COLLISION_POLICIES[0])
+        collision_combo = ttk.Combobox(batch_options_frame, textvariable=self.collision_policy,
+                                       values=COLLISION_POLICIES, state="readonly", width=10)
+        collision_combo.pack(side=tk.LEFT, padx=5)
+        ModernTooltip(collision_combo, "overwrite: replace it\nrename: save as 'name (1)'\nskip: leave the file out")
+        
+        self.skip_up_to_date = tk.BooleanVar(value=True)
+        skip_check = tk.Checkbutton(batch_options_frame, text="Skip files already converted (output newer than input)",
+                                    variable=self.skip_up_to_date, font=("Arial", 10), bg='#f8f9fa')
+        skip_check.pack(side=tk.LEFT, padx=(20, 0))
+        
+        self.use_cache = tk.BooleanVar(value=True)
+        cache_check = tk.Checkbutton(batch_options_frame, text="Reuse cached conversions",
+                                     variable=self.use_cache, font=("Arial", 10), bg='#f8f9fa')
+        cache_check.pack(side=tk.LEFT, padx=(20, 0))
+        ModernTooltip(cache_check, "Files converted before with the same settings are copied\n"
+                                   f"from the previous result instead (cache: {DEFAULT_CACHE_PATH})")
+        
         # Initially hide options
         self.toggle_ppt_options(False)
         self.toggle_pdf_ppt_options(False)
@@ -338,6 +329,16 @@ class UniversalConverter:
         self.progress = ttk.Progressbar(progress_frame, mode='determinate')
         self.progress.pack(fill=tk.X, side=tk.LEFT, expand=True)
         
+        # Batch controls (enabled while a batch is running)
+        self.cancel_btn = tk.Button(progress_frame, text="⏹ Cancel", command=self.cancel_batch,
+                                    bg="#E74C3C", fg="white", font=("Arial", 9), width=9, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.RIGHT, padx=2)
+        self.pause_btn = tk.Button(progress_frame, text="⏸ Pause", command=self.toggle_pause_batch,
+                                   bg="#607D8B", fg="white", font=("Arial", 9), width=9, state=tk.DISABLED)
+        self.pause_btn.pack(side=tk.RIGHT, padx=2)
+        self.batch_engine = None
+        self.batch_running = False      # from batch_convert() until the controls are reset
+        
         self.progress_label = tk.Label(progress_frame, text="0%", font=("Arial", 9), 
                                       bg='#f8f9fa', fg="#2C3E50")
         self.progress_label.pack(side=tk.RIGHT, padx=5)
@@ -617,22 +618,79 @@ class UniversalConverter:
         except Exception as e:
             self.status.config(text=f"Error reading file info: {str(e)}")
     
+    def scan_options(self):
+        """Current scan options as scan_files keyword arguments"""
+        def patterns(var):
+            return [p.strip() for p in var.get().split(';') if p.strip()]
+        
+        return {
+            'recursive': self.recursive.get(),
+            'include': patterns(self.include_patterns),
+            'exclude': patterns(self.exclude_patterns),
+        }
+    
+    def scan_folder(self, folder, sort=True):
+        """
+        Supported files in folder as (path, category), honouring the scan options.
+        Sorted by default: batch numbering and PDF page order depend on it.
+        """
+        return scan_files(folder, self.supported_formats, sort=sort, **self.scan_options())
+    
+    def refresh_folder_info(self):
+        """Rescan after a scan option changed (skipped if nothing did, e.g. a plain focus change)"""
+        folder = self.file_path.get()
+        if folder and os.path.isdir(folder):
+            last = getattr(self, '_folder_scan_request', None)
+            if last is None or last[:2] != (folder, repr(self.scan_options())):
+                self.update_folder_info(folder)
+    
+    # Folder info is counted on a worker thread; partial counts are shown every
+    # FOLDER_INFO_STEP files so large folders and network shares stay responsive
+    FOLDER_INFO_STEP = 2000
+    
     def update_folder_info(self, folder):
+        # (folder, options, serial): the serial tells repeated scans of the same folder apart
+        last = getattr(self, '_folder_scan_request', None)
+        request = (folder, repr(self.scan_options()), last[2] + 1 if last else 0)
+        self._folder_scan_request = request
+        
+        self.status.config(text=f"Scanning folder: {os.path.basename(folder)}...")
+        scan = self.scan_folder(folder, sort=False)     # only counted
+        thread = threading.Thread(target=self._folder_info_thread, args=(folder, scan, request), daemon=True)
+        thread.start()
+    
+    def _folder_info_thread(self, folder, scan, request):
         try:
-            files = []
+            total_files = 0
+            first_files = []
             file_count_by_type = {}
             
-            for category, info in self.supported_formats.items():
-                for ext in info['extensions']:
-                    found_files = list(Path(folder).glob(f"*{ext}")) + list(Path(folder).glob(f"*{ext.upper()}"))
-                    files.extend(found_files)
-                    if found_files:
-                        file_count_by_type[category] = file_count_by_type.get(category, 0) + len(found_files)
-            
-            unique_files = list(set(files))
-            
+            for file_path, category in scan:
+                if request != self._folder_scan_request:
+                    return      # superseded by a newer scan
+                total_files += 1
+                file_count_by_type[category] = file_count_by_type.get(category, 0) + 1
+                if len(first_files) < 6:
+                    first_files.append(file_path)
+                if total_files % self.FOLDER_INFO_STEP == 0:
+                    self.root.after(0, self._show_folder_info, folder, request, total_files,
+                                    dict(file_count_by_type), list(first_files), False)
+            
+            self.root.after(0, self._show_folder_info, folder, request, total_files,
+                            file_count_by_type, first_files, True)
+        except Exception as e:
+            error_msg = str(e)
+            self.root.after(0, lambda: self.status.config(text=f"Error reading folder info: {error_msg}"))
+    
+    def _show_folder_info(self, folder, request, total_files, file_count_by_type, first_files, finished):
+        if request != self._folder_scan_request:
+            return
+        try:
             info = f"📁 Folder: {os.path.basename(folder)}\n"
-            info += f"📊 Total supported files: {len(unique_files)}\n"
+            if finished:
+                info += f"📊 Total supported files: {total_files}\n"
+            else:
+                info += f"📊 Supported files so far: {total_files} (scanning...)\n"
             info += f"📍 Location: {folder}\n\n"
             info += "📋 File types found:\n"
             
@@ -641,17 +699,18 @@ class UniversalConverter:
                 info += f"  {icon} {file_type}: {count} files\n"
             
             info += f"\n🎯 First few files:\n"
-            for i, file_path in enumerate(unique_files[:6]):
-                info += f"  • {file_path.name}\n"
+            for file_path in first_files:
+                info += f"  • {os.path.relpath(file_path, folder)}\n"
             
-            if len(unique_files) > 6:
-                info += f"  ... and {len(unique_files) - 6} more files"
+            if total_files > 6:
+                info += f"  ... and {total_files - 6} more files"
             
             self.info_text.config(state=tk.NORMAL)
             self.info_text.delete(1.0, tk.END)
             self.info_text.insert(tk.END, info)
             self.info_text.config(state=tk.DISABLED)
-            self.status.config(text=f"Selected folder: {os.path.basename(folder)}")
+            if finished:
+                self.status.config(text=f"Selected folder: {os.path.basename(folder)}")
             
         except Exception as e:
             self.status.config(text=f"Error reading folder info: {str(e)}")
@@ -672,6 +731,8 @@ class UniversalConverter:
         stats_info += f"📊 Total files processed: {self.conversion_stats['total_files']}\n"
         stats_info += f"✅ Successful conversions: {self.conversion_stats['successful']}\n"
         stats_info += f"❌ Failed conversions: {self.conversion_stats['failed']}\n"
+        stats_info += f"⏭️ Skipped (up to date): {self.conversion_stats['skipped']}\n"
+        stats_info += f"♻️ Reused from cache: {self.conversion_stats['cache_hits']}\n"
         
         if self.conversion_stats['total_files'] > 0:
             success_rate = (self.conversion_stats['successful'] / self.conversion_stats['total_files']) * 100
@@ -685,675 +746,35 @@ class UniversalConverter:
         self.stats_text.insert(tk.END, stats_info)
         self.stats_text.config(state=tk.DISABLED)
     
-    def get_output_path(self, input_path, target_format):
-        """Determine output path based on user selection"""
-        input_path = Path(input_path)
-        base_name = f"{input_path.stem}_converted.{target_format.lower()}"
-        
-        if self.output_option.get() == "Same folder":
-            return str(input_path.parent / base_name)
-        elif self.output_option.get() == "Desktop":
-            desktop = Path.home() / "Desktop"
-            return str(desktop / base_name)
-        else:  # Custom folder
+    def choose_output_root(self):
+        """
+        Destination folder for the "Output" option, or None for next to the input.
+        Asks for the custom folder once per run; must be called on the Tk thread.
+        """
+        if self.output_option.get() == "Desktop":
+            return str(Path.home() / "Desktop")
+        elif self.output_option.get() == "Custom folder":
             folder = filedialog.askdirectory(title="Select output folder")
-            if folder:
-                return str(Path(folder) / base_name)
-            else:
-                return str(input_path.parent / base_name)
-    
-    def convert_image(self, input_path, output_path, target_format):
-        """Convert image files to various formats"""
-        try:
-            if target_format.upper() == 'PPTX':
-                return self.image_to_pptx(input_path, output_path)
-            elif target_format.upper() == 'PDF/A':
-                # Convert to standard PDF first
-                with Image.open(input_path) as img:
-                    if img.mode in ('RGBA', 'P'):
-                        img = img.convert('RGB')
-                    img.save(output_path.replace('.pdfa', '.pdf'), 'PDF', resolution=100.0)
-                return True, "Converted to PDF (PDF/A requires specialized library)"
-            else:
-                with Image.open(input_path) as img:
-                    if target_format.lower() in ['jpeg', 'jpg']:
-                        if img.mode in ('RGBA', 'P'):
-                            img = img.convert('RGB')
-                        img.save(output_path, quality=self.quality.get())
-                    elif target_format.upper() == 'PDF':
-                        if img.mode in ('RGBA', 'P'):
-                            img = img.convert('RGB')
-                        img.save(output_path, 'PDF', resolution=100.0)
-                    else:
-                        img.save(output_path)
-                return True, "Success"
-        except Exception as e:
-            return False, str(e)
-    
-    def convert_pdf(self, input_path, output_path, target_format):
-        """Convert PDF files"""
-        try:
-            if not FITZ_SUPPORT:
-                return False, "PDF conversion requires PyMuPDF (fitz)"
-            
-            if target_format.upper() in ['PNG', 'JPG']:
-                return self.convert_pdf_to_image(input_path, output_path, target_format)
-            elif target_format.upper() == 'TXT':
-                return self.convert_pdf_to_text(input_path, output_path)
-            elif target_format.upper() == 'PPTX':
-                return self.pdf_to_pptx_advanced(input_path, output_path)
-            elif target_format.upper() == 'PDF/A':
-                # Simple PDF to PDF/A conversion (basic implementation)
-                doc = fitz.open(input_path)
-                doc.save(output_path, garbage=4, deflate=True, clean=True)
-                doc.close()
-                return True, "Converted to optimized PDF"
-            else:
-                return False, f"Unsupported PDF conversion: {target_format}"
-                
-        except Exception as e:
-            return False, str(e)
-    
-    def convert_pdf_to_text(self, input_path, output_path):
-        """Convert PDF to text"""
-        try:
-            doc = fitz.open(input_path)
-            text = ""
-            for page in doc:
-                text += page.get_text() + "\n"
-            doc.close()
-            
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(text)
-            return True, "Success"
-        except Exception as e:
-            return False, str(e)
-    
-    def convert_pdf_to_image(self, input_path, output_path, target_format):
-        """Convert PDF to images"""
-        try:
-            doc = fitz.open(input_path)
-            output_files = []
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                pix = page.get_pixmap()
-                
-                if len(doc) == 1:
-                    # Single page - use original output path
-                    page_output = output_path
-                else:
-                    # Multiple pages - add page number
-                    name, ext = os.path.splitext(output_path)
-                    page_output = f"{name}_page_{page_num+1}{ext}"
-                
-                if target_format.upper() == 'JPG':
-                    pix.save(page_output)
-                else:
-                    pix.save(page_output)
-                
-                output_files.append(page_output)
-            
-            doc.close()
-            return True, f"Created {len(output_files)} pages"
-        except Exception as e:
-            return False, str(e)
-    
-    def pdf_to_pptx_advanced(self, input_path, output_path):
-        """Advanced PDF to PowerPoint conversion with multiple strategies"""
-        try:
-            if not PPTX_SUPPORT:
-                return False, "PPTX conversion requires python-pptx"
-            if not FITZ_SUPPORT:
-                return False, "PDF to PPTX requires PyMuPDF (fitz)"
-            
-            doc = fitz.open(input_path)
-            total_pages = len(doc)
-            
-            # Create a new presentation
-            prs = Presentation()
-            blank_slide_layout = prs.slide_layouts[6]  # Blank layout
-            
-            conversion_mode = self.pdf_ppt_options.get()
-            temp_files = []
-            
-            try:
-                for page_num in range(total_pages):
-                    page = doc.load_page(page_num)
-                    
-                    if conversion_mode == "Extract text content":
-                        # Strategy 1: Extract text and create text-based slides
-                        success = self._create_text_slide(prs, page, page_num, blank_slide_layout)
-                        if not success:
-                            # Fallback to image-based conversion
-                            success = self._create_image_slide(prs, page, page_num, blank_slide_layout, temp_files)
-                    
-                    elif conversion_mode == "High quality images":
-                        # Strategy 2: High-quality image conversion
-                        success = self._create_high_quality_image_slide(prs, page, page_num, blank_slide_layout, temp_files)
-                    
-                    else:
-                        # Strategy 3: Standard image conversion (default)
-                        success = self._create_image_slide(prs, page, page_num, blank_slide_layout, temp_files)
-                    
-                    if not success:
-                        self.log_message(f"Warning: Failed to convert page {page_num + 1}")
-                
-                # Save the presentation
-                prs.save(output_path)
-                result_message = f"Converted {total_pages} PDF pages to PowerPoint"
-                
-                if conversion_mode == "Extract text content":
-                    result_message += " (text-based)"
-                elif conversion_mode == "High quality images":
-                    result_message += " (high-quality images)"
-                else:
-                    result_message += " (standard images)"
-                
-                return True, result_message
-                
-            finally:
-                # Clean up temporary files
-                for temp_file in temp_files:
-                    try:
-                        if os.path.exists(temp_file):
-                            os.remove(temp_file)
-                    except:
-                        pass
-                doc.close()
-                
-        except Exception as e:
-            return False, f"PDF to PPTX conversion error: {str(e)}"
-    
-    def _create_text_slide(self, prs, page, page_num, blank_slide_layout):
-        """Create a slide from extracted PDF text"""
-        try:
-            text = page.get_text()
-            if not text.strip():
-                return False  # No text found, fallback to image
-            
-            slide = prs.slides.add_slide(blank_slide_layout)
-            
-            # Add title
-            title_shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(1))
-            title_frame = title_shape.text_frame
-            title_frame.text = f"Page {page_num + 1}"
-            title_frame.paragraphs[0].font.size = Pt(24)
-            title_frame.paragraphs[0].font.bold = True
-            
-            # Add content
-            content_shape = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5))
-            content_frame = content_shape.text_frame
-            content_frame.text = text[:2000]  # Limit text length
-            content_frame.paragraphs[0].font.size = Pt(12)
-            
-            return True
-        except:
-            return False
-    
-    def _create_image_slide(self, prs, page, page_num, blank_slide_layout, temp_files):
-        """Create a slide from PDF page image (standard quality)"""
-        try:
-            # Render page as image
-            mat = fitz.Matrix(1.5, 1.5)  # Standard resolution
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
-            
-            # Save temporary image
-            temp_img_path = f"temp_pdf_page_{page_num}.png"
-            with open(temp_img_path, "wb") as f:
-                f.write(img_data)
-            temp_files.append(temp_img_path)
-            
-            # Create slide and add image
-            slide = prs.slides.add_slide(blank_slide_layout)
-            
-            # Calculate image dimensions to fit slide
-            slide_width = Inches(10)
-            slide_height = Inches(7.5)
-            img_ratio = pix.width / pix.height
-            
-            if img_ratio > (slide_width / slide_height):
-                width = slide_width
-                height = width / img_ratio
-            else:
-                height = slide_height
-                width = height * img_ratio
-            
-            left = (slide_width - width) / 2
-            top = (slide_height - height) / 2
-            
-            slide.shapes.add_picture(temp_img_path, left, top, width, height)
-            
-            return True
-        except:
-            return False
-    
-    def _create_high_quality_image_slide(self, prs, page, page_num, blank_slide_layout, temp_files):
-        """Create a slide from PDF page image (high quality)"""
-        try:
-            # Render page as high-quality image
-            mat = fitz.Matrix(2.0, 2.0)  # Higher resolution
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
-            
-            # Save temporary image
-            temp_img_path = f"temp_pdf_page_hq_{page_num}.png"
-            with open(temp_img_path, "wb") as f:
-                f.write(img_data)
-            temp_files.append(temp_img_path)
-            
-            # Create slide and add image
-            slide = prs.slides.add_slide(blank_slide_layout)
-            
-            # Calculate image dimensions to fit slide
-            slide_width = Inches(10)
-            slide_height = Inches(7.5)
-            img_ratio = pix.width / pix.height
-            
-            if img_ratio > (slide_width / slide_height):
-                width = slide_width
-                height = width / img_ratio
-            else:
-                height = slide_height
-                width = height * img_ratio
-            
-            left = (slide_width - width) / 2
-            top = (slide_height - height) / 2
-            
-            slide.shapes.add_picture(temp_img_path, left, top, width, height)
-            
-            return True
-        except:
-            return False
-    
-    def image_to_pptx(self, input_path, output_path):
-        """Convert image to PowerPoint presentation"""
-        try:
-            if not PPTX_SUPPORT:
-                return False, "PPTX conversion requires python-pptx"
-            
-            from pptx import Presentation
-            from pptx.util import Inches
-            
-            prs = Presentation()
-            blank_slide_layout = prs.slide_layouts[6]
-            
-            slide = prs.slides.add_slide(blank_slide_layout)
-            
-            with Image.open(input_path) as img:
-                img_width, img_height = img.size
-                img_ratio = img_width / img_height
-            
-            slide_width = Inches(10)
-            slide_height = Inches(7.5)
-            
-            if img_ratio > (slide_width / slide_height):
-                width = slide_width
-                height = width / img_ratio
-            else:
-                height = slide_height
-                width = height * img_ratio
-            
-            left = (slide_width - width) / 2
-            top = (slide_height - height) / 2
-            
-            slide.shapes.add_picture(input_path, left, top, width, height)
-            
-            prs.save(output_path)
-            return True, "Created PowerPoint with 1 slide"
-            
-        except Exception as e:
-            return False, f"Image to PPTX error: {str(e)}"
-    
-    def images_to_pptx_batch(self, image_paths, output_path):
-        """Convert multiple images to a single PowerPoint presentation"""
-        try:
-            if not PPTX_SUPPORT:
-                return False, "PPTX conversion requires python-pptx"
-            
-            from pptx import Presentation
-            from pptx.util import Inches
-            
-            prs = Presentation()
-            blank_slide_layout = prs.slide_layouts[6]
-            
-            layout = self.ppt_layout.get()
-            
-            if layout == "Multiple Images - One per Slide":
-                for img_path in image_paths:
-                    slide = prs.slides.add_slide(blank_slide_layout)
-                    
-                    with Image.open(img_path) as img:
-                        img_width, img_height = img.size
-                        img_ratio = img_width / img_height
-                    
-                    slide_width = Inches(10)
-                    slide_height = Inches(7.5)
-                    
-                    if img_ratio > (slide_width / slide_height):
-                        width = slide_width
-                        height = width / img_ratio
-                    else:
-                        height = slide_height
-                        width = height * img_ratio
-                    
-                    left = (slide_width - width) / 2
-                    top = (slide_height - height) / 2
-                    
-                    slide.shapes.add_picture(str(img_path), left, top, width, height)
-            
-            prs.save(output_path)
-            return True, f"Created PowerPoint with {len(image_paths)} slides"
-            
-        except Exception as e:
-            return False, f"Batch images to PPTX error: {str(e)}"
-    
-    def images_to_pdf_batch(self, image_paths, output_path):
-        """Convert multiple images to a single PDF"""
-        try:
-            images = []
-            for p in image_paths:
-                img = Image.open(p)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                images.append(img)
-            
-            if images:
-                images[0].save(output_path, "PDF", resolution=100.0, save_all=True, append_images=images[1:])
-                return True, f"Created PDF with {len(images)} pages"
-            return False, "No images"
-        except Exception as e:
-            return False, str(e)
-    
-    def convert_presentation(self, input_path, output_path, target_format):
-        """Convert PowerPoint presentations to various formats"""
-        try:
-            if not PPTX_SUPPORT:
-                return False, "PowerPoint conversion requires python-pptx"
-            
-            file_ext = Path(input_path).suffix.lower()
-            
-            if target_format.upper() == 'PDF':
-                return self.ppt_to_pdf(input_path, output_path)
-            elif target_format.upper() in ['PNG', 'JPG']:
-                return self.ppt_to_images(input_path, output_path, target_format)
-            elif target_format.upper() == 'TXT':
-                return self.ppt_to_text(input_path, output_path)
-            elif target_format.upper() == 'PPTX':
-                if file_ext == '.pptx':
-                    prs = Presentation(input_path)
-                    prs.save(output_path)
-                    return True, "Converted presentation format"
-                elif file_ext == '.ppt' and COMTYPES_SUPPORT:
-                    import comtypes.client
-                    powerpoint = comtypes.client.CreateObject('Powerpoint.Application')
-                    powerpoint.Visible = False
-                    abs_input = os.path.abspath(input_path)
-                    abs_output = os.path.abspath(output_path)
-                    pres = powerpoint.Presentations.Open(abs_input)
-                    pres.SaveAs(abs_output, 11)  # 11 = ppSaveAsOpenXMLPresentation
-                    pres.Close()
-                    powerpoint.Quit()
-                    return True, "Converted to PPTX"
-                else:
-                    return False, "Cannot convert to PPTX"
-            else:
-                return False, f"Unsupported presentation conversion: {target_format}"
-                
-        except Exception as e:
-            return False, f"Presentation conversion error: {str(e)}"
-    
-    def ppt_to_pdf(self, input_path, output_path):
-        """Convert PowerPoint to PDF"""
-        try:
-            if COMTYPES_SUPPORT:
-                import comtypes.client
-                powerpoint = comtypes.client.CreateObject('Powerpoint.Application')
-                powerpoint.Visible = False
-                abs_input = os.path.abspath(input_path)
-                abs_output = os.path.abspath(output_path)
-                pres = powerpoint.Presentations.Open(abs_input)
-                pres.SaveAs(abs_output, 32)  # 32 = ppSaveAsPDF
-                pres.Close()
-                powerpoint.Quit()
-                return True, "Success"
-            else:
-                # Fallback to text-based
-                prs = Presentation(input_path)
-                return self._create_pdf_from_ppt_text(prs, output_path)
-                
-        except Exception as e:
-            return False, f"PPT to PDF error: {str(e)}"
-    
-    def _create_pdf_from_ppt_text(self, prs, output_path):
-        """Create a simple PDF from PowerPoint text content"""
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            
-            c = canvas.Canvas(output_path, pagesize=letter)
-            width, height = letter
-            
-            y_position = height - 50
-            c.setFont("Helvetica", 16)
-            c.drawString(50, y_position, f"Presentation: {len(prs.slides)} Slides")
-            y_position -= 30
-            
-            for i, slide in enumerate(prs.slides):
-                if y_position < 100:
-                    c.showPage()
-                    y_position = height - 50
-                    c.setFont("Helvetica", 12)
-                
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(50, y_position, f"Slide {i+1}:")
-                y_position -= 20
-                c.setFont("Helvetica", 10)
-                
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        lines = shape.text.split('\n')
-                        for line in lines:
-                            if line.strip():
-                                if y_position < 50:
-                                    c.showPage()
-                                    y_position = height - 50
-                                    c.setFont("Helvetica", 10)
-                                c.drawString(70, y_position, line.strip())
-                                y_position -= 15
-                
-                y_position -= 10
-            
-            c.save()
-            return True, f"Created PDF with {len(prs.slides)} slides content"
-        except Exception as e:
-            return False, f"PDF creation error: {str(e)}"
-    
-    def ppt_to_images(self, input_path, output_path, target_format):
-        """Convert PowerPoint to images"""
-        try:
-            if not COMTYPES_SUPPORT:
-                return False, "COM not available for PPT rendering"
-            import comtypes.client
-            powerpoint = comtypes.client.CreateObject('Powerpoint.Application')
-            powerpoint.Visible = True  # May need to be visible for export
-            pres = powerpoint.Presentations.Open(os.path.abspath(input_path))
-            base_name, _ = os.path.splitext(output_path)
-            export_folder = base_name + "_slides"
-            os.makedirs(export_folder, exist_ok=True)
-            pres.Export(export_folder, target_format.upper())
-            pres.Close()
-            powerpoint.Quit()
-            return True, f"Exported slides to {export_folder}"
-        except Exception as e:
-            return False, str(e)
-    
-    def ppt_to_text(self, input_path, output_path):
-        """Extract text from PowerPoint presentation"""
-        try:
-            if not PPTX_SUPPORT:
-                return False, "PPT to text requires python-pptx"
-            
-            prs = Presentation(input_path)
-            text_content = []
-            
-            for i, slide in enumerate(prs.slides):
-                text_content.append(f"--- Slide {i+1} ---")
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text_content.append(shape.text)
-                text_content.append("")  # Empty line between slides
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(text_content))
-            
-            return True, f"Extracted text from {len(prs.slides)} slides"
-            
-        except Exception as e:
-            return False, f"PPT to text error: {str(e)}"
-    
-    def convert_document(self, input_path, output_path, target_format):
-        """Convert document files"""
-        file_ext = Path(input_path).suffix.lower()
-        if target_format.upper() == 'TXT':
-            return self.document_to_text(input_path, output_path)
-        elif target_format.upper() == 'PDF':
-            return self.document_to_pdf(input_path, output_path)
-        elif target_format.upper() == 'DOCX':
-            return self.document_to_docx(input_path, output_path)
-        else:
-            return False, "Unsupported"
-    
-    def document_to_text(self, input_path, output_path):
-        """Convert document to text"""
-        try:
-            file_ext = Path(input_path).suffix.lower()
-            if file_ext == '.txt':
-                with open(input_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                return True, "Success"
-            elif file_ext == '.docx' and DOCX_SUPPORT:
-                from docx import Document
-                doc = Document(input_path)
-                text = '\n'.join([para.text for para in doc.paragraphs])
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                return True, "Success"
-            elif COMTYPES_SUPPORT and file_ext in ('.doc', '.rtf', '.docx'):
-                import comtypes.client
-                word = comtypes.client.CreateObject('Word.Application')
-                word.Visible = False
-                doc = word.Documents.Open(os.path.abspath(input_path))
-                doc.SaveAs(os.path.abspath(output_path), FileFormat=0)  # 0 = txt
-                doc.Close()
-                word.Quit()
-                return True, "Success"
-            else:
-                return False, "Cannot extract text"
-        except Exception as e:
-            return False, str(e)
+            return folder or None
+        return None
     
-    def document_to_pdf(self, input_path, output_path):
-        """Convert document to PDF"""
-        try:
-            file_ext = Path(input_path).suffix.lower()
-            if COMTYPES_SUPPORT:
-                import comtypes.client
-                word = comtypes.client.CreateObject('Word.Application')
-                word.Visible = False
-                abs_input = os.path.abspath(input_path)
-                abs_output = os.path.abspath(output_path)
-                doc = word.Documents.Open(abs_input)
-                doc.SaveAs(abs_output, FileFormat=17)  # 17 = wdFormatPDF
-                doc.Close()
-                word.Quit()
-                return True, "Success"
-            elif file_ext == '.txt' and REPORTLAB_SUPPORT:
-                from reportlab.pdfgen import canvas
-                from reportlab.lib.pagesizes import letter
-                c = canvas.Canvas(output_path, pagesize=letter)
-                width, height = letter
-                y = height - 50
-                c.setFont("Helvetica", 12)
-                with open(input_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if y < 50:
-                            c.showPage()
-                            y = height - 50
-                            c.setFont("Helvetica", 12)
-                        c.drawString(50, y, line.strip())
-                        y -= 15
-                c.save()
-                return True, "Success"
-            elif file_ext == '.docx' and DOCX_SUPPORT and REPORTLAB_SUPPORT:
-                from docx import Document
-                from reportlab.pdfgen import canvas
-                from reportlab.lib.pagesizes import letter
-                doc = Document(input_path)
-                text = '\n'.join([para.text for para in doc.paragraphs])
-                c = canvas.Canvas(output_path, pagesize=letter)
-                width, height = letter
-                y = height - 50
-                c.setFont("Helvetica", 12)
-                for line in text.split('\n'):
-                    if y < 50:
-                        c.showPage()
-                        y = height - 50
-                        c.setFont("Helvetica", 12)
-                    c.drawString(50, y, line.strip())
-                    y -= 15
-                c.save()
-                return True, "Success"
-            else:
-                return False, "Cannot convert to PDF"
-        except Exception as e:
-            return False, str(e)
+    def get_output_path(self, input_path, target_format, output_root=None):
+        """Output path of a single conversion (batches are laid out by plan_batch)"""
+        input_path = Path(input_path)
+        base_name = output_name(input_path, target_format)
+        return str(Path(output_root or input_path.parent) / base_name)
     
-    def document_to_docx(self, input_path, output_path):
-        """Convert document to DOCX"""
-        try:
-            if not DOCX_SUPPORT:
-                return False, "python-docx not available"
-            file_ext = Path(input_path).suffix.lower()
-            from docx import Document
-            if file_ext == '.docx':
-                doc = Document(input_path)
-                doc.save(output_path)
-                return True, "Success"
-            elif file_ext == '.txt':
-                doc = Document()
-                with open(input_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        doc.add_paragraph(line.strip())
-                doc.save(output_path)
-                return True, "Success"
-            elif COMTYPES_SUPPORT and file_ext in ('.doc', '.rtf'):
-                import comtypes.client
-                word = comtypes.client.CreateObject('Word.Application')
-                word.Visible = False
-                abs_input = os.path.abspath(input_path)
-                abs_output = os.path.abspath(output_path)
-                doc = word.Documents.Open(abs_input)
-                doc.SaveAs(abs_output, FileFormat=16)  # 16 = wdFormatXMLDocument
-                doc.Close()
-                word.Quit()
-                return True, "Success"
-            else:
-                return False, "Cannot convert to DOCX"
-        except Exception as e:
-            return False, str(e)
+    def conversion_options(self):
+        """Snapshot of the Tk option variables, picklable for worker processes"""
+        return {
+            'quality': self.quality.get(),
+            'pdf_ppt_options': self.pdf_ppt_options.get(),
+            'ppt_layout': self.ppt_layout.get(),
+        }
     
-    def convert_audio(self, input_path, output_path, target_format):
-        """Convert audio files"""
-        try:
-            audio = AudioSegment.from_file(input_path)
-            audio.export(output_path, format=target_format.lower())
-            return True, "Success"
-        except Exception as e:
-            return False, str(e)
+    def converter(self):
+        """FileConverter with the current options, logging to the log panel"""
+        return FileConverter(self.conversion_options(), log=self.log_message)
     
     def convert_file(self):
         # Initialize stats if first conversion
@@ -1369,30 +790,28 @@ class UniversalConverter:
             messagebox.showerror("Error", "File does not exist")
             return
         
+        if self.batch_running:
+            messagebox.showinfo("Batch Running", "A batch conversion is already running.")
+            return
+        
+        output_root = self.choose_output_root()
+        
         # Run conversion in thread to prevent UI freezing
-        thread = threading.Thread(target=self._convert_file_thread, daemon=True)
+        thread = threading.Thread(target=self._convert_file_thread, args=(output_root,), daemon=True)
         thread.start()
     
-    def _convert_file_thread(self):
+    def _convert_file_thread(self, output_root=None):
         """Threaded file conversion to prevent UI freezing"""
         try:
             input_file = self.file_path.get()
             
             if os.path.isdir(input_file):
-                # Collect files
-                all_files = []
-                for category, info in self.supported_formats.items():
-                    for ext in info['extensions']:
-                        all_files.extend(list(Path(input_file).glob(f"*{ext}")))
-                        all_files.extend(list(Path(input_file).glob(f"*{ext.upper()}")))
-                unique_files = list(set(all_files))
-                
                 # Handle folder conversion for images to PPTX or PDF
                 if self.target_format.get().upper() == 'PPTX':
-                    image_files = [f for f in unique_files if f.suffix.lower() in self.supported_formats.get('Images', {}).get('extensions', [])]
+                    image_files = [f for f, category in self.scan_folder(input_file) if category == 'Images']
                     if image_files:
-                        output_file = self.get_output_path(input_file, "pptx")
-                        success, message = self.images_to_pptx_batch(image_files, output_file)
+                        output_file = self.get_output_path(input_file, "pptx", output_root)
+                        success, message = self.converter().images_to_pptx_batch(image_files, output_file)
                         
                         self.conversion_stats['total_files'] += len(image_files)
                         if success:
@@ -1412,10 +831,10 @@ class UniversalConverter:
                         self.update_stats()
                         return
                 elif self.target_format.get().upper() == 'PDF':
-                    image_files = [f for f in unique_files if f.suffix.lower() in self.supported_formats.get('Images', {}).get('extensions', [])]
+                    image_files = [f for f, category in self.scan_folder(input_file) if category == 'Images']
                     if image_files:
-                        output_file = self.get_output_path(input_file, "pdf")
-                        success, message = self.images_to_pdf_batch(image_files, output_file)
+                        output_file = self.get_output_path(input_file, "pdf", output_root)
+                        success, message = self.converter().images_to_pdf_batch(image_files, output_file)
                         
                         self.conversion_stats['total_files'] += len(image_files)
                         if success:
@@ -1434,7 +853,7 @@ class UniversalConverter:
                         self.update_stats()
                         return
                 else:
-                    self.batch_convert()
+                    self._batch_convert_thread(input_file, output_root)
                     return
             
             self.progress.start()
@@ -1443,25 +862,10 @@ class UniversalConverter:
             
             # Create output filename
             target_format = self.target_format.get().lower()
-            output_file = self.get_output_path(input_file, target_format)
-            
-            file_ext = Path(input_file).suffix.lower()
-            success = False
-            message = ""
+            output_file = self.get_output_path(input_file, target_format, output_root)
             
             # Route to appropriate converter
-            if file_ext in self.supported_formats.get('Images', {}).get('extensions', []):
-                success, message = self.convert_image(input_file, output_file, target_format)
-            elif file_ext in self.supported_formats.get('PDF', {}).get('extensions', []):
-                success, message = self.convert_pdf(input_file, output_file, target_format)
-            elif file_ext in self.supported_formats.get('Documents', {}).get('extensions', []):
-                success, message = self.convert_document(input_file, output_file, target_format)
-            elif file_ext in self.supported_formats.get('Presentations', {}).get('extensions', []):
-                success, message = self.convert_presentation(input_file, output_file, target_format)
-            elif file_ext in self.supported_formats.get('Audio', {}).get('extensions', []):
-                success, message = self.convert_audio(input_file, output_file, target_format)
-            else:
-                message = f"Unsupported file type: {file_ext}"
+            success, message = self.converter().convert_path(input_file, output_file, target_format)
             
             self.conversion_stats['total_files'] += 1
             if success:
@@ -1491,97 +895,174 @@ class UniversalConverter:
             self.progress_label.config(text="0%")
     
     def batch_convert(self):
+        if self.batch_running:
+            messagebox.showinfo("Batch Running", "A batch conversion is already running.")
+            return
+        
         folder = self.file_path.get()
         if not folder or not os.path.isdir(folder):
             folder = filedialog.askdirectory(title="Select folder with files")
             if not folder:
                 return
         
+        output_root = self.choose_output_root()
+        
+        # Tk variables are only read here, on the Tk thread; the worker gets plain values
+        settings = {
+            'scan': self.scan_options(),
+            'target_format': self.target_format.get().lower(),
+            'collision': self.collision_policy.get(),
+            'skip_up_to_date': self.skip_up_to_date.get(),
+            'options': self.conversion_options(),
+            'workers': self.workers.get(),
+            'use_cache': self.use_cache.get(),
+        }
+        
         # Run batch conversion in thread
-        thread = threading.Thread(target=self._batch_convert_thread, args=(folder,), daemon=True)
+        self.batch_running = True
+        thread = threading.Thread(target=self._batch_convert_thread, args=(folder, output_root, settings),
+                                  daemon=True)
         thread.start()
     
-    def _batch_convert_thread(self, folder):
-        """Threaded batch conversion"""
+    def _batch_convert_thread(self, folder, output_root, settings):
+        """Threaded batch conversion: plans every output, then fans the files out to a BatchEngine process pool"""
         try:
-            # Collect all supported files
-            all_files = []
-            for category, info in self.supported_formats.items():
-                for ext in info['extensions']:
-                    all_files.extend(list(Path(folder).glob(f"*{ext}")))
-                    all_files.extend(list(Path(folder).glob(f"*{ext.upper()}")))
-            
-            unique_files = list(set(all_files))
+            # Collect all supported files, in name order so output numbering is stable
+            unique_files = [f for f, _ in scan_files(folder, self.supported_formats, sort=True, **settings['scan'])]
             
             if not unique_files:
                 self.root.after(0, lambda: messagebox.showinfo("No Files", "No supported files found in the selected folder."))
                 return
             
-            target_format = self.target_format.get().lower()
-            converted_count = 0
-            total_files = len(unique_files)
-            
-            self.progress.config(maximum=total_files, value=0)
-            self.status.config(text=f"Converting {total_files} files...")
-            self.log_message(f"Starting batch conversion of {total_files} files to {target_format}")
+            target_format = settings['target_format']
+            options = settings['options']
+            cache = open_cache(DEFAULT_CACHE_PATH)
+            try:
+                plan = plan_batch([(f, folder) for f in unique_files], target_format,
+                                  dest_root=output_root,
+                                  collision=settings['collision'],
+                                  skip_up_to_date=settings['skip_up_to_date'],
+                                  options=options, cache=cache)
+            finally:
+                if cache is not None:
+                    cache.close()
+            jobs = plan.jobs
+            total_files = len(jobs)
+            
+            if plan.skipped:
+                self.root.after(0, self._on_batch_skipped, plan.skipped)
+            if not jobs:
+                self.root.after(0, lambda: messagebox.showinfo("Nothing to Convert", 
+                                f"All {len(plan.skipped)} files were skipped:\n{skip_summary(plan.skipped)}"))
+                return
             
-            for i, file_path in enumerate(unique_files):
-                try:
-                    input_path = str(file_path)
-                    output_path = self.get_output_path(input_path, target_format)
-                    
-                    file_ext = file_path.suffix.lower()
-                    success = False
-                    message = ""
-                    
-                    if file_ext in self.supported_formats.get('Images', {}).get('extensions', []):
-                        success, message = self.convert_image(input_path, output_path, target_format)
-                    elif file_ext in self.supported_formats.get('PDF', {}).get('extensions', []):
-                        success, message = self.convert_pdf(input_path, output_path, target_format)
-                    elif file_ext in self.supported_formats.get('Documents', {}).get('extensions', []):
-                        success, message = self.convert_document(input_path, output_path, target_format)
-                    elif file_ext in self.supported_formats.get('Presentations', {}).get('extensions', []):
-                        success, message = self.convert_presentation(input_path, output_path, target_format)
-                    elif file_ext in self.supported_formats.get('Audio', {}).get('extensions', []):
-                        success, message = self.convert_audio(input_path, output_path, target_format)
-                    
-                    if success:
-                        converted_count += 1
-                        self.log_message(f"✓ {file_path.name}")
-                    else:
-                        self.log_message(f"✗ {file_path.name}: {message}")
-                    
-                    progress_value = i + 1
-                    progress_percent = int((progress_value / total_files) * 100)
-                    self.progress['value'] = progress_value
-                    self.progress_label.config(text=f"{progress_percent}%")
-                    self.status.config(text=f"Progress: {i+1}/{total_files}")
-                    
-                except Exception as e:
-                    self.log_message(f"✗ Error with {file_path.name}: {str(e)}")
+            engine = BatchEngine(
+                jobs, target_format, options,
+                workers=settings['workers'],
+                on_result=lambda *result: self.root.after(0, self._on_batch_result, *result),
+                cache_path=DEFAULT_CACHE_PATH if cache is not None else None,
+                reuse_cache=settings['use_cache']
+            )
+            self.batch_engine = engine
+            self.root.after(0, self._on_batch_started, total_files, target_format, engine.workers)
             
-            self.conversion_stats['total_files'] += total_files
-            self.conversion_stats['successful'] += converted_count
-            self.conversion_stats['failed'] += (total_files - converted_count)
+            converted_count = engine.run()
+            processed = engine.done
             
-            self.root.after(0, lambda: messagebox.showinfo("Batch Complete", 
-                              f"Batch conversion completed!\n\n"
-                              f"Total files processed: {total_files}\n"
-                              f"Successfully converted: {converted_count}\n"
-                              f"Failed: {total_files - converted_count}"))
-            self.status.config(text=f"Batch completed: {converted_count}/{total_files} files")
-            self.update_stats()
+            self.root.after(0, self._on_batch_finished, total_files, processed, converted_count,
+                            engine.cache_hits, engine.cancelled)
             
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Batch conversion failed:\n{str(e)}"))
-            self.status.config(text="Batch conversion failed")
+            error_msg = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Error", f"Batch conversion failed:\n{error_msg}"))
+            self.root.after(0, lambda: self.status.config(text="Batch conversion failed"))
         finally:
-            self.progress['value'] = 0
-            self.progress_label.config(text="0%")
+            self.batch_engine = None
+            self.root.after(0, self._reset_batch_controls)
+    
+    # Batch callbacks: scheduled with root.after, so they run on the Tk thread
+    def _on_batch_skipped(self, skipped):
+        up_to_date = sum(1 for _, _, reason in skipped if reason == "up to date")
+        self.conversion_stats['skipped'] += up_to_date
+        self.update_stats()
+        self.log_message(f"Skipping {len(skipped)} files ({skip_summary(skipped)})")
+        for input_path, output_path, reason in skipped[:20]:
+            self.log_message(f"⏭ {os.path.basename(input_path)}: {reason}")
+        if len(skipped) > 20:
+            self.log_message(f"  ... and {len(skipped) - 20} more")
+    
+    def _on_batch_started(self, total_files, target_format, workers):
+        self.progress.config(maximum=total_files, value=0)
+        self.progress_label.config(text="0%")
+        self.status.config(text=f"Converting {total_files} files...")
+        self.pause_btn.config(state=tk.NORMAL, text="⏸ Pause")
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.log_message(f"Starting batch conversion of {total_files} files to {target_format} ({workers} workers)")
+    
+    def _on_batch_result(self, input_path, output_path, success, message, cached, worker_log, done, total):
+        for line in worker_log:
+            self.log_message(f"  {os.path.basename(input_path)}: {line}")
+        if cached:
+            self.log_message(f"✓ {os.path.basename(input_path)} (cached)")
+        elif success:
+            self.log_message(f"✓ {os.path.basename(input_path)}")
+        else:
+            self.log_message(f"✗ {os.path.basename(input_path)}: {message}")
+        
+        self.progress['value'] = done
+        self.progress_label.config(text=f"{int(done / total * 100)}%")
+        self.status.config(text=f"Progress: {done}/{total}")
+    
+    def _on_batch_finished(self, total_files, processed, converted_count, cache_hits, cancelled):
+        self.conversion_stats['total_files'] += processed
+        self.conversion_stats['successful'] += converted_count
+        self.conversion_stats['failed'] += (processed - converted_count)
+        self.conversion_stats['cache_hits'] += cache_hits
+        self.update_stats()
+        
+        title = "Batch Cancelled" if cancelled else "Batch Complete"
+        summary = "Batch conversion cancelled!" if cancelled else "Batch conversion completed!"
+        messagebox.showinfo(title, 
+                            f"{summary}\n\n"
+                            f"Total files processed: {processed} of {total_files}\n"
+                            f"Successfully converted: {converted_count}\n"
+                            f"Reused from cache: {cache_hits}\n"
+                            f"Failed: {processed - converted_count}")
+        self.status.config(text=f"{title}: {converted_count}/{total_files} files")
+    
+    def _reset_batch_controls(self):
+        self.batch_running = False
+        self.pause_btn.config(state=tk.DISABLED, text="⏸ Pause")
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.progress['value'] = 0
+        self.progress_label.config(text="0%")
+    
+    def toggle_pause_batch(self):
+        engine = self.batch_engine
+        if engine is None:
+            return
+        if engine.paused:
+            engine.resume()
+            self.pause_btn.config(text="⏸ Pause")
+            self.log_message("Batch resumed")
+        else:
+            engine.pause()
+            self.pause_btn.config(text="▶ Resume")
+            self.log_message("Batch paused (files already started will finish)")
+    
+    def cancel_batch(self):
+        engine = self.batch_engine
+        if engine is None:
+            return
+        engine.cancel()
+        self.pause_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.log_message("Cancelling batch (files already started will finish)...")
     
     def run(self):
         self.root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = UniversalConverter()
     app.run()